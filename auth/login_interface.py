@@ -4,6 +4,7 @@ LoginInterface - 사용자별 로그인 정보 관리
 """
 from datetime import datetime
 from typing import Optional
+from auth.password_hashing import PASSWORD_VERIFIER, PasswordVerifierBusy, is_hashed
 from storage.storage_manager import StorageManager
 
 
@@ -152,8 +153,16 @@ class LoginInterface:
     def save(self) -> bool:
         """
         현재 사용자 정보를 데이터베이스에 저장 (INSERT or UPDATE)
+        비밀번호가 아직 평문이면 해시로 바꿔 저장한다.
         :return: 성공 여부
         """
+        if self.password and not is_hashed(self.password):
+            try:
+                self.password = PASSWORD_VERIFIER.hash(self.password)
+            except PasswordVerifierBusy:
+                print(f"[LoginInterface] Password hashing busy; user '{self.user_id}' not saved.")
+                return False
+
         # 기존 사용자 확인 (복합 PRIMARY KEY 고려)
         check_sql = "SELECT user_id FROM users WHERE user_id = ? AND interface_type = ?"
         result = self.storage.execute_query(check_sql, (self.user_id, self.user_interface))
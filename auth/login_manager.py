@@ -2,10 +2,25 @@
 LoginManager - 로그인 프로세스 관리
 사용자 인증, 로그아웃, 비밀번호 변경 등의 로직을 담당
 """
+import sqlite3
 from typing import Optional
 from auth.login_interface import LoginInterface
+from auth.password_hashing import PASSWORD_VERIFIER, PasswordVerifierBusy, needs_rehash
 from storage.storage_manager import StorageManager
 
+# 해시 검증 풀이 가득 찼을 때의 응답 (실패 횟수에 포함하지 않음)
+BUSY_RESULT = {
+    'success': False,
+    'message': 'Authentication service is busy. Please try again.',
+    'busy': True
+}
+
+# 실패 기록 중 DB 오류가 났을 때의 응답 (사용자 존재 여부를 드러내지 않음)
+LOGIN_FAILED_RESULT = {
+    'success': False,
+    'message': 'Login failed. Please try again.'
+}
+
 
 class LoginManager:
     """
@@ -13,6 +28,8 @@ class LoginManager:
     LoginInterface를 사용하여 실제 인증 로직 수행
     """
 
+    MAX_WEB_ATTEMPTS = 5
+
     def __init__(self):
         self.storage = StorageManager()
         self.current_user: Optional[LoginInterface] = None
@@ -84,8 +101,15 @@ class LoginManager:
                 }
 
         # 자격 증명 검증
-        if self.validate_credentials(login_interface, password):
-            # 로그인 성공
+        try:
+            matched = PASSWORD_VERIFIER.verify(password, login_interface.get_password())
+        except PasswordVerifierBusy:
+            return dict(BUSY_RESULT)
+
+        if matched:
+            # 로그인 성공 - 평문이거나 비용이 낮은 해시는 이번에 다시 해시해 저장
+            if needs_rehash(login_interface.get_password()):
+                login_interface.password = password
             login_interface.reset_tries()
             login_interface.save()
 
@@ -117,9 +141,7 @@ class LoginManager:
 
                 # 잠금 시간 계산 (방금 잠김)
                 from config.system_settings import SystemSettings
-                system_settings = SystemSettings()
-                system_settings.load()
-                lock_duration = system_settings.get_system_lock_time()
+                lock_duration = SystemSettings.shared().get_system_lock_time()
 
                 return {
                     'success': False,
@@ -334,13 +356,15 @@ class LoginManager:
 
     def validate_credentials(self, login_interface: LoginInterface, password: str) -> bool:
         """
-        자격 증명 검증 (간단한 평문 비교)
-        실제 프로덕션에서는 해시 비교를 사용해야 함
+        자격 증명 검증 (솔트 해시 비교, 마이그레이션 전 평문도 허용)
         :param login_interface: LoginInterface 인스턴스
         :param password: 입력된 비밀번호
-        :return: 일치 여부
+        :return: 일치 여부 (검증 풀이 가득 차면 False)
         """
-        return login_interface.get_password() == password
+        try:
+            return PASSWORD_VERIFIER.verify(password, login_interface.get_password())
+        except PasswordVerifierBusy:
+            return False
 
     def get_current_user(self) -> Optional[LoginInterface]:
         """현재 로그인된 사용자 반환"""
@@ -387,8 +411,6 @@ class LoginManager:
         :param interface_type: 'web_browser' or 'control_panel'
         :return: 검증 결과 딕셔너리
         """
-        MAX_ATTEMPTS = 5
-
         # 사용자 조회
         user = self.storage.get_user_by_username(username, interface_type)
 
@@ -411,38 +433,22 @@ class LoginManager:
             # 잠금 해제되었으면 계속 진행
 
         # First password 검증 (password 필드 사용)
-        if password == user['password']:
-            # 성공 - 실패 카운터 리셋
-            self.storage.reset_failed_login_attempts(username, interface_type)
+        try:
+            matched = PASSWORD_VERIFIER.verify(password, user['password'])
+        except PasswordVerifierBusy:
+            return dict(BUSY_RESULT)
+
+        if matched:
+            # 성공 - 실패 카운터 리셋 (이미 초기 상태면 쓰기 생략)
+            self.storage.record_successful_login(username, interface_type)
+            self._migrate_password(username, interface_type, 'password', password, user['password'])
 
             return {
                 'success': True,
                 'message': 'First password correct'
             }
         else:
-            # 실패 - 카운터 증가
-            self.storage.increment_failed_login_attempts(username, interface_type)
-
-            # 현재 실패 횟수 조회
-            user = self.storage.get_user_by_username(username, interface_type)
-            new_count = user['failed_attempts']
-
-            # 5회 도달 시 계정 잠금
-            if new_count >= MAX_ATTEMPTS:
-                self.storage.lock_user_account(username, interface_type)
-                return {
-                    'success': False,
-                    'message': 'Account locked due to too many failed attempts',
-                    'locked': True,
-                    'tries': new_count
-                }
-
-            return {
-                'success': False,
-                'message': 'Incorrect first password',
-                'tries': new_count,
-                'remaining': MAX_ATTEMPTS - new_count
-            }
+            return self._record_failed_attempt(username, interface_type, 'Incorrect first password')
 
     def validate_second_password(self, username: str, second_password: str, interface_type: str = 'web_browser') -> dict:
         """
@@ -452,8 +458,6 @@ class LoginManager:
         :param interface_type: 'web_browser' or 'control_panel'
         :return: 검증 결과 딕셔너리
         """
-        MAX_ATTEMPTS = 5
-
         # 사용자 조회
         user = self.storage.get_user_by_username(username, interface_type)
 
@@ -476,10 +480,16 @@ class LoginManager:
             # 잠금 해제되었으면 계속 진행
 
         # Second password 검증
-        if second_password == user['second_password']:
-            # 성공 - 실패 카운터 리셋 및 로그인 시간 업데이트
-            self.storage.reset_failed_login_attempts(username, interface_type)
-            self.storage.update_last_login_time(username, interface_type)
+        try:
+            matched = PASSWORD_VERIFIER.verify(second_password, user['second_password'])
+        except PasswordVerifierBusy:
+            return dict(BUSY_RESULT)
+
+        if matched:
+            # 성공 - 실패 카운터 리셋 및 로그인 시간 업데이트 (UPDATE 한 번)
+            self.storage.record_successful_login(username, interface_type, update_last_login=True)
+            self._migrate_password(username, interface_type, 'second_password',
+                                   second_password, user['second_password'])
 
             # 웹 로그인을 위한 인증 상태 업데이트
             # Note: 이 메서드는 주로 웹 세션 인증용이므로 self.current_user는 업데이트하지 않음
@@ -490,30 +500,55 @@ class LoginManager:
                 'username': username
             }
         else:
-            # 실패 - 카운터 증가
-            self.storage.increment_failed_login_attempts(username, interface_type)
+            return self._record_failed_attempt(username, interface_type, 'Incorrect second password')
 
-            # 현재 실패 횟수 조회
-            user = self.storage.get_user_by_username(username, interface_type)
-            new_count = user['failed_attempts']
+    def _migrate_password(self, username: str, interface_type: str, column: str,
+                          password: str, stored: str) -> None:
+        """
+        검증에 성공한 비밀번호가 평문이거나 낮은 비용으로 저장돼 있으면 새 해시로 교체
+        """
+        if not needs_rehash(stored):
+            return
+        try:
+            hashed = PASSWORD_VERIFIER.hash(password)
+        except PasswordVerifierBusy:
+            return  # 다음 로그인 때 다시 시도
+        self.storage.update_password_hash(username, interface_type, column, hashed)
 
-            # 5회 도달 시 계정 잠금
-            if new_count >= MAX_ATTEMPTS:
-                self.storage.lock_user_account(username, interface_type)
-                return {
-                    'success': False,
-                    'message': 'Account locked due to too many failed attempts',
-                    'locked': True,
-                    'tries': new_count
-                }
+    def _record_failed_attempt(self, username: str, interface_type: str, message: str) -> dict:
+        """
+        웹 로그인 실패 처리 - 실패 횟수 증가, 잠금 적용, 새 상태 조회를 한 번의 원자적 UPDATE로 수행
+        :param username: 사용자 ID
+        :param interface_type: 인터페이스 타입
+        :param message: 잠기지 않았을 때 반환할 메시지
+        :return: 검증 결과 딕셔너리
+        """
+        try:
+            state = self.storage.record_failed_login(username, interface_type, self.MAX_WEB_ATTEMPTS)
+        except sqlite3.Error:
+            return dict(LOGIN_FAILED_RESULT)
+        if state is None:
+            return {
+                'success': False,
+                'message': 'User not found'
+            }
 
+        new_count = state['failed_attempts']
+        if state['is_locked']:
             return {
                 'success': False,
-                'message': 'Incorrect second password',
-                'tries': new_count,
-                'remaining': MAX_ATTEMPTS - new_count
+                'message': 'Account locked due to too many failed attempts',
+                'locked': True,
+                'tries': new_count
             }
 
+        return {
+            'success': False,
+            'message': message,
+            'tries': new_count,
+            'remaining': self.MAX_WEB_ATTEMPTS - new_count
+        }
+
     def _check_and_unlock_if_time_passed(self, user: dict, username: str, interface_type: str) -> dict:
         """
         시간 기반 계정 잠금 해제 확인
@@ -540,11 +575,9 @@ class LoginManager:
             current_time = datetime.now()
             elapsed_seconds = (current_time - locked_time).total_seconds()
 
-            # 시스템 설정에서 잠금 시간 가져오기 (데이터베이스에서 직접 로드)
+            # 시스템 설정에서 잠금 시간 가져오기 (공유 설정 객체, DB 접근 없음)
             from config.system_settings import SystemSettings
-            system_settings = SystemSettings()
-            system_settings.load()  # 데이터베이스에서 최신 설정 로드
-            lock_duration = system_settings.get_system_lock_time()  # 초 단위
+            lock_duration = SystemSettings.shared().get_system_lock_time()  # 초 단위
 
             if elapsed_seconds >= lock_duration:
                 # 잠금 시간이 지났으면 자동 해제
@@ -0,0 +1,59 @@
+"""
+LoginThrottle - 웹 로그인 시도 속도 제한
+클라이언트 IP별, 사용자 이름별 토큰 버킷으로 초과 시도를 LoginManager(SQL)보다 먼저 거부한다.
+5회 실패 잠금은 계정 단위 보호이고, 이 제한은 대량 시도가 DB에 도달하지 않게 하는 앞단 방어다.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+from utils.metrics import LOGIN_THROTTLED_TOTAL
+from utils.rate_limiter import TokenBucketLimiter
+
+# 클라이언트 IP: 20회 연속 허용 후 3초마다 1회
+IP_BURST = 20
+IP_REFILL_PER_SECOND = 1 / 3
+# 사용자 이름: 10회 연속 허용 후 6초마다 1회 (분산된 IP에서의 대입 공격 대비)
+USERNAME_BURST = 10
+USERNAME_REFILL_PER_SECOND = 1 / 6
+
+
+class LoginThrottle:
+    """
+    IP와 사용자 이름 두 기준을 모두 통과해야 시도를 허용한다.
+    """
+
+    def __init__(
+        self,
+        ip_limiter: Optional[TokenBucketLimiter] = None,
+        username_limiter: Optional[TokenBucketLimiter] = None,
+    ) -> None:
+        if ip_limiter is None:
+            ip_limiter = TokenBucketLimiter(IP_BURST, IP_REFILL_PER_SECOND)
+        if username_limiter is None:
+            username_limiter = TokenBucketLimiter(USERNAME_BURST, USERNAME_REFILL_PER_SECOND)
+        self.ip_limiter = ip_limiter
+        self.username_limiter = username_limiter
+
+    def check(self, client_ip: Optional[str], username: Optional[str]) -> float:
+        """
+        로그인 시도 1회에 대한 허용 여부 확인
+        :param client_ip: 요청 IP (없으면 IP 제한 생략)
+        :param username: 시도 대상 사용자 이름 (없으면 사용자 제한 생략)
+        :return: 0.0이면 허용, 아니면 재시도까지 남은 초
+        """
+        if client_ip:
+            retry_after = self.ip_limiter.acquire(client_ip)
+            if retry_after > 0:
+                LOGIN_THROTTLED_TOTAL.inc("ip")
+                return retry_after
+        if username:
+            retry_after = self.username_limiter.acquire(username.strip().lower())
+            if retry_after > 0:
+                LOGIN_THROTTLED_TOTAL.inc("username")
+                return retry_after
+        return 0.0
+
+    def reset(self) -> None:
+        self.ip_limiter.reset()
+        self.username_limiter.reset()
@@ -0,0 +1,165 @@
+"""
+PasswordHashing - 솔트를 붙인 비밀번호 해시와 검증 워커 풀
+PBKDF2-HMAC-SHA256으로 "pbkdf2_sha256$<반복 횟수>$<솔트>$<해시>" 형식의 문자열을 만든다.
+반복 횟수(비용)는 SAFEHOME_PASSWORD_ITERATIONS 환경 변수나 set_iterations()로 조정한다.
+해시되지 않은 기존(평문) 값도 검증할 수 있으며, needs_rehash()로 재해시 대상을 판별한다.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+ALGORITHM = "pbkdf2_sha256"
+DEFAULT_ITERATIONS = 210_000
+SALT_BYTES = 16
+
+_iterations = int(os.environ.get("SAFEHOME_PASSWORD_ITERATIONS", DEFAULT_ITERATIONS))
+
+
+def get_iterations() -> int:
+    return _iterations
+
+
+def set_iterations(iterations: int) -> None:
+    """새로 만드는 해시의 반복 횟수 설정 (기존 해시는 다음 로그인 때 재해시된다)"""
+    global _iterations
+    if iterations < 1:
+        raise ValueError("iterations must be positive")
+    _iterations = int(iterations)
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _unb64(text: str) -> bytes:
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+
+def _derive(password: str, salt: bytes, iterations: int) -> bytes:
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+
+def hash_password(password: str, iterations: Optional[int] = None) -> str:
+    """
+    비밀번호 해시 생성
+    :param password: 평문 비밀번호
+    :param iterations: 반복 횟수 (None이면 현재 설정값)
+    :return: 저장용 해시 문자열
+    """
+    iterations = iterations or _iterations
+    salt = secrets.token_bytes(SALT_BYTES)
+    digest = _derive(password, salt, iterations)
+    return f"{ALGORITHM}${iterations}${_b64(salt)}${_b64(digest)}"
+
+
+def _parse(stored: str):
+    parts = stored.split("$")
+    if len(parts) != 4 or parts[0] != ALGORITHM:
+        return None
+    try:
+        return int(parts[1]), _unb64(parts[2]), _unb64(parts[3])
+    except (ValueError, TypeError):
+        return None
+
+
+def is_hashed(stored: Optional[str]) -> bool:
+    return bool(stored) and _parse(stored) is not None
+
+
+def verify_password(password: Optional[str], stored: Optional[str]) -> bool:
+    """
+    입력 비밀번호가 저장된 값과 일치하는지 확인 (해시/기존 평문 모두 지원)
+    :param password: 입력된 비밀번호
+    :param stored: DB에 저장된 값
+    :return: 일치 여부
+    """
+    if password is None or not stored:
+        return False
+    parsed = _parse(stored)
+    if parsed is None:
+        # 마이그레이션 전 평문 값
+        return hmac.compare_digest(password.encode("utf-8"), stored.encode("utf-8"))
+    iterations, salt, expected = parsed
+    return hmac.compare_digest(_derive(password, salt, iterations), expected)
+
+
+def needs_rehash(stored: Optional[str]) -> bool:
+    """평문이거나 현재 설정보다 비용이 낮은 해시면 True"""
+    parsed = _parse(stored) if stored else None
+    return parsed is None or parsed[0] < _iterations
+
+
+class PasswordVerifierBusy(RuntimeError):
+    """검증 대기열이 가득 차서 제한 시간 안에 작업을 넣지 못함"""
+
+
+class PasswordVerifier:
+    """
+    해시 계산을 고정 크기 워커 풀에서 수행한다.
+
+    PBKDF2는 계산 중 GIL을 놓으므로 요청 스레드는 기다리는 동안 다른 작업을
+    막지 않고, 동시에 도는 해시 수가 max_workers로 묶여 로그인 폭주가
+    CPU를 독점하지 못한다. 대기열(max_pending)이 차면 PasswordVerifierBusy를 던진다.
+    UI처럼 기다릴 수 없는 호출자는 submit_verify()로 Future를 받는다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: int = 64,
+                 wait_timeout: float = 5.0) -> None:
+        if max_workers is None:
+            max_workers = max(1, min(2, os.cpu_count() or 1))
+        if max_workers < 1 or max_pending < 0:
+            raise ValueError("max_workers must be positive and max_pending non-negative")
+        self.max_workers = max_workers
+        self.wait_timeout = wait_timeout
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="password-hash"
+                    )
+        return self._executor
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        if not self._slots.acquire(timeout=self.wait_timeout):
+            raise PasswordVerifierBusy("password verification queue is full")
+        try:
+            future = self._pool().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _f: self._slots.release())
+        return future
+
+    def submit_verify(self, password: Optional[str], stored: Optional[str]) -> Future:
+        return self._submit(verify_password, password, stored)
+
+    def verify(self, password: Optional[str], stored: Optional[str]) -> bool:
+        if not stored:
+            return False
+        if not is_hashed(stored):
+            return verify_password(password, stored)  # 평문 비교는 풀을 거칠 필요가 없다
+        return self.submit_verify(password, stored).result()
+
+    def hash(self, password: str) -> str:
+        return self._submit(hash_password, password).result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+PASSWORD_VERIFIER = PasswordVerifier()
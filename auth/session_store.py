@@ -0,0 +1,262 @@
+"""
+SessionStore - 서버 측 웹 세션 저장소
+세션 데이터는 SQLite(web_sessions)에 두고, 쿠키에는 임의의 세션 ID만 담는다.
+자주 쓰는 세션은 메모리 LRU에 유지해 요청마다 DB를 읽지 않으며,
+접근할 때마다 만료 시각을 연장(sliding expiry)하고 백그라운드 스레드가 만료 세션을 정리한다.
+"""
+from __future__ import annotations
+
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+from storage.storage_manager import StorageManager
+from utils.metrics import SESSION_LOOKUPS_TOTAL
+
+DEFAULT_TTL_SECONDS = 30 * 60
+DEFAULT_MAX_CACHED = 10_000
+DEFAULT_REAP_INTERVAL = 60.0
+SESSION_ID_BYTES = 32
+
+
+class _Entry:
+    __slots__ = ("data", "expires_at", "persisted_expires_at")
+
+    def __init__(self, data: dict, expires_at: float, persisted_expires_at: float) -> None:
+        self.data = data
+        self.expires_at = expires_at
+        self.persisted_expires_at = persisted_expires_at
+
+
+class SessionStore:
+    """
+    SQLite에 기록하고 메모리 LRU에서 읽는 세션 저장소.
+
+    세션 내용이 바뀌면 바로 DB에 쓴다(write-through). 만료 연장은 메모리에서만
+    하다가 DB 값보다 ttl의 1/10 이상 앞서면 그때 기록하므로, 캐시에서 밀려난
+    세션은 최대 그만큼 일찍 만료될 수 있다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_cached: int = DEFAULT_MAX_CACHED,
+        reap_interval: float = DEFAULT_REAP_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if ttl_seconds <= 0 or max_cached <= 0:
+            raise ValueError("ttl_seconds and max_cached must be positive")
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_cached = max_cached
+        self.reap_interval = reap_interval
+        self._touch_interval = self.ttl_seconds / 10
+        self._clock = clock
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._stop_reaper = threading.Event()
+
+    @staticmethod
+    def new_session_id() -> str:
+        return secrets.token_urlsafe(SESSION_ID_BYTES)
+
+    def _remember(self, session_id: str, entry: _Entry) -> None:
+        # self._lock을 잡은 상태에서 호출
+        self._cache[session_id] = entry
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+
+    def get(self, session_id: str) -> Optional[dict]:
+        """
+        세션 데이터 조회 및 만료 연장
+        :param session_id: 쿠키의 세션 ID
+        :return: 세션 데이터 사본, 없거나 만료되었으면 None
+        """
+        now = self._clock()
+        expires_at = now + self.ttl_seconds
+        touch = False
+        with self._lock:
+            entry = self._cache.get(session_id)
+            if entry is not None and entry.expires_at <= now:
+                del self._cache[session_id]
+                entry = None
+            if entry is not None:
+                self._cache.move_to_end(session_id)
+                entry.expires_at = expires_at
+                if expires_at - entry.persisted_expires_at >= self._touch_interval:
+                    entry.persisted_expires_at = expires_at
+                    touch = True
+                data = dict(entry.data)
+        if entry is not None:
+            SESSION_LOOKUPS_TOTAL.inc("cache")
+            if touch:
+                StorageManager().touch_web_session(session_id, expires_at)
+            return data
+
+        row = StorageManager().load_web_session(session_id)
+        if row is None or row['expires_at'] <= now:
+            if row is not None:
+                StorageManager().delete_web_session(session_id)
+            SESSION_LOOKUPS_TOTAL.inc("miss")
+            return None
+        try:
+            data = json.loads(row['data'])
+        except ValueError:
+            print("[SessionStore] Discarding unreadable session data.")
+            StorageManager().delete_web_session(session_id)
+            SESSION_LOOKUPS_TOTAL.inc("miss")
+            return None
+
+        persisted = row['expires_at']
+        if expires_at - persisted >= self._touch_interval:
+            StorageManager().touch_web_session(session_id, expires_at)
+            persisted = expires_at
+        with self._lock:
+            self._remember(session_id, _Entry(data, expires_at, persisted))
+        SESSION_LOOKUPS_TOTAL.inc("database")
+        return dict(data)
+
+    def save(self, session_id: str, data: dict) -> bool:
+        """
+        세션 데이터 저장 (DB에 먼저 쓰고 캐시 갱신)
+        :param data: JSON으로 직렬화 가능한 세션 값
+        :return: 저장 성공 여부
+        """
+        expires_at = self._clock() + self.ttl_seconds
+        if not StorageManager().save_web_session(session_id, json.dumps(data), expires_at):
+            with self._lock:
+                self._cache.pop(session_id, None)
+            return False
+        with self._lock:
+            self._remember(session_id, _Entry(dict(data), expires_at, expires_at))
+        return True
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._cache.pop(session_id, None)
+        StorageManager().delete_web_session(session_id)
+
+    def reap(self) -> int:
+        """
+        만료된 세션을 캐시와 DB에서 제거
+        :return: DB에서 삭제된 세션 수
+        """
+        now = self._clock()
+        with self._lock:
+            expired = [sid for sid, entry in self._cache.items() if entry.expires_at <= now]
+            for sid in expired:
+                del self._cache[sid]
+        return max(0, StorageManager().delete_expired_web_sessions(now))
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def start_reaper(self) -> None:
+        """만료 세션 정리 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+        self._stop_reaper.clear()
+        self._reaper = threading.Thread(target=self._reap_loop, name="session-reaper", daemon=True)
+        self._reaper.start()
+
+    def stop_reaper(self) -> None:
+        self._stop_reaper.set()
+        if self._reaper is not None:
+            self._reaper.join(timeout=5)
+            self._reaper = None
+
+    def _reap_loop(self) -> None:
+        while not self._stop_reaper.wait(self.reap_interval):
+            try:
+                removed = self.reap()
+                if removed:
+                    print(f"[SessionStore] Removed {removed} expired session(s).")
+            except Exception as e:
+                print(f"[SessionStore] Reaper error: {e}")
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """쿠키에는 sid만 두는 Flask 세션 객체"""
+
+    def __init__(self, initial: Optional[dict] = None, sid: Optional[str] = None) -> None:
+        def on_update(session: "ServerSideSession") -> None:
+            session.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.modified = False
+        self.rotate = False
+
+    def regenerate(self) -> None:
+        """다음 응답에서 새 세션 ID를 발급 (로그인 성공 시 세션 고정 방지)"""
+        self.rotate = True
+        self.modified = True
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Flask 세션을 SessionStore에 연결한다 (app.session_interface)"""
+
+    session_class = ServerSideSession
+
+    def __init__(self, store: SessionStore) -> None:
+        self.store = store
+
+    def open_session(self, app, request) -> ServerSideSession:
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            data = self.store.get(sid)
+            if data is not None:
+                return self.session_class(data, sid=sid)
+        return self.session_class()
+
+    def save_session(self, app, session: ServerSideSession, response) -> None:
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        if not session:
+            if session.sid is not None and session.modified:
+                # session.clear() - 로그아웃
+                self.store.delete(session.sid)
+                response.delete_cookie(
+                    name, domain=domain, path=path, secure=secure,
+                    samesite=samesite, httponly=httponly,
+                )
+            return
+
+        if not session.modified:
+            return
+
+        sid = session.sid
+        if session.rotate and sid is not None:
+            self.store.delete(sid)
+            sid = None
+        if sid is None:
+            sid = self.store.new_session_id()
+        if not self.store.save(sid, dict(session)):
+            print("[SessionStore] Failed to save session.")
+            return
+        if sid != session.sid:
+            response.set_cookie(
+                name, sid, expires=self.get_expiration_time(app, session),
+                httponly=httponly, domain=domain, path=path,
+                secure=secure, samesite=samesite,
+            )
+            session.sid = sid
@@ -0,0 +1,127 @@
+"""
+pytest wiring for the benchmark suite.
+
+    python -m pytest benchmarks -s                                  # run and print
+    python -m pytest benchmarks --bench-save benchmarks/baseline.json
+    python -m pytest benchmarks --bench-compare benchmarks/baseline.json [--bench-tolerance 0.2]
+
+In comparison mode a benchmark fails when its metric is worse than the
+baseline by more than the tolerance (a fraction, default 0.25).
+"""
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import pytest
+
+import storage.storage_manager as storage_mod
+from benchmarks.harness import DEFAULT_TOLERANCE, Metric, load_results, regression_message, write_results
+
+
+class BenchmarkRecorder:
+    """Collects metrics for the session and checks them against a baseline."""
+
+    def __init__(self, baseline: Optional[Dict[str, dict]], tolerance: float) -> None:
+        self.baseline = baseline
+        self.tolerance = tolerance
+        self.metrics: Dict[str, Metric] = {}
+
+    def record(self, name: str, value: float, unit: str, *, higher_is_better: bool) -> Metric:
+        metric = Metric(name, value, unit, higher_is_better)
+        self.metrics[name] = metric
+        print(f"\n[bench] {name}: {value:.4g} {unit}")
+        if self.baseline and name in self.baseline:
+            message = regression_message(metric, self.baseline[name], self.tolerance)
+            if message:
+                pytest.fail(message)
+        return metric
+
+
+_RECORDER_KEY = pytest.StashKey[BenchmarkRecorder]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("safehome-benchmarks")
+    group.addoption("--bench-save", default=None, help="Write benchmark results to this JSON file.")
+    group.addoption("--bench-compare", default=None, help="Fail benchmarks that regress against this JSON baseline.")
+    group.addoption(
+        "--bench-tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help="Allowed regression as a fraction of the baseline (default 0.25).",
+    )
+
+
+def pytest_configure(config):
+    compare = config.getoption("--bench-compare", default=None)
+    baseline = load_results(compare) if compare else None
+    tolerance = config.getoption("--bench-tolerance", default=DEFAULT_TOLERANCE)
+    config.stash[_RECORDER_KEY] = BenchmarkRecorder(baseline, tolerance)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    recorder = config.stash.get(_RECORDER_KEY, None)
+    if not recorder or not recorder.metrics:
+        return
+    terminalreporter.section("benchmark results")
+    for name, metric in sorted(recorder.metrics.items()):
+        line = f"{name:<45} {metric.value:>14.4g} {metric.unit}"
+        if recorder.baseline and name in recorder.baseline:
+            reference = float(recorder.baseline[name]["value"])
+            if reference:
+                line += f"   ({(metric.value - reference) / reference * 100.0:+.1f}% vs baseline)"
+        terminalreporter.write_line(line)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    path = session.config.getoption("--bench-save", default=None)
+    recorder = session.config.stash.get(_RECORDER_KEY, None)
+    if path and recorder and recorder.metrics:
+        write_results(path, recorder.metrics)
+
+
+@pytest.fixture
+def bench(request) -> BenchmarkRecorder:
+    return request.config.stash[_RECORDER_KEY]
+
+
+@pytest.fixture
+def isolated_storage(tmp_path):
+    """A fresh StorageManager on a throwaway database; the singleton is restored afterwards."""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(storage_mod, "DB_FILE", str(tmp_path / "bench.db"))
+        patch.setattr(storage_mod.StorageManager, "_instance", None)
+        manager = storage_mod.StorageManager()
+        assert manager.connect()
+        try:
+            yield manager
+        finally:
+            manager.disconnect()
+
+
+@pytest.fixture(scope="session")
+def safehome_system(tmp_path_factory):
+    """Turn the full System on once against a throwaway database and recording directory."""
+    import main as main_app
+    import domain.system as system_mod
+    from config.system_settings import SystemSettings
+    from domain.services.bootstrap_service import SystemBootstrapper
+    from domain.system import System
+
+    root = tmp_path_factory.mktemp("bench-system")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(storage_mod, "DB_FILE", str(root / "bench.db"))
+        patch.setattr(storage_mod.StorageManager, "_instance", None)
+        patch.setattr(SystemSettings, "_shared_instance", None)
+        patch.setattr(system_mod, "EVENT_CLIP_DIR", str(root / "events"))
+        patch.setattr(system_mod, "RECORDING_SEGMENT_DIR", str(root / "segments"))
+
+        system = System()
+        SystemBootstrapper().attach_post_turn_on_hook(system, [])
+        assert system.turn_on()
+        main_app.safehome_system = system
+        try:
+            yield system
+        finally:
+            system.turn_off()
+            main_app.safehome_system = None
+            if storage_mod.StorageManager._instance is not None:
+                storage_mod.StorageManager._instance.disconnect()
@@ -0,0 +1,92 @@
+"""
+Benchmark harness - 측정 도우미, 결과 JSON 저장 및 기준선(baseline) 비교
+"""
+from __future__ import annotations
+
+import json
+import platform
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+DEFAULT_TOLERANCE = 0.25
+
+
+@dataclass(frozen=True)
+class Metric:
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool
+
+
+def _rounds(fn: Callable[[], object], rounds: int, min_time: float):
+    """Yield (calls, seconds) for each round; a round repeats ``fn`` for at least ``min_time``."""
+    fn()  # warm-up: caches, lazy imports, first-query plans
+    for _ in range(rounds):
+        calls = 0
+        started = time.perf_counter()
+        while True:
+            fn()
+            calls += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        yield calls, elapsed
+
+
+# Noise from the scheduler and other processes only ever makes a round slower,
+# so the best round is the most repeatable estimate (as timeit recommends).
+
+def measure_throughput(
+    fn: Callable[[], object], *, items_per_call: int = 1, rounds: int = 7, min_time: float = 0.1
+) -> float:
+    """Best items-per-second over ``rounds`` rounds."""
+    return max(calls * items_per_call / elapsed for calls, elapsed in _rounds(fn, rounds, min_time))
+
+
+def measure_latency(fn: Callable[[], object], *, rounds: int = 7, min_time: float = 0.1) -> float:
+    """Best seconds-per-call over ``rounds`` rounds."""
+    return min(elapsed / calls for calls, elapsed in _rounds(fn, rounds, min_time))
+
+
+def regression_message(metric: Metric, baseline: dict, tolerance: float) -> Optional[str]:
+    """Describe the regression of ``metric`` against its baseline entry, or None."""
+    reference = float(baseline["value"])
+    if reference <= 0:
+        return None
+    if metric.higher_is_better:
+        limit = reference * (1.0 - tolerance)
+        regressed = metric.value < limit
+    else:
+        limit = reference * (1.0 + tolerance)
+        regressed = metric.value > limit
+    if not regressed:
+        return None
+    change = (metric.value - reference) / reference * 100.0
+    return (
+        f"{metric.name} regressed: {metric.value:.4g} {metric.unit} vs baseline "
+        f"{reference:.4g} {metric.unit} ({change:+.1f}%, tolerance {tolerance:.0%})"
+    )
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle).get("metrics", {})
+
+
+def write_results(path: str, metrics: Dict[str, Metric]) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "metrics": {
+            name: {key: value for key, value in asdict(metric).items() if key != "name"}
+            for name, metric in sorted(metrics.items())
+        },
+    }
+    target.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
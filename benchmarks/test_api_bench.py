@@ -0,0 +1,44 @@
+"""Flask endpoint latency through the test client (no network)."""
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.harness import measure_latency
+
+ENDPOINTS = [
+    ("api.security_status", "/api/security/status"),
+    ("api.security_sensors", "/api/security/sensors"),
+    ("api.security_zones", "/api/security/zones"),
+    ("api.cameras_thumbnails", "/api/cameras/thumbnails"),
+]
+
+
+@pytest.fixture(scope="module")
+def auth_client(safehome_system):
+    import main as main_app
+
+    main_app.app.config["TESTING"] = True
+    with main_app.app.test_client() as client:
+        with client.session_transaction() as session:
+            session["logged_in"] = True
+            session["username"] = "admin"
+        yield client
+
+
+@pytest.mark.parametrize("name,path", ENDPOINTS, ids=[name for name, _ in ENDPOINTS])
+def test_endpoint_latency(bench, auth_client, name, path):
+    assert auth_client.get(path).status_code == 200
+
+    seconds = measure_latency(lambda: auth_client.get(path), rounds=9, min_time=0.05)
+    bench.record(name, seconds * 1000.0, "ms", higher_is_better=False)
+
+
+def test_sensors_revalidation_latency(bench, auth_client):
+    etag = auth_client.get("/api/security/sensors").headers["ETag"]
+    headers = {"If-None-Match": etag}
+    assert auth_client.get("/api/security/sensors", headers=headers).status_code == 304
+
+    seconds = measure_latency(
+        lambda: auth_client.get("/api/security/sensors", headers=headers), rounds=9, min_time=0.05
+    )
+    bench.record("api.security_sensors.304", seconds * 1000.0, "ms", higher_is_better=False)
@@ -0,0 +1,38 @@
+"""Camera rendering: single view frame rate and thumbnail grid composition."""
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.harness import measure_latency, measure_throughput
+from surveillance.camera_controller import CameraController
+from virtual_device_v4.device.device_camera import DeviceCamera
+
+
+@pytest.fixture
+def device_camera():
+    camera = DeviceCamera()
+    camera.set_id(1)
+    try:
+        yield camera
+    finally:
+        camera.stop()
+
+
+def test_device_camera_get_view_fps(bench, device_camera):
+    rate = measure_throughput(device_camera.get_view)
+    bench.record("camera.get_view", rate, "fps", higher_is_better=True)
+
+
+def test_device_camera_zoomed_view_fps(bench, device_camera):
+    device_camera.zoom = 7
+    rate = measure_throughput(device_camera.get_view)
+    bench.record("camera.get_view.zoomed", rate, "fps", higher_is_better=True)
+
+
+def test_thumbnail_composition_time(bench):
+    controller = CameraController()
+    for _ in range(3):
+        controller.add_camera(10, 10)
+
+    seconds = measure_latency(controller.display_thumbnail_view)
+    bench.record("camera.thumbnail_grid", seconds * 1000.0, "ms", higher_is_better=False)
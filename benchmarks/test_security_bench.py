@@ -0,0 +1,62 @@
+"""SecuritySystem event processing rate, wired the way System wires it."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from benchmarks.harness import measure_throughput
+from security.events import SensorEvent, SensorStatus, SensorType
+from security.security_system import SecurityMode, SecuritySystem
+from utils.metrics import record_security_event
+from utils.tracing import TRACER
+
+SENSORS = 50
+
+
+def _security_system() -> SecuritySystem:
+    security = SecuritySystem(
+        get_delay_time=lambda: timedelta(seconds=30),
+        call_monitoring_service=lambda reason: None,
+        activate_siren=lambda: None,
+        deactivate_siren=lambda: None,
+        get_monitored_sensors_state=lambda: {},
+        latency_recorder=record_security_event,
+        tracer=TRACER,
+    )
+    for index in range(SENSORS):
+        security.register_sensor(f"motion-{index}", SensorType.MOTION)
+        security.assign_sensor_to_zone(f"motion-{index}", str(index % 5))
+    return security
+
+
+def _event(index: int) -> SensorEvent:
+    return SensorEvent(
+        f"motion-{index % SENSORS}", None, SensorType.MOTION, SensorStatus.MOTION_DETECTED, datetime.utcnow()
+    )
+
+
+def test_handle_sensor_event_disarmed(bench):
+    security = _security_system()
+    events = [_event(i) for i in range(SENSORS)]
+    state = {"i": 0}
+
+    def step():
+        state["i"] += 1
+        security.handle_sensor_event(events[state["i"] % SENSORS])
+
+    rate = measure_throughput(step)
+    bench.record("security.handle_sensor_event.disarmed", rate, "events/s", higher_is_better=True)
+
+
+def test_handle_sensor_event_armed(bench):
+    security = _security_system()
+    security.arm(SecurityMode.AWAY)
+    events = [_event(i) for i in range(SENSORS)]
+    state = {"i": 0}
+
+    def step():
+        state["i"] += 1
+        security.handle_sensor_event(events[state["i"] % SENSORS])
+
+    # The first event raises the alarm; the rest take the "already active" path.
+    rate = measure_throughput(step)
+    bench.record("security.handle_sensor_event.armed", rate, "events/s", higher_is_better=True)
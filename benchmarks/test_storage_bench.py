@@ -0,0 +1,61 @@
+"""StorageManager and LogManager throughput."""
+from __future__ import annotations
+
+import itertools
+from datetime import datetime
+
+from benchmarks.harness import measure_throughput
+from event_logging.log import Log
+from event_logging.log_manager import LogManager
+
+LOG_BATCH = 100
+
+
+def _log(index: int) -> Log:
+    return Log(event_type="BENCH", description=f"benchmark event {index}", date_time=datetime.now())
+
+
+def test_storage_insert_throughput(bench, isolated_storage):
+    isolated_storage.execute_update("CREATE TABLE bench_rows (id INTEGER PRIMARY KEY, payload TEXT)")
+    counter = itertools.count()
+
+    rate = measure_throughput(
+        lambda: isolated_storage.execute_update(
+            "INSERT INTO bench_rows (payload) VALUES (?)", (f"row {next(counter)}",)
+        )
+    )
+    bench.record("storage.insert", rate, "rows/s", higher_is_better=True)
+
+
+def test_storage_point_query_throughput(bench, isolated_storage):
+    isolated_storage.execute_update("CREATE TABLE bench_rows (id INTEGER PRIMARY KEY, payload TEXT)")
+    isolated_storage.execute_many(
+        "INSERT INTO bench_rows (id, payload) VALUES (?, ?)", [(i, f"row {i}") for i in range(1000)]
+    )
+    counter = itertools.count()
+
+    rate = measure_throughput(
+        lambda: isolated_storage.execute_query(
+            "SELECT payload FROM bench_rows WHERE id = ?", (next(counter) % 1000,)
+        )
+    )
+    bench.record("storage.point_query", rate, "queries/s", higher_is_better=True)
+
+
+def test_log_manager_single_save(bench, isolated_storage):
+    manager = LogManager(storage=isolated_storage)
+    counter = itertools.count()
+
+    rate = measure_throughput(lambda: manager.save_log(_log(next(counter))))
+    bench.record("log_manager.save_log", rate, "logs/s", higher_is_better=True)
+
+
+def test_log_manager_batch_save(bench, isolated_storage):
+    manager = LogManager(storage=isolated_storage)
+    counter = itertools.count()
+
+    rate = measure_throughput(
+        lambda: manager.save_logs([_log(next(counter)) for _ in range(LOG_BATCH)]),
+        items_per_call=LOG_BATCH,
+    )
+    bench.record("log_manager.save_logs", rate, "logs/s", higher_is_better=True)
@@ -3,7 +3,10 @@ ConfigurationManager - 시스템 전체 설정을 관리하는 모듈.
 SystemSettings, SafeHomeMode, SafetyZone 정보를 총괄 관리하며
 SecuritySystem과의 연동도 담당한다.
 """
-from typing import Dict, List, Optional
+import secrets
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
 from config.system_settings import SystemSettings
 from storage.storage_manager import StorageManager
@@ -51,19 +54,40 @@ class SafetyZone:
         return f"SafetyZone(id={self.zone_id}, name={self.zone_name}, {armed_status})"
 
 
+@dataclass(frozen=True)
+class SensorZoneSnapshot:
+    """
+    센서-구역 뷰의 물리화된 스냅샷 (읽기 전용으로 취급한다).
+    version은 디바이스/배정/구역 쓰기가 있을 때마다 증가한다.
+    epoch은 ConfigurationManager 인스턴스마다 새로 정해지므로, 리셋/재시작 후
+    version이 다시 1부터 시작해도 (epoch, version) 쌍은 겹치지 않는다.
+    """
+    version: int
+    sensors: Tuple[dict, ...]
+    zones: Tuple[dict, ...]
+    epoch: str = ""
+
+
 class ConfigurationManager:
     """
     시스템 전체 구성 정보를 관리하는 매니저 클래스.
     """
 
     def __init__(self):
-        self.system_settings = SystemSettings()
+        self.system_settings = SystemSettings.shared()
         self.safehome_modes: List[SafeHomeMode] = []
         self.safety_zones: List[SafetyZone] = []
         self.current_mode_name: str = MODE_DISARMED
         self.storage = StorageManager()
         self.device_manager = DeviceManager()
         self._security_system_ref: Optional[SecuritySystem] = None
+        # 연결된 SecuritySystem에 마지막으로 적용한 센서별 (타입, 구역) 상태
+        self._applied_sensors: Dict[str, Tuple[SensorType, Optional[str]]] = {}
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_version = 1
+        self._snapshot_epoch = secrets.token_hex(4)
+        self._sensor_snapshot: Optional[SensorZoneSnapshot] = None
+        self.device_manager.add_change_listener(self.invalidate_sensor_snapshot)
 
     def initialize_configuration(self) -> bool:
         """
@@ -124,11 +148,14 @@ class ConfigurationManager:
     def update_system_settings(self, settings: SystemSettings) -> bool:
         """
         시스템 설정 업데이트.
+        공유 설정 객체에 값을 반영한 뒤 저장하므로 다른 구독자도 변경을 알림받는다.
         :param settings: 새 SystemSettings 객체
         :return: 성공 여부
         """
-        self.system_settings = settings
-        return self.system_settings.save()
+        shared = self.get_system_setting()
+        if settings is not shared:
+            shared.copy_from(settings)
+        return shared.save()
 
     def update_safehome_mode(self, mode_name: str) -> bool:
         """
@@ -171,6 +198,7 @@ class ConfigurationManager:
 
         if rows > 0:
             print(f"[ConfigurationManager] Safety zone {zone_id} updated.")
+            self.invalidate_sensor_snapshot()
             return True
         else:
             print(f"[ConfigurationManager] Failed to update safety zone {zone_id}.")
@@ -190,6 +218,7 @@ class ConfigurationManager:
             new_zone = SafetyZone(zone_id, zone_name, False)
             self.safety_zones.append(new_zone)
             print(f"[ConfigurationManager] Safety zone '{zone_name}' added.")
+            self.invalidate_sensor_snapshot()
             self.reconfigure_security_system()
             return True
         else:
@@ -208,6 +237,7 @@ class ConfigurationManager:
         if rows > 0:
             self.safety_zones = [z for z in self.safety_zones if z.zone_id != zone_id]
             print(f"[ConfigurationManager] Safety zone {zone_id} deleted.")
+            self.invalidate_sensor_snapshot()
             self.reconfigure_security_system()
             return True
         else:
@@ -236,6 +266,55 @@ class ConfigurationManager:
             self.reconfigure_security_system()
         return success
 
+    def apply_sensor_assignments(self, items: List[dict]) -> List[dict]:
+        """
+        여러 센서-구역 배정을 한 트랜잭션으로 적용하고 SecuritySystem은 한 번만 재구성한다.
+        :param items: {'device_id': str, 'zone_id': int | None} 목록 (None이면 배정 해제)
+        :return: 항목별 결과 {'device_id', 'zone_id', 'success', 'message'} 목록
+        """
+        known_devices = {device_id for device_id, _ in self.device_manager.load_all_devices()}
+        zone_ids = {zone.zone_id for zone in self.refresh_safety_zones()}
+
+        results: List[dict] = []
+        pending: Dict[str, Optional[int]] = {}
+        for item in items:
+            device_id = item.get('device_id') if isinstance(item, dict) else None
+            zone_id = item.get('zone_id') if isinstance(item, dict) else None
+            result = {'device_id': device_id, 'zone_id': zone_id, 'success': False}
+            results.append(result)
+
+            if not device_id:
+                result['message'] = 'device_id is required'
+                continue
+            if device_id not in known_devices:
+                result['message'] = f'Unknown device {device_id}'
+                continue
+            if zone_id is not None:
+                try:
+                    zone_id = int(zone_id)
+                except (TypeError, ValueError):
+                    result['message'] = 'zone_id must be numeric'
+                    continue
+                if zone_id not in zone_ids:
+                    result['message'] = f'Zone {zone_id} not found'
+                    continue
+                result['zone_id'] = zone_id
+            # 같은 디바이스가 여러 번 나오면 마지막 항목이 적용된다.
+            pending[device_id] = zone_id
+            result['success'] = True
+
+        if pending:
+            if self.device_manager.apply_zone_assignments(pending) < 0:
+                for result in results:
+                    if result['success']:
+                        result['success'] = False
+                        result['message'] = 'Database error; batch rolled back'
+                return results
+            self.reconfigure_security_system()
+
+        print(f"[ConfigurationManager] Applied {len(pending)} of {len(items)} sensor assignments.")
+        return results
+
     def _zone_exists(self, zone_id: int) -> bool:
         for zone in self.safety_zones:
             if zone.zone_id == zone_id:
@@ -245,7 +324,8 @@ class ConfigurationManager:
         return any(zone.zone_id == zone_id for zone in self.safety_zones)
 
     def get_system_setting(self) -> SystemSettings:
-        """현재 시스템 설정 반환."""
+        """현재 시스템 설정 반환 (프로세스 공유 설정 객체)."""
+        self.system_settings = SystemSettings.shared()
         return self.system_settings
 
     def get_current_safehome_mode(self) -> str:
@@ -274,6 +354,70 @@ class ConfigurationManager:
             mapping[str(zone.zone_id)] = zone.zone_name
         return mapping
 
+    def invalidate_sensor_snapshot(self) -> None:
+        """디바이스/배정/구역이 바뀌었을 때 스냅샷을 버리고 버전을 올린다."""
+        with self._snapshot_lock:
+            self._snapshot_version += 1
+            self._sensor_snapshot = None
+
+    def get_sensor_snapshot_version(self) -> int:
+        """현재 센서-구역 스냅샷 버전 반환 (DB 접근 없음)."""
+        with self._snapshot_lock:
+            return self._snapshot_version
+
+    def get_sensor_snapshot(self) -> SensorZoneSnapshot:
+        """
+        센서-구역 뷰 스냅샷 반환.
+        무효화 이후 첫 호출에서만 DB를 읽고, 이후에는 캐시된 스냅샷을 돌려준다.
+        :return: SensorZoneSnapshot
+        """
+        with self._snapshot_lock:
+            if self._sensor_snapshot is not None:
+                return self._sensor_snapshot
+            version = self._snapshot_version
+
+        snapshot = self._build_sensor_snapshot(version)
+
+        with self._snapshot_lock:
+            # 빌드 중에 쓰기가 있었다면 이 스냅샷은 보관하지 않는다.
+            if self._snapshot_version == version:
+                self._sensor_snapshot = snapshot
+        return snapshot
+
+    def _build_sensor_snapshot(self, version: int) -> SensorZoneSnapshot:
+        devices = self.device_manager.load_all_devices()
+        if not devices and self.device_manager.ensure_default_devices():
+            devices = self.device_manager.load_all_devices()
+        assignments = self.list_sensor_assignments()
+        zones = self.refresh_safety_zones()
+        zone_names = {zone.zone_id: zone.zone_name for zone in zones}
+
+        counts: Dict[int, int] = {}
+        for zone_id in assignments.values():
+            counts[zone_id] = counts.get(zone_id, 0) + 1
+
+        sensors = []
+        for device_id, device_type in devices:
+            zone_id = assignments.get(device_id)
+            sensors.append({
+                'device_id': device_id,
+                'device_type': device_type,
+                'zone_id': zone_id,
+                'zone_name': zone_names.get(zone_id, str(zone_id)) if zone_id is not None else None,
+            })
+
+        zone_rows = tuple({
+            'zone_id': zone.zone_id,
+            'zone_name': zone.zone_name,
+            'is_armed': zone.is_armed,
+            'sensor_count': counts.get(zone.zone_id, 0),
+        } for zone in zones)
+
+        print(f"[ConfigurationManager] Built sensor snapshot v{version} "
+              f"({len(sensors)} sensors, {len(zone_rows)} zones).")
+        return SensorZoneSnapshot(version=version, sensors=tuple(sensors), zones=zone_rows,
+                                  epoch=self._snapshot_epoch)
+
     def configure_security_system(self, security_system: SecuritySystem) -> None:
         """
         SecuritySystem에 센서 및 구역 정보를 등록한다.
@@ -281,6 +425,8 @@ class ConfigurationManager:
         if not security_system:
             return
         self._security_system_ref = security_system
+        # 새 SecuritySystem에는 이전 적용 상태가 없으므로 전체를 적용한다.
+        self._applied_sensors = {}
         self._apply_security_configuration()
 
     def reconfigure_security_system(self) -> None:
@@ -290,7 +436,10 @@ class ConfigurationManager:
         self._apply_security_configuration()
 
     def _apply_security_configuration(self) -> None:
-        """Register sensors + assignments using the current cache."""
+        """
+        저장된 디바이스/배정을 마지막 적용 상태와 비교해 바뀐 센서만 SecuritySystem에 반영한다.
+        리스너에는 변경 묶음 전체에 대해 상태 알림이 한 번만 간다.
+        """
         security_system = self._security_system_ref
         if not security_system:
             return
@@ -301,15 +450,25 @@ class ConfigurationManager:
         if not self.safety_zones:
             self._load_safety_zones()
 
+        desired: Dict[str, Tuple[SensorType, Optional[str]]] = {}
         for device_id, device_type in devices:
-            sensor_type = self._map_device_type(device_type)
-            security_system.register_sensor(device_id, sensor_type)
-
             zone_id = assignments.get(device_id)
-            if zone_id is not None:
-                security_system.assign_sensor_to_zone(device_id, str(zone_id))
-            else:
-                security_system.unassign_sensor(device_id)
+            desired[device_id] = (
+                self._map_device_type(device_type),
+                str(zone_id) if zone_id is not None else None,
+            )
+
+        applied = self._applied_sensors
+        changed = {device_id: state for device_id, state in desired.items()
+                   if applied.get(device_id) != state}
+        removed = [device_id for device_id in applied if device_id not in desired]
+        if not changed and not removed:
+            return
+
+        security_system.apply_sensor_changes(changed, removed)
+        self._applied_sensors = desired
+        print(f"[ConfigurationManager] Reconfigured security system "
+              f"({len(changed)} changed, {len(removed)} removed).")
 
     def _map_device_type(self, device_type: str) -> SensorType:
         """저장된 디바이스 타입 문자열을 SensorType enum으로 변환."""
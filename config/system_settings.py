@@ -1,9 +1,39 @@
 """
 SystemSettings - 시스템 전역 설정 관리
 모니터링 서비스 전화번호, 집주인 전화번호, 시스템 잠금 시간, 알람 지연 시간 등
+
+SystemSettings.shared()가 프로세스 전체의 기준(authoritative) 설정 객체를 돌려준다.
+읽기는 메모리에서만 이루어지고, save()는 DB에 기록(write-through)한 뒤
+버전을 올리고 변경 리스너에게 알린다. 마지막으로 로드/저장한 값과 같으면
+save()는 DB에 쓰지 않는다.
 """
+import threading
+from typing import Callable, List, Optional
+
 from storage.storage_manager import StorageManager
-from typing import Optional
+
+_SETTING_FIELDS = (
+    "monitoring_service_phone",
+    "homeowner_phone",
+    "system_lock_time",
+    "alarm_delay_time",
+)
+
+# 설정은 고정 키의 한 행에 저장한다 (기본 설정 행이 1번으로 생성된다).
+_SETTINGS_ROW_ID = 1
+
+# 고정 키 행이 없으면 만들고 있으면 갱신하는 단일 문장
+_UPSERT_SQL = """
+    INSERT INTO system_settings
+    (setting_id, monitoring_service_phone, homeowner_phone, system_lock_time, alarm_delay_time)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(setting_id) DO UPDATE SET
+        monitoring_service_phone = excluded.monitoring_service_phone,
+        homeowner_phone = excluded.homeowner_phone,
+        system_lock_time = excluded.system_lock_time,
+        alarm_delay_time = excluded.alarm_delay_time,
+        updated_at = CURRENT_TIMESTAMP
+"""
 
 
 class SystemSettings:
@@ -12,12 +42,87 @@ class SystemSettings:
     데이터베이스와 연동하여 설정 정보를 저장/로드
     """
 
+    _shared_instance: Optional["SystemSettings"] = None
+    _shared_lock = threading.Lock()
+
     def __init__(self):
         self.monitoring_service_phone: str = "911"
         self.homeowner_phone: str = "010-0000-0000"
         self.system_lock_time: int = 30  # 초 단위
         self.alarm_delay_time: int = 60  # 초 단위
         self.storage = StorageManager()
+        self._version = 0
+        self._version_lock = threading.Lock()
+        # 마지막으로 DB와 일치했던 값 (None이면 아직 로드/저장한 적 없음)
+        self._persisted_values: Optional[tuple] = None
+        self._change_listeners: List[Callable[["SystemSettings"], None]] = []
+
+    @classmethod
+    def shared(cls) -> "SystemSettings":
+        """
+        프로세스 전역 설정 객체 반환 (최초 호출 시 한 번만 DB에서 로드).
+        StorageManager 싱글톤이 교체되면(다른 DB) 새로 로드하며 리스너는 유지한다.
+        :return: 공유 SystemSettings
+        """
+        storage = StorageManager()
+        instance = cls._shared_instance
+        if instance is not None and instance.storage is storage:
+            return instance
+        with cls._shared_lock:
+            previous = cls._shared_instance
+            if previous is not None and previous.storage is storage:
+                return previous
+            instance = cls()
+            if previous is not None:
+                instance._change_listeners = list(previous._change_listeners)
+                instance._version = previous._version
+            instance.load()
+            cls._shared_instance = instance
+        return instance
+
+    # Change notification
+    def get_version(self) -> int:
+        """설정이 바뀔 때마다 증가하는 버전 번호"""
+        return self._version
+
+    def add_change_listener(self, listener: Callable[["SystemSettings"], None]) -> None:
+        """설정 변경 시 호출될 리스너 등록 (인자로 이 설정 객체를 받는다)"""
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[["SystemSettings"], None]) -> None:
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, field) for field in _SETTING_FIELDS)
+
+    def is_dirty(self) -> bool:
+        """마지막 로드/저장 이후 값이 바뀌었는지 (한 번도 저장/로드하지 않았으면 True)"""
+        return self._values() != self._persisted_values
+
+    def copy_from(self, other: "SystemSettings") -> None:
+        """다른 설정 객체의 값을 복사 (저장/알림은 하지 않음)"""
+        for field in _SETTING_FIELDS:
+            setattr(self, field, getattr(other, field))
+
+    def _notify_changed(self) -> None:
+        with self._version_lock:
+            self._version += 1
+        for listener in list(self._change_listeners):
+            try:
+                listener(self)
+            except Exception as e:
+                print(f"[SystemSettings] Change listener failed: {e}")
+
+    def _publish(self) -> None:
+        """저장된 값을 이 객체와 (다른 객체라면) 공유 설정 객체에 반영하고 알림"""
+        self._notify_changed()
+        shared = SystemSettings._shared_instance
+        if shared is not None and shared is not self and shared.storage is self.storage:
+            shared.copy_from(self)
+            shared._persisted_values = self._persisted_values
+            shared._notify_changed()
 
     # Getters
     def get_monitoring_service_phone(self) -> str:
@@ -82,18 +187,23 @@ class SystemSettings:
             SELECT monitoring_service_phone, homeowner_phone,
                    system_lock_time, alarm_delay_time
             FROM system_settings
-            ORDER BY setting_id DESC
+            ORDER BY setting_id = ? DESC, setting_id DESC
             LIMIT 1
         """
-        result = self.storage.execute_query(sql)
+        # 고정 키 행을 우선 읽고, 없으면 (이전 버전 DB) 가장 최근 행을 읽는다.
+        result = self.storage.execute_query(sql, (_SETTINGS_ROW_ID,))
 
         if result and len(result) > 0:
             row = result[0]
+            previous = self._values()
             self.monitoring_service_phone = row['monitoring_service_phone']
             self.homeowner_phone = row['homeowner_phone']
             self.system_lock_time = row['system_lock_time']
             self.alarm_delay_time = row['alarm_delay_time']
+            self._persisted_values = self._values()
             print("[SystemSettings] Settings loaded successfully.")
+            if self._values() != previous:
+                self._notify_changed()
             return True
         else:
             print("[SystemSettings] No settings found in database, using defaults.")
@@ -101,45 +211,20 @@ class SystemSettings:
 
     def save(self) -> bool:
         """
-        현재 시스템 설정을 데이터베이스에 저장
-        기존 설정을 업데이트하거나 새로 삽입
+        현재 시스템 설정을 데이터베이스에 저장 (고정 키 행에 단일 UPSERT)
+        마지막 로드/저장 이후 바뀐 값이 없으면 DB에 쓰지 않는다.
         :return: 성공 여부
         """
-        # 기존 설정 확인
-        check_sql = "SELECT setting_id FROM system_settings LIMIT 1"
-        result = self.storage.execute_query(check_sql)
+        if not self.is_dirty():
+            return True
 
-        if result and len(result) > 0:
-            # UPDATE 최근 설정
-            sql = """
-                UPDATE system_settings
-                SET monitoring_service_phone = ?,
-                    homeowner_phone = ?,
-                    system_lock_time = ?,
-                    alarm_delay_time = ?,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE setting_id = (
-                    SELECT setting_id FROM system_settings
-                    ORDER BY setting_id DESC
-                    LIMIT 1
-                )
-            """
-        else:
-            # INSERT
-            sql = """
-                INSERT INTO system_settings
-                (monitoring_service_phone, homeowner_phone, system_lock_time, alarm_delay_time)
-                VALUES (?, ?, ?, ?)
-            """
-
-        rows = self.storage.execute_update(
-            sql,
-            (self.monitoring_service_phone, self.homeowner_phone,
-             self.system_lock_time, self.alarm_delay_time)
-        )
+        values = self._values()
+        rows = self.storage.execute_update(_UPSERT_SQL, (_SETTINGS_ROW_ID,) + values)
 
         if rows > 0:
             print("[SystemSettings] Settings saved successfully.")
+            self._persisted_values = values
+            self._publish()
             return True
         else:
             print("[SystemSettings] Failed to save settings.")
@@ -0,0 +1,57 @@
+"""
+WebServerConfig - 웹 인터페이스 서버 실행 설정
+개발 서버(Flask 내장)와 운영용 멀티스레드 WSGI 서버(waitress) 중 선택하고,
+워커 스레드 수, 연결 backlog, 타임아웃 등을 지정한다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+SERVER_DEVELOPMENT = "development"
+SERVER_PRODUCTION = "production"
+
+
+@dataclass
+class WebServerConfig:
+    """
+    Serving options for the Flask app.
+
+    Each open ``/api/security/events`` stream keeps one worker thread busy
+    for as long as the dashboard stays connected, so ``threads`` should
+    leave room for the expected number of dashboards plus regular requests.
+    """
+
+    server: str = SERVER_DEVELOPMENT
+    host: str = "127.0.0.1"
+    port: int = 5000
+    threads: int = 16
+    backlog: int = 1024
+    connection_limit: int = 200
+    channel_timeout: int = 120
+    cleanup_interval: int = 30
+
+    def __post_init__(self) -> None:
+        if self.server not in (SERVER_DEVELOPMENT, SERVER_PRODUCTION):
+            raise ValueError(f"Unknown web server type: {self.server}")
+        for name in ("threads", "backlog", "connection_limit", "channel_timeout", "cleanup_interval"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive")
+
+    @property
+    def is_production(self) -> bool:
+        return self.server == SERVER_PRODUCTION
+
+    def waitress_options(self) -> Dict[str, Any]:
+        """Keyword arguments for ``waitress.create_server``."""
+        return {
+            "host": self.host,
+            "port": self.port,
+            "threads": self.threads,
+            "backlog": self.backlog,
+            "connection_limit": self.connection_limit,
+            "channel_timeout": self.channel_timeout,
+            "cleanup_interval": self.cleanup_interval,
+            "ident": "SafeHome",
+        }
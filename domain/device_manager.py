@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+import sqlite3
+from typing import Callable, Dict, List, Optional, Tuple
 
 from storage.storage_manager import StorageManager
 from utils.constants import (
@@ -13,8 +14,25 @@ class DeviceManager:
 
     def __init__(self) -> None:
         self.storage = StorageManager()
+        self._change_listeners: List[Callable[[], None]] = []
         self._initialize_tables()
 
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked after every successful device/assignment write."""
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[], None]) -> None:
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def _notify_changed(self) -> None:
+        for listener in list(self._change_listeners):
+            try:
+                listener()
+            except Exception as e:
+                print(f"[DeviceManager] Change listener failed: {e}")
+
     def _initialize_tables(self) -> None:
         """Ensure device and assignment tables exist and seed defaults."""
         device_sql = """
@@ -37,6 +55,8 @@ class DeviceManager:
     def add_device(self, device_id: str, device_type: str) -> bool:
         sql = "INSERT OR IGNORE INTO devices (device_id, device_type) VALUES (?, ?)"
         res = self.storage.execute_update(sql, (device_id, device_type))
+        if res > 0:
+            self._notify_changed()
         return res > 0
     
     def ensure_default_devices(self) -> bool:
@@ -61,6 +81,7 @@ class DeviceManager:
         res = self.storage.execute_update(sql, (device_id,))
         if res > 0:
             self.remove_device_zone_assignment(device_id)
+            self._notify_changed()
         return res > 0
 
     def load_all_devices(self) -> List[Tuple[str, str]]:
@@ -112,9 +133,45 @@ class DeviceManager:
                                                assigned_at = CURRENT_TIMESTAMP
         """
         res = self.storage.execute_update(sql, (device_id, zone_id))
+        if res > 0:
+            self._notify_changed()
         return res > 0
 
     def remove_device_zone_assignment(self, device_id: str) -> bool:
         sql = "DELETE FROM sensor_zone_assignments WHERE device_id = ?"
         res = self.storage.execute_update(sql, (device_id,))
+        if res > 0:
+            self._notify_changed()
         return res > 0
+
+    def apply_zone_assignments(self, assignments: Dict[str, Optional[int]]) -> int:
+        """
+        Upsert (zone id) or delete (None) many assignments in one transaction.
+        Listeners are notified once. Returns the number of changed rows, or -1
+        if the transaction was rolled back.
+        """
+        upserts = [(device_id, zone_id) for device_id, zone_id in assignments.items() if zone_id is not None]
+        deletes = [(device_id,) for device_id, zone_id in assignments.items() if zone_id is None]
+        try:
+            with self.storage.transaction() as cursor:
+                changed = 0
+                if upserts:
+                    cursor.executemany(
+                        """
+                        INSERT INTO sensor_zone_assignments (device_id, zone_id)
+                        VALUES (?, ?)
+                        ON CONFLICT(device_id) DO UPDATE SET zone_id = excluded.zone_id,
+                                                           assigned_at = CURRENT_TIMESTAMP
+                        """,
+                        upserts,
+                    )
+                    changed += cursor.rowcount
+                if deletes:
+                    cursor.executemany("DELETE FROM sensor_zone_assignments WHERE device_id = ?", deletes)
+                    changed += cursor.rowcount
+        except sqlite3.Error as e:
+            print(f"[DeviceManager] Batch assignment rolled back: {e}")
+            return -1
+        if changed > 0:
+            self._notify_changed()
+        return changed
@@ -8,3 +8,4 @@ from .modes_presenter import ModesViewModel
 from .change_password_presenter import ControlPanelChangePasswordPresenter, ChangePasswordOutcome
 from .settings_presenter import ControlPanelSettingsPresenter, SettingsOutcome
 from .power_presenter import PowerControlPresenter, PowerOutcome
+from .startup_service import StagedStartup, StartupStage
@@ -31,11 +31,12 @@ class SystemBootstrapper:
         if loaded_sensors:
             ui_sensors.clear()
             ui_sensors.extend(loaded_sensors)
-        system.sensors = ui_sensors
+        if ui_sensors is not system.sensors:
+            system.sensors = ui_sensors
 
         controller = getattr(system, "system_controller", None)
         if controller:
-            for sensor in ui_sensors:
+            for sensor in system.sensors:
                 if hasattr(sensor, "add_observer"):
                     sensor.add_observer(controller)
                 if sensor.get_type() == SENSOR_CAMERA and hasattr(sensor, "take_picture"):
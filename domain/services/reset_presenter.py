@@ -10,6 +10,7 @@ class ResetOutcome:
     alert_title: str
     alert_message: str
     phase: int | None = None
+    mode: str | None = None
 
 
 class ControlPanelResetPresenter:
@@ -18,9 +19,13 @@ class ControlPanelResetPresenter:
     def __init__(self, system):
         self.system = system
 
-    def perform_reset(self) -> ResetOutcome:
+    def perform_reset(self, warm: bool = True) -> ResetOutcome:
+        """
+        Reset the system. A warm reset is tried first; System.reset falls
+        back to a full (cold) reset by itself if the warm path fails.
+        """
         try:
-            result = self.system.reset()
+            result = self.system.reset(warm=warm)
         except Exception as exc:
             return ResetOutcome(
                 success=False,
@@ -33,10 +38,12 @@ class ControlPanelResetPresenter:
             success = bool(result.get("success"))
             message = result.get("message", "")
             phase = result.get("phase")
+            mode = result.get("mode")
         else:  # Support legacy boolean returns
             success = bool(result)
             message = "System reset successfully!" if success else "Failed to reset system."
             phase = None
+            mode = None
 
         return ResetOutcome(
             success=success,
@@ -44,4 +51,5 @@ class ControlPanelResetPresenter:
             alert_title="Success" if success else "Error",
             alert_message=message or ("System reset successfully!" if success else "Failed to reset system."),
             phase=phase,
+            mode=mode,
         )
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class StartupStage:
+    """One unit of startup work and the stages that must finish before it."""
+
+    name: str
+    run: Callable[[], None]
+    after: Tuple[str, ...] = ()
+
+
+class StagedStartup:
+    """
+    Runs startup stages on a small thread pool in dependency order.
+
+    A stage starts as soon as every stage it depends on has finished, so
+    independent stages overlap and the total time follows the critical path.
+    The calling thread only schedules and waits; ``on_stage_done`` is always
+    invoked on it. After the first failure no new stages are started, and the
+    exception is re-raised once the stages already running have finished.
+    """
+
+    def __init__(self, stages: Iterable[StartupStage], max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        self.stages: Dict[str, StartupStage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate startup stage {stage.name!r}")
+            self.stages[stage.name] = stage
+        for stage in self.stages.values():
+            missing = [name for name in stage.after if name not in self.stages]
+            if missing:
+                raise ValueError(f"Stage {stage.name!r} depends on unknown stage(s) {missing}")
+        self._check_acyclic()
+        self.max_workers = max_workers
+
+    def _check_acyclic(self) -> None:
+        finished: set = set()
+        pending = dict(self.stages)
+        while pending:
+            ready = [name for name, stage in pending.items() if set(stage.after) <= finished]
+            if not ready:
+                raise ValueError(f"Startup stages have a dependency cycle: {sorted(pending)}")
+            for name in ready:
+                finished.add(name)
+                del pending[name]
+
+    def run(self, on_stage_done: Optional[Callable[[str, float], None]] = None) -> Dict[str, float]:
+        """
+        Run every stage.
+        :param on_stage_done: called with (stage name, seconds) as each stage finishes
+        :return: seconds spent in each stage, in completion order
+        """
+        timings: Dict[str, float] = {}
+        waiting = dict(self.stages)
+        running: Dict[Future, str] = {}
+        failure: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="startup") as pool:
+            while True:
+                if failure is None:
+                    for name, stage in list(waiting.items()):
+                        if all(dependency in timings for dependency in stage.after):
+                            del waiting[name]
+                            running[pool.submit(self._timed, stage.run)] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        timings[name] = future.result()
+                    except BaseException as exc:  # re-raised after the pool drains
+                        if failure is None:
+                            failure = exc
+                        continue
+                    if on_stage_done:
+                        on_stage_done(name, timings[name])
+
+        if failure is not None:
+            raise failure
+        return timings
+
+    @staticmethod
+    def _timed(action: Callable[[], None]) -> float:
+        started = time.perf_counter()
+        action()
+        return time.perf_counter() - started
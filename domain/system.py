@@ -5,7 +5,7 @@ System - SafeHome 시스템 메인 클래스
 from __future__ import annotations
 import time
 from datetime import timedelta
-from typing import Optional
+from typing import Callable, Dict, List, Optional
 from enum import Enum
 
 from storage.storage_manager import StorageManager
@@ -13,14 +13,20 @@ from auth.login_manager import LoginManager
 from event_logging.log_manager import LogManager
 from config.configuration_manager import ConfigurationManager
 from domain.system_controller import SystemController
-from utils.constants import STATE_OPEN, STATE_DETECTED
+from utils.constants import STATE_OPEN, STATE_DETECTED, EVENT_CLIP_DIR, RECORDING_SEGMENT_DIR
 from domain.device_manager import DeviceManager
 from devices.siren import Siren
 from security.security_system import SecuritySystem
 from security.events import SensorStatus
+from security.event_stream import CompositeSecurityListener, SecurityEventStream
 from surveillance.camera_controller import CameraController
+from surveillance.motion_analyzer import MotionAnalyzer
+from surveillance.recording_store import RecordingStore
+from utils.metrics import record_security_event
+from utils.tracing import TRACER
 from domain.services.auth_service import AuthService
 from domain.services.settings_service import SettingsService
+from domain.services.startup_service import StagedStartup, StartupStage
 
 
 class SystemCameraGateway:
@@ -30,19 +36,20 @@ class SystemCameraGateway:
         self._system = system
 
     def trigger_all(self, source: str) -> None:
-        controller = getattr(self._system, "system_controller", None)
-        if controller:
-            try:
-                controller.trigger_camera(source)
-            except Exception as exc:  # pragma: no cover - defensive
-                print(f"[SecurityCameraGateway] Controller trigger failed: {exc}")
+        with TRACER.span("camera_gateway.trigger_all", source=source):
+            controller = getattr(self._system, "system_controller", None)
+            if controller:
+                try:
+                    controller.trigger_camera(source)
+                except Exception as exc:  # pragma: no cover - defensive
+                    print(f"[SecurityCameraGateway] Controller trigger failed: {exc}")
 
-        camera_controller = getattr(self._system, "camera_controller", None)
-        if camera_controller and hasattr(camera_controller, "trigger_security_event"):
-            try:
-                camera_controller.trigger_security_event(source)
-            except Exception as exc:  # pragma: no cover - defensive
-                print(f"[SecurityCameraGateway] Camera controller trigger failed: {exc}")
+            camera_controller = getattr(self._system, "camera_controller", None)
+            if camera_controller and hasattr(camera_controller, "trigger_security_event"):
+                try:
+                    camera_controller.trigger_security_event(source)
+                except Exception as exc:  # pragma: no cover - defensive
+                    print(f"[SecurityCameraGateway] Camera controller trigger failed: {exc}")
 
 
 
@@ -56,15 +63,75 @@ class SystemState(Enum):
     SHUTDOWN = "Shutdown"
 
 
+class _SensorList(list):
+    """
+    변경을 System에 알리는 센서 목록 (device_id 인덱스 유지용)
+    append/extend/remove/pop은 바뀐 센서만 알리고, 순서나 위치를 바꾸는 나머지 변경은
+    on_reset으로 인덱스 전체 재구성을 요청한다.
+    """
+
+    def __init__(self, on_add, on_remove, on_reset, sensors=()):
+        super().__init__(sensors)
+        self._on_add = on_add
+        self._on_remove = on_remove
+        self._on_reset = on_reset
+
+    def append(self, sensor):
+        list.append(self, sensor)
+        self._on_add(sensor)
+
+    def extend(self, sensors):
+        sensors = list(sensors)
+        list.extend(self, sensors)
+        for sensor in sensors:
+            self._on_add(sensor)
+
+    def __iadd__(self, sensors):
+        self.extend(sensors)
+        return self
+
+    def remove(self, sensor):
+        position = self.index(sensor)
+        removed = self[position]
+        list.__delitem__(self, position)
+        self._on_remove(removed)
+
+    def pop(self, position=-1):
+        removed = list.pop(self, position)
+        self._on_remove(removed)
+        return removed
+
+    def _reset(method):
+        def wrapper(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            self._on_reset()
+            return result
+        wrapper.__name__ = method.__name__
+        return wrapper
+
+    insert = _reset(list.insert)
+    clear = _reset(list.clear)
+    sort = _reset(list.sort)
+    reverse = _reset(list.reverse)
+    __setitem__ = _reset(list.__setitem__)
+    __delitem__ = _reset(list.__delitem__)
+    __imul__ = _reset(list.__imul__)
+    del _reset
+
+
 class System:
     """
     SafeHome 시스템 메인 클래스
     모든 컴포넌트를 초기화하고 관리하며, Common Functions를 제공
     """
 
-    def __init__(self):
+    def __init__(self, motion_analysis: bool = False):
+        """
+        :param motion_analysis: 카메라 프레임 차분 모션 분석 사용 여부 (기본값 꺼짐)
+        """
         # 시스템 상태
         self.system_state = SystemState.OFF
+        self.motion_analysis = motion_analysis
 
         # 핵심 컴포넌트
         self.storage_manager: Optional[StorageManager] = None
@@ -76,10 +143,16 @@ class System:
         self.camera_controller: Optional[CameraController] = None
 
         self.device_manager = None
-        self.sensors = []
+        self._sensors: List = _SensorList(
+            self._index_added_sensor, self._unindex_removed_sensor, self._invalidate_sensor_index
+        )
+        self._sensor_index: Optional[Dict[str, object]] = {}
+        self._duplicate_sensor_ids: set = set()
         self.siren: Optional[Siren] = None
         self.alarms: List = []  # List of Alarm instances (composition: 1:*)
         self.security_listener = None
+        # SSE 클라이언트가 구독하는 보안 이벤트 스트림 (리셋 후에도 연결 유지, turn_off에서 닫힘)
+        self.security_event_stream = SecurityEventStream()
         self.camera_gateway = SystemCameraGateway(self)
 
         # UI 참조
@@ -87,6 +160,9 @@ class System:
         self._auth_service: Optional[AuthService] = None
         self._settings_service: Optional[SettingsService] = None
 
+        # 마지막 turn_on의 단계별 소요 시간 (ms, 'total'은 전체)
+        self.startup_timings: Dict[str, float] = {}
+
         # turn_on 완료 후 호출될 콜백 (디바이스 초기화 등)
         self.on_turn_on_complete = None
 
@@ -195,13 +271,21 @@ class System:
 
         return result.success
 
+    def _on_settings_changed(self, settings) -> None:
+        """공유 SystemSettings 변경 알림 - 알람 지연 시간을 SecuritySystem에 반영"""
+        if self.security_system:
+            self.security_system.refresh_delay_time()
+
     # ========================================
     # Common Function 4: Turn the system on
     # ========================================
-    def turn_on(self) -> bool:
+    def turn_on(self, progress: Optional[Callable[[str, float], None]] = None) -> bool:
         """
-        ??? ??
-        ?? ???? ??? ? ??
+        시스템 시작
+        의존 관계가 없는 초기화 단계(예: 카메라 이미지 로드와 DB 스키마 초기화)는 동시에 실행한다.
+        단계별 소요 시간은 startup_timings(ms)에 기록된다.
+        :param progress: 단계가 끝날 때마다 (단계 이름, 완료 비율 0~1)로 호출 (호출 스레드에서 실행)
+        :return: 성공 여부
         """
         if self.system_state != SystemState.OFF:
             print(f"[System] System is already {self.system_state.value}.")
@@ -209,111 +293,31 @@ class System:
 
         print("[System] Starting SafeHome system...")
         self.system_state = SystemState.INITIALIZING
+        started = time.perf_counter()
+        if self.security_event_stream.closed:
+            # 이전 turn_off()에서 닫힌 스트림 - 새 스트림으로 교체 (클라이언트는 재접속 후 스냅샷 수신)
+            self.security_event_stream = SecurityEventStream()
 
-        try:
-            # 1. StorageManager ??? ? ??
-            self.storage_manager = StorageManager()
-            if not self.storage_manager.connect():
-                raise Exception("Failed to connect to database.")
-
-            # 2. ConfigurationManager ???
-            self.configuration_manager = ConfigurationManager()
-            self.configuration_manager.initialize_configuration()
-
-            # 3. Siren & Alarm initialization for SecuritySystem
-            self.siren = Siren("MainSiren")
-            
-            # Initialize Alarm instances (composition: System has multiple Alarms)
-            from security.security_system import Alarm
-            # Create default alarms - can be configured later
-            self.alarms = [
-                Alarm(alarm_id=1, x_coord=100, y_coord=100),  # Main alarm
-                Alarm(alarm_id=2, x_coord=200, y_coord=200),  # Secondary alarm
-            ]
-
-            def get_delay_time():
-                settings = self.configuration_manager.get_system_setting()
-                delay_seconds = max(settings.get_alarm_delay_time(), 0)
-                return timedelta(seconds=delay_seconds)
-
-            def call_monitoring_service(reason: str):
-                message = f"[SecuritySystem] Monitoring service notified: {reason}"
-                print(message)
-                import sys
-                sys.stdout.write(message + "\n")
-                sys.stdout.flush()
+        stages = self._startup_stages()
+        completed = []
 
-            def activate_siren():
-                # Activate siren
-                if self.siren:
-                    self.siren.activate()
-                # Activate all alarms using Alarm class (ring all alarms)
-                print(f"[System] Activating {len(self.alarms)} Alarm instance(s)...")
-                for alarm in self.alarms:
-                    if alarm:
-                        alarm.ring_alarm(True)
-                        print(f"[System] Alarm {alarm.get_id()} at {alarm.get_location()} is now ringing.")
-                print("[SecuritySystem] Siren activated - Alarm is sounding!")
-                import sys
-                sys.stdout.write("[SecuritySystem] Siren activated - Alarm is sounding!\n")
-                sys.stdout.flush()
+        def on_stage_done(name: str, seconds: float) -> None:
+            completed.append(name)
+            if progress:
+                try:
+                    progress(name, len(completed) / len(stages))
+                except Exception as progress_error:
+                    print(f"[System] Startup progress callback error: {progress_error}")
 
-            def deactivate_siren():
-                # Deactivate siren
-                if self.siren:
-                    self.siren.deactivate()
-                # Deactivate all alarms using Alarm class (silence all alarms)
-                print(f"[System] Deactivating {len(self.alarms)} Alarm instance(s)...")
-                for alarm in self.alarms:
-                    if alarm:
-                        alarm.ring_alarm(False)
-                        print(f"[System] Alarm {alarm.get_id()} at {alarm.get_location()} is now silenced.")
+        try:
+            timings = StagedStartup(stages).run(on_stage_done)
 
-            def get_monitored_sensors_state():
-                states = {}
-                for sensor in self.sensors:
-                    get_id = getattr(sensor, "get_id", None)
-                    get_status = getattr(sensor, "get_status", None)
-                    if not get_id or not get_status:
-                        continue
-                    raw_status = get_status()
-                    if raw_status == STATE_OPEN:
-                        mapped = SensorStatus.OPEN
-                    elif raw_status == STATE_DETECTED:
-                        mapped = SensorStatus.MOTION_DETECTED
-                    else:
-                        mapped = SensorStatus.NORMAL
-                    states[get_id()] = mapped
-                return states
-
-            self.security_system = SecuritySystem(
-                get_delay_time=get_delay_time,
-                call_monitoring_service=call_monitoring_service,
-                activate_siren=activate_siren,
-                deactivate_siren=deactivate_siren,
-                get_monitored_sensors_state=get_monitored_sensors_state,
-                camera_gateway=self.camera_gateway,
-            )
-            self.configuration_manager.configure_security_system(self.security_system)
+            # 모든 단계가 끝난 뒤 호출 스레드에서 마무리 (UI 리스너 연결은 Tk 스레드에서)
             self._attach_security_listener()
-
-            # 4. LoginManager ???
-            self.login_manager = LoginManager()
-
-            # 5. LogManager ???
-            self.log_manager = LogManager()
-
-            # 6. SystemController ??? (?? ?? ??)
-            self.system_controller = SystemController(
-                security_system=self.security_system,
-                ui_app=self.ui_app
-            )
-
-            # 6. CameraController 초기화
-            self.camera_controller = CameraController()
-
-            # 7. 기본 관리자 계정 생성 (없으면)
-            self._initialize_default_user()
+            if self.motion_analysis:
+                self.camera_controller.enable_motion_analysis(
+                    MotionAnalyzer(on_motion=self.system_controller.handle_sensor_event)
+                )
             self._refresh_services()
 
             # 시스템 시작 로그
@@ -322,8 +326,13 @@ class System:
                 description="SafeHome system started successfully"
             )
 
+            self.startup_timings = {name: seconds * 1000 for name, seconds in timings.items()}
+            self.startup_timings['total'] = (time.perf_counter() - started) * 1000
             self.system_state = SystemState.READY
-            print("[System] SafeHome system is now READY.")
+            print(f"[System] SafeHome system is now READY ({self.startup_timings['total']:.0f} ms).")
+            print("[System] Startup stages (ms): " + ", ".join(
+                f"{name} {ms:.1f}" for name, ms in self.startup_timings.items()
+                if name != 'total'))
 
             # turn_on 완료 콜백 호출 (디바이스 초기화 등)
             if self.on_turn_on_complete:
@@ -336,18 +345,148 @@ class System:
 
         except Exception as e:
             print(f"[System] Failed to start system: {e}")
+            # 실패 전에 끝난 단계가 시작한 카메라 샘플링 스레드를 정리
+            if self.camera_controller and hasattr(self.camera_controller, 'shutdown_capture'):
+                self.camera_controller.shutdown_capture()
             self.system_state = SystemState.OFF
             return False
 
+    def _startup_stages(self) -> List[StartupStage]:
+        """turn_on 초기화 단계와 의존 관계"""
+        return [
+            StartupStage("storage", self._start_storage),
+            StartupStage("camera_assets", CameraController.preload_camera_assets),
+            StartupStage("camera_controller", self._start_camera_controller),
+            StartupStage("configuration", self._start_configuration, after=("storage",)),
+            StartupStage("login_manager", self._start_login_manager, after=("storage",)),
+            StartupStage("log_manager", self._start_log_manager, after=("storage",)),
+            StartupStage("security", self._start_security_system, after=("configuration",)),
+            StartupStage("system_controller", self._start_system_controller, after=("security",)),
+            StartupStage("default_user", self._initialize_default_user, after=("login_manager",)),
+        ]
+
+    def _start_storage(self) -> None:
+        self.storage_manager = StorageManager()
+        if not self.storage_manager.connect():
+            raise Exception("Failed to connect to database.")
+
+    def _start_configuration(self) -> None:
+        self.configuration_manager = ConfigurationManager()
+        self.configuration_manager.initialize_configuration()
+
+    def _start_login_manager(self) -> None:
+        self.login_manager = LoginManager()
+
+    def _start_log_manager(self) -> None:
+        self.log_manager = LogManager()
+
+    def _start_system_controller(self) -> None:
+        self.system_controller = SystemController(
+            security_system=self.security_system,
+            ui_app=self.ui_app
+        )
+
+    def _start_camera_controller(self) -> None:
+        self.camera_controller = CameraController()
+        self.camera_controller.enable_pre_alarm_capture(EVENT_CLIP_DIR)
+        self.camera_controller.attach_recording_store(RecordingStore(RECORDING_SEGMENT_DIR))
+
+    def _start_security_system(self) -> None:
+        """Siren, Alarm, SecuritySystem 생성 및 구성 연결"""
+        self.siren = Siren("MainSiren")
+
+        # Initialize Alarm instances (composition: System has multiple Alarms)
+        from security.security_system import Alarm
+        # Create default alarms - can be configured later
+        self.alarms = [
+            Alarm(alarm_id=1, x_coord=100, y_coord=100),  # Main alarm
+            Alarm(alarm_id=2, x_coord=200, y_coord=200),  # Secondary alarm
+        ]
+        self._create_security_system()
+
+    def _create_security_system(self) -> None:
+        """현재 Siren/Alarm을 사용하는 새 SecuritySystem(상태 머신)을 만들고 구성 연결"""
+        def get_delay_time():
+            settings = self.configuration_manager.get_system_setting()
+            delay_seconds = max(settings.get_alarm_delay_time(), 0)
+            return timedelta(seconds=delay_seconds)
+
+        def call_monitoring_service(reason: str):
+            message = f"[SecuritySystem] Monitoring service notified: {reason}"
+            print(message)
+            import sys
+            sys.stdout.write(message + "\n")
+            sys.stdout.flush()
+
+        def activate_siren():
+            with TRACER.span("system.activate_siren", alarms=len(self.alarms)):
+                # Activate siren
+                if self.siren:
+                    self.siren.activate()
+                # Activate all alarms using Alarm class (ring all alarms)
+                print(f"[System] Activating {len(self.alarms)} Alarm instance(s)...")
+                for alarm in self.alarms:
+                    if alarm:
+                        alarm.ring_alarm(True)
+                        print(f"[System] Alarm {alarm.get_id()} at {alarm.get_location()} is now ringing.")
+            print("[SecuritySystem] Siren activated - Alarm is sounding!")
+            import sys
+            sys.stdout.write("[SecuritySystem] Siren activated - Alarm is sounding!\n")
+            sys.stdout.flush()
+
+        def deactivate_siren():
+            # Deactivate siren
+            if self.siren:
+                self.siren.deactivate()
+            # Deactivate all alarms using Alarm class (silence all alarms)
+            print(f"[System] Deactivating {len(self.alarms)} Alarm instance(s)...")
+            for alarm in self.alarms:
+                if alarm:
+                    alarm.ring_alarm(False)
+                    print(f"[System] Alarm {alarm.get_id()} at {alarm.get_location()} is now silenced.")
+
+        def get_monitored_sensors_state():
+            states = {}
+            for sensor in self.sensors:
+                get_id = getattr(sensor, "get_id", None)
+                get_status = getattr(sensor, "get_status", None)
+                if not get_id or not get_status:
+                    continue
+                raw_status = get_status()
+                if raw_status == STATE_OPEN:
+                    mapped = SensorStatus.OPEN
+                elif raw_status == STATE_DETECTED:
+                    mapped = SensorStatus.MOTION_DETECTED
+                else:
+                    mapped = SensorStatus.NORMAL
+                states[get_id()] = mapped
+            return states
+
+        self.security_system = SecuritySystem(
+            get_delay_time=get_delay_time,
+            call_monitoring_service=call_monitoring_service,
+            activate_siren=activate_siren,
+            deactivate_siren=deactivate_siren,
+            get_monitored_sensors_state=get_monitored_sensors_state,
+            camera_gateway=self.camera_gateway,
+            latency_recorder=record_security_event,
+            tracer=TRACER,
+        )
+        self.configuration_manager.configure_security_system(self.security_system)
+        self.configuration_manager.get_system_setting().add_change_listener(
+            self._on_settings_changed
+        )
+
     # ========================================
     # Common Function 5: Turn the system off
     # ========================================
-    def turn_off(self) -> bool:
+    def turn_off(self, keep_event_stream: bool = False) -> bool:
         """
         시스템 종료
         모든 컴포넌트를 안전하게 종료
         Sequence: Save Config -> Deactivate Sensors -> Disable Cameras ->
-                  Deactivate Alarm -> Logout -> Log Event -> Disconnect DB
+                  Deactivate Alarm -> Logout -> Log Event -> Disconnect DB -> Close SSE stream
+        :param keep_event_stream: True이면 SSE 스트림을 닫지 않음 (reset에서 클라이언트 연결 유지용)
         """
         if self.system_state == SystemState.OFF:
             print("[System] System is already off.")
@@ -360,8 +499,12 @@ class System:
             # 1. 설정 저장 (Save Configuration)
             if self.configuration_manager:
                 settings = self.configuration_manager.get_system_setting()
-                self.configuration_manager.update_system_settings(settings)
-                print("[System] Configuration saved.")
+                if hasattr(settings, 'remove_change_listener'):
+                    settings.remove_change_listener(self._on_settings_changed)
+                # 바뀐 값이 없으면 저장을 건너뛴다.
+                if not hasattr(settings, 'is_dirty') or settings.is_dirty():
+                    self.configuration_manager.update_system_settings(settings)
+                    print("[System] Configuration saved.")
 
             # 2. 센서 비활성화 (Deactivate Sensors)
             if self.sensors:
@@ -373,6 +516,8 @@ class System:
             # 3. 카메라 비활성화 (Disable All Cameras)
             if self.camera_controller:
                 self.camera_controller.disable_all_camera()
+                if hasattr(self.camera_controller, 'shutdown_capture'):
+                    self.camera_controller.shutdown_capture()
                 print("[System] All cameras disabled.")
 
             # Also deactivate cameras through system_controller if available
@@ -421,26 +566,44 @@ class System:
             print(f"[System] Error during shutdown: {e}")
             self.system_state = SystemState.OFF
             return False
+        finally:
+            # 8. SSE 스트림 종료 - 대기 중인 /api/security/events 응답을 끝낸다.
+            if not keep_event_stream:
+                self.security_event_stream.close()
 
     # ========================================
     # Common Function 6: Reset the system
     # ========================================
-    def reset(self) -> dict:
+    def reset(self, warm: bool = False) -> dict:
         """
         시스템 재시작 (Reset = Turn Off + Turn On)
         설정을 유지하면서 모든 컴포넌트를 재생성
 
+        warm=True이면 종료/재시작 없이 상태 머신(SecuritySystem, 로그인 상태)만 새로 만들고
+        설정을 다시 로드한다. DB 연결, 디코딩된 카메라 이미지, 센서/카메라 객체는 유지한다.
+
         Returns:
-            dict: {'success': bool, 'message': str, 'phase': int (optional)}
+            dict: {'success': bool, 'message': str, 'phase': int (optional),
+                   'mode': 'warm' | 'cold', 'duration_ms': float}
         """
+        started = time.perf_counter()
+
         # 전제조건: 시스템이 켜져 있어야 함
         if self.system_state == SystemState.OFF:
             print("[System] Cannot reset: System is not running.")
-            return {
+            return self._reset_result({
                 'success': False,
                 'message': 'Cannot reset: System is not running',
                 'phase': 0
-            }
+            }, 'warm' if warm else 'cold', started)
+
+        if warm:
+            result = self._warm_reset()
+            if result is not None:
+                result = self._reset_result(result, 'warm', started)
+                print(f"[System] Warm reset took {result['duration_ms']:.0f} ms.")
+                return result
+            print("[System] Warm reset failed; falling back to a full reset.")
 
         print("[System] Resetting SafeHome system...")
         print("[System] Phase 1: Turning off...")
@@ -456,16 +619,16 @@ class System:
         # Phase 1: Turn Off the System
         # ========================================
         # turn_off()에서 설정 저장, 센서 비활성화, 카메라 비활성화,
-        # 로그아웃, DB 연결 종료가 수행됨
-        turn_off_result = self.turn_off()
+        # 로그아웃, DB 연결 종료가 수행됨 (SSE 클라이언트는 연결 유지)
+        turn_off_result = self.turn_off(keep_event_stream=True)
 
         if not turn_off_result:
             print("[System] Reset failed: Could not turn off system (Phase 1)")
-            return {
+            return self._reset_result({
                 'success': False,
                 'message': 'Reset failed: Could not turn off system',
                 'phase': 1
-            }
+            }, 'cold', started)
 
         print("[System] Phase 1 complete: System turned off")
 
@@ -483,12 +646,12 @@ class System:
         if not turn_on_result:
             print("[System] Reset failed: Could not turn on system (Phase 2)")
             print("[System] WARNING: System remains in OFF state")
-            return {
+            return self._reset_result({
                 'success': False,
                 'message': 'Reset failed: Could not turn on system. System is OFF.',
                 'phase': 2,
                 'state': 'OFF'
-            }
+            }, 'cold', started)
 
         print("[System] Phase 2 complete: System turned on")
 
@@ -505,18 +668,85 @@ class System:
         print("[System] SafeHome system reset successfully.")
         print("[System] All settings preserved, all components recreated.")
 
+        result = self._reset_result({
+            'success': True,
+            'message': 'System reset successfully',
+            'phase': 3
+        }, 'cold', started)
+        print(f"[System] Reset took {result['duration_ms']:.0f} ms.")
+        return result
+
+    @staticmethod
+    def _reset_result(result: dict, mode: str, started: float) -> dict:
+        """reset() 결과에 공통 필드(mode, duration_ms)를 채운다 - 실패 결과 포함"""
+        result['mode'] = mode
+        result['duration_ms'] = (time.perf_counter() - started) * 1000
+        return result
+
+    def _warm_reset(self) -> Optional[dict]:
+        """
+        연결과 캐시를 유지하는 리셋
+        :return: 결과 딕셔너리, 실패하면 None (호출자가 전체 리셋으로 전환)
+        """
+        print("[System] Warm-resetting SafeHome system...")
+        try:
+            if self.log_manager:
+                self.log_manager.log_event(
+                    event_type="SYSTEM_RESET_START",
+                    description="Warm system reset initiated"
+                )
+
+            # 1. 설정 저장 후 다시 로드 (바뀐 값이 없으면 저장하지 않음)
+            settings = self.configuration_manager.get_system_setting()
+            if settings.is_dirty():
+                self.configuration_manager.update_system_settings(settings)
+            self.configuration_manager.initialize_configuration()
+            self.configuration_manager.invalidate_sensor_snapshot()
+
+            # 2. 알람 해제 및 사용자 로그아웃
+            if self.siren:
+                self.siren.deactivate()
+            for alarm in self.alarms:
+                if alarm:
+                    alarm.ring_alarm(False)
+            if self.login_manager and self.login_manager.is_user_authenticated():
+                self.logout()
+
+            # 3. 상태 머신 재생성 (SecuritySystem) - 센서/카메라 객체는 그대로 둔다
+            if self.security_system:
+                self.security_system.set_event_listener(None)
+            self._create_security_system()
+            self._attach_security_listener()
+            if self.system_controller:
+                self.system_controller.security_system = self.security_system
+                self.system_controller.authenticated_user = None
+            if self.camera_controller:
+                self.camera_controller.enable_all_camera()
+
+            self.system_state = SystemState.READY
+            if self.log_manager:
+                self.log_manager.log_event(
+                    event_type="SYSTEM_RESET_COMPLETE",
+                    description="Warm system reset completed successfully"
+                )
+        except Exception as e:
+            print(f"[System] Warm reset error: {e}")
+            return None
+
+        print("[System] SafeHome system warm-reset successfully.")
         return {
             'success': True,
             'message': 'System reset successfully',
             'phase': 3
         }
 
-    def reset_simple(self) -> bool:
+    def reset_simple(self, warm: bool = False) -> bool:
         """
         간단한 리셋 (하위 호환용)
+        :param warm: 연결/캐시를 유지하는 warm 리셋 사용 여부
         :return: 성공 여부
         """
-        result = self.reset()
+        result = self.reset(warm=warm)
         return result['success']
 
     # ========================================
@@ -743,6 +973,113 @@ class System:
             'security_mode': self.security_system.mode.name if self.security_system else None
         }
 
+    # ========================================
+    # 센서 목록 및 device_id 인덱스
+    # ========================================
+    @property
+    def sensors(self) -> List:
+        return self._sensors
+
+    @sensors.setter
+    def sensors(self, sensors: List):
+        """
+        센서 목록 교체 (SystemBootstrapper 등) 후 인덱스 재구성
+        목록 객체는 그대로 두고 내용만 바꾸므로 system.sensors를 받아 둔 UI와 계속 공유된다.
+        """
+        replacement = list(sensors or ())
+        list.clear(self._sensors)
+        list.extend(self._sensors, replacement)
+        self._rebuild_sensor_index()
+
+    def get_sensor(self, device_id: str):
+        """
+        device_id로 센서 조회 (O(1))
+        :param device_id: 센서 ID
+        :return: 센서 객체 또는 None
+        """
+        index = self._sensor_index
+        if index is None:
+            # 목록이 바뀐 뒤 첫 조회에서 한 번만 재구성
+            index = self._rebuild_sensor_index()
+        return index.get(device_id)
+
+    def add_sensor(self, sensor) -> bool:
+        """
+        센서 추가 (목록, 인덱스, 컨트롤러 옵저버, 장치 DB 갱신)
+        :param sensor: get_id()/get_type()을 가진 센서 객체
+        :return: 성공 여부 (같은 ID가 이미 있으면 False)
+        """
+        device_id = sensor.get_id()
+        if self.get_sensor(device_id) is not None:
+            print(f"[System] Sensor {device_id} already exists.")
+            return False
+        self._sensors.append(sensor)
+
+        if self.system_controller and hasattr(sensor, "add_observer"):
+            sensor.add_observer(self.system_controller)
+        device_manager = getattr(self.configuration_manager, "device_manager", None)
+        if device_manager:
+            device_manager.add_device(device_id, sensor.get_type())
+        return True
+
+    def remove_sensor(self, device_id: str) -> bool:
+        """
+        센서 제거 (목록, 인덱스, 장치 DB 갱신)
+        :param device_id: 센서 ID
+        :return: 성공 여부
+        """
+        sensor = self.get_sensor(device_id)
+        if sensor is None:
+            return False
+        self._sensors.remove(sensor)
+
+        device_manager = getattr(self.configuration_manager, "device_manager", None)
+        if device_manager:
+            device_manager.remove_device(device_id)
+        return True
+
+    def _index_added_sensor(self, sensor):
+        """목록 끝에 추가된 센서 하나만 인덱스에 반영 (O(1))"""
+        get_id = getattr(sensor, "get_id", None)
+        if self._sensor_index is None or not get_id:
+            return
+        device_id = get_id()
+        if device_id in self._sensor_index:
+            # 중복 ID는 첫 번째 센서 우선 - 제거 시 전체 재구성이 필요함을 기록
+            self._duplicate_sensor_ids.add(device_id)
+        else:
+            self._sensor_index[device_id] = sensor
+
+    def _unindex_removed_sensor(self, sensor):
+        """제거된 센서 하나만 인덱스에서 삭제 (O(1))"""
+        get_id = getattr(sensor, "get_id", None)
+        if self._sensor_index is None or not get_id:
+            return
+        device_id = get_id()
+        if device_id in self._duplicate_sensor_ids:
+            self._invalidate_sensor_index()
+        elif self._sensor_index.get(device_id) is sensor:
+            del self._sensor_index[device_id]
+
+    def _invalidate_sensor_index(self):
+        self._sensor_index = None
+
+    def _rebuild_sensor_index(self) -> Dict[str, object]:
+        index: Dict[str, object] = {}
+        duplicates = set()
+        for sensor in self._sensors:
+            get_id = getattr(sensor, "get_id", None)
+            if get_id:
+                device_id = get_id()
+                # 중복 ID는 기존 선형 탐색과 같이 첫 번째 센서 우선
+                if device_id in index:
+                    duplicates.add(device_id)
+                else:
+                    index[device_id] = sensor
+        self._sensor_index = index
+        self._duplicate_sensor_ids = duplicates
+        return index
+
     def set_ui(self, ui_app):
         """UI ?? ??"""
         self.ui_app = ui_app
@@ -751,12 +1088,15 @@ class System:
         self._attach_security_listener()
 
     def _attach_security_listener(self):
-        """Create or update the Tkinter listener for security events."""
-        if not (self.security_system and self.ui_app):
+        """Route security events to the SSE stream and, if present, the Tkinter UI."""
+        if not self.security_system:
             return
-        from ui.main_window import TkSecurityListener
-        self.security_listener = TkSecurityListener(self.ui_app)
-        self.security_system.set_event_listener(self.security_listener)
+        listeners = [self.security_event_stream]
+        if self.ui_app:
+            from ui.main_window import TkSecurityListener
+            self.security_listener = TkSecurityListener(self.ui_app)
+            listeners.append(self.security_listener)
+        self.security_system.set_event_listener(CompositeSecurityListener(listeners))
 
     def _get_auth_service(self) -> Optional[AuthService]:
         if not self._auth_service and self.login_manager and self.log_manager:
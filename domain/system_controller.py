@@ -7,6 +7,7 @@ from domain.user_manager import UserManager
 from security.events import SensorEvent, SensorStatus, SensorType
 from security.security_system import SecurityMode, SecuritySystem
 from utils.constants import MODE_AWAY, MODE_DISARMED, MODE_STAY
+from utils.tracing import TRACER
 
 
 class SystemController:
@@ -142,10 +143,30 @@ class SystemController:
             status=sensor_status_enum,
             timestamp=datetime.utcnow(),
         )
-        self.security_system.handle_sensor_event(event)
+        with TRACER.span("controller.update_sensor_status", device_id=device_id, status=status):
+            self.security_system.handle_sensor_event(event)
         if self.ui_app:
             self.ui_app.add_log(f"Sensor {device_id} -> {status}")
 
+    def handle_sensor_event(self, event: SensorEvent) -> None:
+        """Forward an already-built domain event (e.g. camera motion analysis)."""
+        print(f"[Controller] Sensor event: {event.sensor_id} ({event.sensor_type.name}) -> {event.status.name}")
+        with TRACER.span("controller.handle_sensor_event", device_id=event.sensor_id,
+                         status=event.status.name):
+            self.security_system.handle_sensor_event(event)
+        if self.ui_app:
+            # 카메라 샘플링 스레드에서 호출되므로 Tk 호출은 UI 스레드로 넘긴다.
+            self._run_on_ui(self.ui_app.add_log, f"Sensor {event.sensor_id} -> {event.status.name}")
+
+    def _run_on_ui(self, callback, *args) -> None:
+        # Tk의 after()도 다른 스레드에서 부르면 안전하지 않으므로, UI가 제공하는
+        # 큐에 넣고 Tk 스레드가 직접 비우게 한다. 큐가 없는 UI(헤드리스 등)는 바로 호출.
+        ui_queue = getattr(self.ui_app, "ui_queue", None)
+        if ui_queue is None:
+            callback(*args)
+            return
+        ui_queue.post(callback, *args)
+
     def trigger_camera(self, trigger_source):
         """침입 발생 시 모든 카메라 촬영"""
         for cam in self.cameras:
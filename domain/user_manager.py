@@ -2,27 +2,33 @@
 # This module is now deprecated. Use auth.login_manager instead.
 # Kept for backward compatibility with SystemController.
 
-import sqlite3
-from utils.constants import DB_FILE
+from typing import Optional
+
+from auth.password_hashing import PASSWORD_VERIFIER, PasswordVerifierBusy
+from storage.storage_manager import StorageManager
+
+# 같은 SQL 문자열을 계속 쓰면 sqlite3 연결의 statement 캐시에서 준비된 문장이 재사용된다.
+_PASSWORDS_FOR_USER_SQL = "SELECT password FROM users WHERE user_id = ?"
+
 
 class UserManager:
-    def __init__(self):
-        self.conn = sqlite3.connect(DB_FILE, check_same_thread=False)
-        self.cursor = self.conn.cursor()
-        # Do not initialize DB here, as StorageManager handles schema
+    def __init__(self, storage: Optional[StorageManager] = None):
+        # 별도 연결을 열지 않고 공유 StorageManager 연결을 사용한다.
+        self.storage = storage or StorageManager()
 
     def authenticate(self, user_id, password):
         """
         사용자 인증 로직 (기존 호환성 유지)
         새로운 스키마와 호환되도록 수정
         """
+        rows = self.storage.execute_query(_PASSWORDS_FOR_USER_SQL, (user_id,))
+        if not rows:
+            return False
+        # 비밀번호는 솔트 해시(또는 마이그레이션 전 평문)로 저장되므로 SQL에서 비교할 수 없다.
         try:
-            self.cursor.execute("SELECT * FROM users WHERE user_id=? AND password=?", (user_id, password))
-            result = self.cursor.fetchone()
-            return result is not None
-        except sqlite3.Error as e:
-            print(f"[UserManager] Authentication error: {e}")
+            return any(PASSWORD_VERIFIER.verify(password, row['password']) for row in rows)
+        except PasswordVerifierBusy:
             return False
 
     def close(self):
-        self.conn.close()
\ No newline at end of file
+        """하위 호환용 - 공유 연결은 StorageManager가 관리하므로 닫지 않는다."""
@@ -7,6 +7,7 @@ from typing import List, Optional
 from datetime import datetime
 from event_logging.log import Log
 from storage.storage_manager import StorageManager
+from utils.tracing import TRACER
 
 
 class LogManager:
@@ -39,7 +40,8 @@ class LogManager:
             log.get_interface_type() or 'control_panel',
         )
 
-        rows = self._execute_with_retry(sql, params)
+        with TRACER.span("log_manager.save_log", event_type=log.get_event_type()):
+            rows = self._execute_with_retry(sql, params)
 
         if rows > 0:
             log.set_event_id(self.storage.get_last_insert_id())
@@ -49,6 +51,46 @@ class LogManager:
         print("[LogManager] Failed to save log.")
         return False
 
+    def save_logs(self, logs: List[Log]) -> int:
+        """
+        여러 로그를 하나의 트랜잭션으로 저장 (executemany)
+        :param logs: Log 객체 리스트
+        :return: 저장된 로그 수 (실패 시 0, 전체 롤백)
+        """
+        if not logs:
+            return 0
+        sql = """
+            INSERT INTO event_logs (event_datetime, event_type, description, user_id, interface_type)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        params = [
+            (
+                log.get_date_time().strftime('%Y-%m-%d %H:%M:%S'),
+                log.get_event_type(),
+                log.get_description(),
+                log.get_user_id(),
+                log.get_interface_type() or 'control_panel',
+            )
+            for log in logs
+        ]
+        try:
+            with TRACER.span("log_manager.save_logs", count=len(logs)):
+                with self.storage.transaction() as cursor:
+                    cursor.executemany(sql, params)
+                    cursor.execute("SELECT last_insert_rowid()")
+                    last_id = cursor.fetchone()[0]
+        except sqlite3.Error as exc:
+            print(f"[LogManager] Failed to save {len(logs)} logs: {exc}")
+            return 0
+
+        # AUTOINCREMENT ids of one executemany are consecutive.
+        first_id = last_id - len(logs) + 1
+        for offset, log in enumerate(logs):
+            log.set_event_id(first_id + offset)
+        self.logs_cache.extend(logs)
+        print(f"[LogManager] {len(logs)} logs saved.")
+        return len(logs)
+
     def _execute_with_retry(self, sql: str, params: tuple, attempts: int = 2) -> int:
         """Try the SQL update up to `attempts` times, reconnecting after the first failure."""
         last_rows = -1
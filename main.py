@@ -1,21 +1,36 @@
+import time
+
+# Taken before the heavier imports so headless startup can report them too.
+_MODULE_IMPORT_STARTED = time.perf_counter()
+
+import argparse
+import hmac
+import math
 import threading
-import tkinter as tk
 import os
+import zlib
+from typing import Optional, Tuple
 from flask import (
-    Flask, render_template, request, jsonify, session, redirect, url_for
+    Flask, Response, render_template, request, jsonify, session, redirect, url_for
 )
 
 from devices.camera import Camera
 from devices.motion_detector import MotionDetector
 from devices.windoor_sensor import WindowDoorSensor
 from domain.system import System
-from ui.main_window import SafeHomeApp
+from auth.login_throttle import LoginThrottle
+from auth.session_store import ServerSideSessionInterface, SessionStore
 from utils.constants import (
     MODE_AWAY, MODE_DISARMED, MODE_STAY, VIRTUAL_DEVICE_DIR,
     SENSOR_WIN_DOOR, SENSOR_MOTION, SENSOR_CAMERA, STATE_CLEAR,
     STATE_OPEN, STATE_CLOSED, STATE_DETECTED
 )
 from domain.services.bootstrap_service import SystemBootstrapper
+from config.web_server_config import SERVER_DEVELOPMENT, SERVER_PRODUCTION, WebServerConfig
+from security.event_stream import format_sse
+from utils.metrics import install_flask_metrics
+from utils.tracing import TRACER
+from utils.response_middleware import ResponseMiddleware
 
 app = Flask(
     __name__,
@@ -23,7 +38,35 @@ app = Flask(
     static_url_path='/static'
 )
 app.secret_key = os.urandom(24)  # 세션 암호화 키
+# 세션 데이터는 서버(SQLite + 메모리 LRU)에 두고 쿠키에는 세션 ID만 보낸다.
+session_store = SessionStore()
+app.session_interface = ServerSideSessionInterface(session_store)
+# 라우트별 지연/상태 코드 계측 (/metrics). 압축 시간까지 포함되도록 먼저 등록한다.
+# /metrics는 웹 로그인 세션 또는 SAFEHOME_METRICS_TOKEN Bearer 토큰(스크레이퍼용)이 있어야 조회 가능
+install_flask_metrics(app, authorize=lambda: _authorize_metrics())
+# ETag/304 처리와 gzip·brotli 응답 압축
+ResponseMiddleware(app)
 safehome_system = None
+# /api/login/* 앞단의 IP·사용자별 시도 제한 (SQL 실행 전에 거부)
+login_throttle = LoginThrottle()
+
+
+def _throttled_login_response(username: Optional[str]):
+    """제한을 넘은 로그인 시도면 429 응답을, 허용되면 None을 반환"""
+    retry_after = login_throttle.check(request.remote_addr, username)
+    if retry_after <= 0:
+        return None
+    seconds = max(1, math.ceil(retry_after))
+    response = jsonify({
+        'success': False,
+        'message': f'Too many login attempts. Please try again in {seconds} seconds.',
+        'throttled': True,
+        'retry_after': seconds
+    })
+    response.status_code = 429
+    response.headers['Retry-After'] = str(seconds)
+    return response
+
 
 @app.route('/')
 def home():
@@ -59,6 +102,10 @@ def validate_first_password():
                 'message': 'Username and password are required'
             }), 400
 
+        throttled = _throttled_login_response(username)
+        if throttled is not None:
+            return throttled
+
         # 시스템이 초기화되지 않았거나 켜지지 않은 경우
         if not safehome_system:
             return jsonify({
@@ -102,6 +149,13 @@ def validate_first_password():
             'web_browser'
         )
 
+        if result.get('busy'):
+            # 비밀번호 검증 풀 포화 - 실패로 기록하지 않고 재시도를 안내
+            response = jsonify(result)
+            response.status_code = 503
+            response.headers['Retry-After'] = '1'
+            return response
+
         if result['success']:
             # 세션에 임시 저장 (First password 검증 완료)
             session['temp_username'] = username
@@ -171,6 +225,10 @@ def validate_second_password():
                 'message': 'Second password is required'
             }), 400
 
+        throttled = _throttled_login_response(username)
+        if throttled is not None:
+            return throttled
+
         # 시스템이 초기화되지 않았거나 켜지지 않은 경우
         if not safehome_system:
             return jsonify({
@@ -227,12 +285,21 @@ def validate_second_password():
             'web_browser'
         )
 
+        if result.get('busy'):
+            # 비밀번호 검증 풀 포화 - 실패로 기록하지 않고 재시도를 안내
+            response = jsonify(result)
+            response.status_code = 503
+            response.headers['Retry-After'] = '1'
+            return response
+
         if result['success']:
             # 로그인 성공 - 세션 설정
             session['logged_in'] = True
             session['username'] = username
             session.pop('temp_username', None)
             session.pop('first_validated', None)
+            # 로그인 전 세션 ID를 재사용하지 않도록 새 ID 발급
+            session.regenerate()
 
             # 이벤트 로그
             if safehome_system.log_manager:
@@ -523,6 +590,9 @@ def status():
     return "System offline <a href='/'>Back</a>"
 
 
+METRICS_TOKEN_ENV = 'SAFEHOME_METRICS_TOKEN'
+
+
 def _require_api_login():
     if not session.get('logged_in'):
         return jsonify({
@@ -532,6 +602,17 @@ def _require_api_login():
     return None
 
 
+def _authorize_metrics():
+    """/metrics 접근 허용 여부 - 로그인 세션 또는 설정된 Bearer 토큰"""
+    token = os.environ.get(METRICS_TOKEN_ENV)
+    if token:
+        header = request.headers.get('Authorization', '')
+        scheme, _, supplied = header.partition(' ')
+        if scheme.lower() == 'bearer' and hmac.compare_digest(supplied.encode(), token.encode()):
+            return None
+    return _require_api_login()
+
+
 def _security_instance():
     if safehome_system and getattr(safehome_system, "security_system", None):
         return safehome_system.security_system
@@ -623,6 +704,96 @@ def api_security_intrusions():
     return jsonify({'success': True, 'intrusions': payload}), 200
 
 
+SSE_KEEPALIVE_SECONDS = 15
+SSE_RETRY_MILLISECONDS = 3000
+# Each response ends after this long; the client reconnects after the retry
+# delay and resumes from Last-Event-ID, so no worker thread is held forever.
+SSE_MAX_STREAM_SECONDS = 300
+
+
+def _parse_last_event_id():
+    raw = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        return int(raw) if raw is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@app.route('/api/traces', methods=['GET'])
+def api_traces():
+    """최근 trace 목록 (센서 이벤트 처리 경로의 스팬 포함)"""
+    auth_error = _require_api_login()
+    if auth_error:
+        return auth_error
+
+    try:
+        limit = int(request.args.get('limit', 20))
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'message': 'limit must be numeric'}), 400
+    limit = max(1, min(limit, 200))
+    return jsonify({'success': True, 'traces': TRACER.recent_traces(limit)}), 200
+
+
+@app.route('/api/traces/<trace_id>', methods=['GET'])
+def api_trace_detail(trace_id: str):
+    """trace id 하나의 스팬 목록"""
+    auth_error = _require_api_login()
+    if auth_error:
+        return auth_error
+
+    spans = TRACER.get_trace(trace_id)
+    if not spans:
+        return jsonify({'success': False, 'message': 'Trace not found (it may have been evicted)'}), 404
+    return jsonify({'success': True, 'trace_id': trace_id, 'spans': spans}), 200
+
+
+@app.route('/api/security/events', methods=['GET'])
+def api_security_events():
+    """Server-Sent Events stream of security status changes, intrusions and alarms."""
+    auth_error = _require_api_login()
+    if auth_error:
+        return auth_error
+
+    stream = getattr(safehome_system, 'security_event_stream', None) if safehome_system else None
+    if stream is None or stream.closed:
+        return jsonify({
+            'success': False,
+            'message': 'Security event stream not available'
+        }), 503
+
+    last_event_id = _parse_last_event_id()
+    resume = last_event_id is not None and stream.is_resumable(last_event_id)
+    # Read the cursor before the snapshot: anything published in between is
+    # sent again rather than lost.
+    cursor = last_event_id if resume else stream.last_event_id
+    snapshot = None
+    if not resume:
+        snapshot, _ = _build_security_status_payload()
+
+    def generate(cursor):
+        deadline = time.monotonic() + SSE_MAX_STREAM_SECONDS
+        yield f"retry: {SSE_RETRY_MILLISECONDS}\n\n"
+        if snapshot is not None:
+            yield format_sse(cursor, 'status', snapshot)
+        while not stream.closed:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            events = stream.wait_for_events(cursor, timeout=min(SSE_KEEPALIVE_SECONDS, remaining))
+            if not events:
+                yield ": keepalive\n\n"
+                continue
+            for event in events:
+                yield event.frame
+                cursor = event.event_id
+
+    return Response(
+        generate(cursor),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
 @app.route('/api/security/arm', methods=['POST'])
 def api_security_arm():
     auth_error = _require_api_login()
@@ -735,81 +906,32 @@ def api_security_panic():
 
 
 def _serialize_zones(config):
-    zones = config.refresh_safety_zones()
-    assignments = config.list_sensor_assignments()
-    counts = {}
-    for zone_id in assignments.values():
-        counts[zone_id] = counts.get(zone_id, 0) + 1
+    return [dict(zone) for zone in config.get_sensor_snapshot().zones]
 
-    payload = []
-    for zone in zones:
-        payload.append({
-            'zone_id': zone.zone_id,
-            'zone_name': zone.zone_name,
-            'is_armed': zone.is_armed,
-            'sensor_count': counts.get(zone.zone_id, 0),
-        })
-    return payload
+
+def _sensor_status(device_id):
+    """Live status from the in-memory sensor objects (no database access)."""
+    sensor = safehome_system.get_sensor(device_id) if safehome_system else None
+    if sensor is None or not hasattr(sensor, 'get_status'):
+        return "Unknown"
+    try:
+        return sensor.get_status() or "Unknown"
+    except Exception:
+        return "Unknown"
 
 
-def _serialize_sensors(config):
+def _serialize_sensors(config, snapshot=None):
     try:
-        print("[Flask] _serialize_sensors: Starting...")
         if not hasattr(config, 'device_manager') or not config.device_manager:
             print("[Flask] Device manager not available in config")
             return []
-        
-        print("[Flask] Calling device_manager.load_all_devices()...")
-        devices = config.device_manager.load_all_devices()
-        print(f"[Flask] Loaded {len(devices)} devices from device_manager")
-        print(f"[Flask] Device list: {devices}")
-        
-        if not devices:
-            print("[Flask] No devices found in database, attempting to ensure defaults...")
-            # Try to ensure default devices exist
-            try:
-                config.device_manager.ensure_default_devices()
-                devices = config.device_manager.load_all_devices()
-                print(f"[Flask] After ensuring defaults, loaded {len(devices)} devices")
-                print(f"[Flask] Device list after ensuring defaults: {devices}")
-            except Exception as init_error:
-                print(f"[Flask] Error ensuring default devices: {init_error}")
-                import traceback
-                traceback.print_exc()
-        
-        print("[Flask] Getting sensor assignments and zone map...")
-        assignments = config.list_sensor_assignments()
-        print(f"[Flask] Assignments: {assignments}")
-        zone_map = config.get_zone_name_map()
-        print(f"[Flask] Zone map: {zone_map}")
 
+        snapshot = snapshot or config.get_sensor_snapshot()
         payload = []
-        for device_id, device_type in devices:
-            zone_id = assignments.get(device_id)
-            
-            # Get sensor status from system if available
-            status = "Unknown"
-            if safehome_system and safehome_system.sensors:
-                for sensor in safehome_system.sensors:
-                    if sensor.get_id() == device_id:
-                        try:
-                            if hasattr(sensor, 'get_status'):
-                                status = sensor.get_status() or "Unknown"
-                        except Exception:
-                            status = "Unknown"
-                        break
-            
-            sensor_data = {
-                'device_id': device_id,
-                'device_type': device_type,
-                'zone_id': zone_id,
-                'zone_name': zone_map.get(str(zone_id), str(zone_id)) if zone_id is not None else None,
-                'status': status,
-            }
+        for row in snapshot.sensors:
+            sensor_data = dict(row)
+            sensor_data['status'] = _sensor_status(row['device_id'])
             payload.append(sensor_data)
-            print(f"[Flask] Added sensor to payload: {sensor_data}")
-        
-        print(f"[Flask] _serialize_sensors: Returning {len(payload)} sensors")
         return payload
     except Exception as e:
         print(f"[Flask] Error in _serialize_sensors: {e}")
@@ -818,6 +940,18 @@ def _serialize_sensors(config):
         return []
 
 
+def _sensors_etag(snapshot, sensors):
+    """
+    ETag for GET /api/security/sensors: the snapshot epoch and version plus a
+    digest of the live sensor statuses, which change without touching the
+    database. The epoch keeps ETags from a previous ConfigurationManager
+    (before a reset or restart) from matching once the version restarts.
+    """
+    statuses = "|".join(f"{sensor['device_id']}={sensor['status']}" for sensor in sensors)
+    digest = zlib.crc32(statuses.encode('utf-8'))
+    return f"sensors-{snapshot.epoch}-v{snapshot.version}-{digest:08x}"
+
+
 @app.route('/api/security/zones', methods=['GET'])
 def api_security_zones():
     auth_error = _require_api_login()
@@ -891,10 +1025,8 @@ def api_security_delete_zone(zone_id: int):
 
 @app.route('/api/security/sensors', methods=['GET'])
 def api_security_sensors():
-    print("[Flask] /api/security/sensors called")
     auth_error = _require_api_login()
     if auth_error:
-        print("[Flask] Authentication failed")
         return auth_error
 
     # Check if system is available
@@ -926,7 +1058,6 @@ def api_security_sensors():
             }), 503
 
     try:
-        print("[Flask] Getting configuration manager...")
         config = _configuration_manager()
         if not config:
             print("[Flask] Configuration manager not available - system may not be initialized")
@@ -939,21 +1070,20 @@ def api_security_sensors():
             print("[Flask] Device manager not available in configuration manager")
             return jsonify({'success': False, 'message': 'Device manager unavailable'}), 503
 
-        print("[Flask] Serializing sensors and zones...")
-        sensors = _serialize_sensors(config)
-        zones = _serialize_zones(config)
-        
-        print(f"[Flask] Loaded {len(sensors)} sensors from database")
-        print(f"[Flask] Sensor details: {sensors}")
-        
-        response_data = {
-            'success': True,
-            'sensors': sensors,
-            'zones': zones
-        }
-        print(f"[Flask] Returning response with {len(sensors)} sensors")
-        
-        return jsonify(response_data), 200
+        snapshot = config.get_sensor_snapshot()
+        sensors = _serialize_sensors(config, snapshot)
+        etag = _sensors_etag(snapshot, sensors)
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = jsonify({
+                'success': True,
+                'sensors': sensors,
+                'zones': [dict(zone) for zone in snapshot.zones],
+            })
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
     except Exception as e:
         print(f"[Flask] Error loading sensors: {e}")
         import traceback
@@ -964,123 +1094,98 @@ def api_security_sensors():
         }), 500
 
 
-@app.route('/api/security/sensors/trigger', methods=['POST'])
-def api_security_sensor_trigger():
-    """센서 trigger 켜기/끄기 API"""
-    auth_error = _require_api_login()
-    if auth_error:
-        return auth_error
-
-    if not safehome_system:
-        return jsonify({'success': False, 'message': 'System not available'}), 503
-
-    data = request.get_json(silent=True) or {}
-    device_id = data.get('device_id')
-    action = data.get('action')
-
+MAX_BATCH_ITEMS = 500
+
+
+def _toggle_sensor(sensor):
+    """
+    Toggle one sensor the way the web trigger button does.
+    Returns (status_for_controller, error_message).
+    """
+    sensor_type = sensor.get_type()
+
+    if sensor_type == SENSOR_WIN_DOOR:
+        # Toggle between open/closed for window/door sensor
+        if hasattr(sensor, 'get_status'):
+            if sensor.get_status() == STATE_CLOSED:
+                if not hasattr(sensor, 'set_open'):
+                    return None, 'Sensor does not support open action'
+                sensor.set_open()
+                return "Open", None
+            if not hasattr(sensor, 'set_closed'):
+                return None, 'Sensor does not support close action'
+            sensor.set_closed()
+            return "Closed", None
+        # Default to open if can't check status
+        if hasattr(sensor, 'set_open'):
+            sensor.set_open()
+            return "Open", None
+        return "Triggered", None
+
+    if sensor_type == SENSOR_MOTION:
+        # Toggle motion detection state
+        if hasattr(sensor, 'get_status') and sensor.get_status() == STATE_DETECTED:
+            # Currently triggered -> clear motion
+            if not hasattr(sensor, 'clear_motion'):
+                return None, 'Sensor does not support clear_motion'
+            sensor.clear_motion()
+            return "Clear", None
+        # Currently clear (or unknown) -> detect motion
+        if not hasattr(sensor, 'detect_motion'):
+            return None, 'Sensor does not support detect_motion'
+        sensor.detect_motion()
+        return "Motion Detected", None
+
+    if sensor_type == SENSOR_CAMERA:
+        if hasattr(sensor, 'take_picture'):
+            sensor.take_picture()
+            return "Recording", None
+        if hasattr(sensor, 'trigger'):
+            sensor.trigger()
+            return "Triggered", None
+        return None, 'Sensor does not support trigger action'
+
+    # Generic trigger for other sensor types
+    if hasattr(sensor, 'trigger'):
+        sensor.trigger()
+        return "Triggered", None
+    return None, 'Sensor does not support trigger action'
+
+
+def _apply_sensor_trigger(device_id, action):
+    """
+    Validate and apply one trigger request.
+    Returns (result dict, HTTP status) so single and batch routes share it.
+    """
     if not device_id or not action:
-        return jsonify({'success': False, 'message': 'device_id and action are required'}), 400
-
-    # Find sensor by device_id
-    sensor = None
-    if safehome_system.sensors:
-        for s in safehome_system.sensors:
-            if s.get_id() == device_id:
-                sensor = s
-                break
+        return {'success': False, 'message': 'device_id and action are required'}, 400
 
+    sensor = safehome_system.get_sensor(device_id)
     if not sensor:
-        return jsonify({'success': False, 'message': f'Sensor {device_id} not found'}), 404
+        return {'success': False, 'message': f'Sensor {device_id} not found'}, 404
 
-    try:
-        # Only 'trigger' action is supported
-        if action != 'trigger':
-            return jsonify({'success': False, 'message': 'Only "trigger" action is supported'}), 400
-        
-        sensor_type = sensor.get_type()
-        status_for_controller = "Triggered"
-        
-        # Trigger sensor based on type
-        if sensor_type == SENSOR_WIN_DOOR:
-            # Toggle between open/closed for window/door sensor
-            if hasattr(sensor, 'get_status'):
-                current_status = sensor.get_status()
-                if current_status == STATE_CLOSED:
-                    if hasattr(sensor, 'set_open'):
-                        sensor.set_open()
-                        status_for_controller = "Open"
-                    else:
-                        return jsonify({'success': False, 'message': 'Sensor does not support open action'}), 400
-                else:
-                    if hasattr(sensor, 'set_closed'):
-                        sensor.set_closed()
-                        status_for_controller = "Closed"
-                    else:
-                        return jsonify({'success': False, 'message': 'Sensor does not support close action'}), 400
-            else:
-                # Default to open if can't check status
-                if hasattr(sensor, 'set_open'):
-                    sensor.set_open()
-                    status_for_controller = "Open"
-        
-        elif sensor_type == SENSOR_MOTION:
-            # Toggle motion detection state
-            if hasattr(sensor, 'get_status'):
-                current_status = sensor.get_status()
-                if current_status == STATE_DETECTED:
-                    # Currently triggered -> clear motion
-                    if hasattr(sensor, 'clear_motion'):
-                        sensor.clear_motion()
-                        status_for_controller = "Clear"
-                    else:
-                        return jsonify({'success': False, 'message': 'Sensor does not support clear_motion'}), 400
-                else:
-                    # Currently clear -> detect motion
-                    if hasattr(sensor, 'detect_motion'):
-                        sensor.detect_motion()
-                        status_for_controller = "Motion Detected"
-                    else:
-                        return jsonify({'success': False, 'message': 'Sensor does not support detect_motion'}), 400
-            else:
-                # Default to detect if can't check status
-                if hasattr(sensor, 'detect_motion'):
-                    sensor.detect_motion()
-                    status_for_controller = "Motion Detected"
-                else:
-                    return jsonify({'success': False, 'message': 'Sensor does not support detect_motion'}), 400
-        
-        elif sensor_type == SENSOR_CAMERA:
-            # Trigger camera
-            if hasattr(sensor, 'take_picture'):
-                sensor.take_picture()
-                status_for_controller = "Recording"
-            elif hasattr(sensor, 'trigger'):
-                sensor.trigger()
-                status_for_controller = "Triggered"
-            else:
-                return jsonify({'success': False, 'message': 'Sensor does not support trigger action'}), 400
-        
-        else:
-            # Generic trigger for other sensor types
-            if hasattr(sensor, 'trigger'):
-                sensor.trigger()
-                status_for_controller = "Triggered"
-            else:
-                return jsonify({'success': False, 'message': 'Sensor does not support trigger action'}), 400
+    # Only 'trigger' action is supported
+    if action != 'trigger':
+        return {'success': False, 'message': 'Only "trigger" action is supported'}, 400
+
+    status_for_controller, error = _toggle_sensor(sensor)
+    if error:
+        return {'success': False, 'message': error}, 400
 
-        # Determine if this is a "triggered" state (should activate alarm)
-        triggered_states = ["Open", "Motion Detected", "Triggered", "Recording"]
-        is_triggered_state = status_for_controller in triggered_states
+    # Determine if this is a "triggered" state (should activate alarm)
+    triggered_states = ["Open", "Motion Detected", "Triggered", "Recording"]
+    is_triggered_state = status_for_controller in triggered_states
 
-        # Update sensor status in system controller if available
-        alarm_activated = False
+    # Update sensor status in system controller if available
+    alarm_activated = False
+    with TRACER.span("api.sensor_trigger", device_id=device_id, status=status_for_controller) as span:
         if safehome_system.system_controller:
             try:
                 # Only update and check alarm if transitioning to triggered state
                 if is_triggered_state:
                     safehome_system.system_controller.update_sensor_status(
                         device_id,
-                        sensor_type,
+                        sensor.get_type(),
                         status_for_controller
                     )
                     # Check if alarm was activated (only for triggered states)
@@ -1094,31 +1199,109 @@ def api_security_sensor_trigger():
                     print(f"[Flask] Sensor {device_id} reset to {status_for_controller} (no alarm trigger)")
             except Exception as exc:
                 print(f"[Flask] Failed to update sensor status in controller: {exc}")
+        span.set_attribute('alarm_activated', alarm_activated)
 
-        # Get current security status
-        status_payload = None
-        if safehome_system.security_system:
-            try:
-                status_payload, _ = _build_security_status_payload()
-            except Exception as exc:
-                print(f"[Flask] Failed to get security status: {exc}")
+    return {
+        'success': True,
+        'message': f'Sensor {device_id} triggered successfully',
+        'sensor_status': status_for_controller,
+        'alarm_activated': alarm_activated,
+        'trace_id': span.trace_id,
+    }, 200
 
-        response_data = {
-            'success': True,
-            'message': f'Sensor {device_id} triggered successfully',
-            'alarm_activated': alarm_activated
-        }
-        
-        if status_payload:
-            response_data['status'] = status_payload
 
-        return jsonify(response_data), 200
+def _current_status_payload():
+    if not safehome_system.security_system:
+        return None
+    try:
+        status_payload, _ = _build_security_status_payload()
+        return status_payload
+    except Exception as exc:
+        print(f"[Flask] Failed to get security status: {exc}")
+        return None
+
+
+def _batch_items(data, key):
+    """Extract a non-empty list from a batch request body, or an error response."""
+    items = data.get(key)
+    if not isinstance(items, list) or not items:
+        return None, (jsonify({'success': False, 'message': f'{key} must be a non-empty array'}), 400)
+    if len(items) > MAX_BATCH_ITEMS:
+        return None, (jsonify({
+            'success': False,
+            'message': f'At most {MAX_BATCH_ITEMS} {key} per request'
+        }), 413)
+    return items, None
+
+
+@app.route('/api/security/sensors/trigger', methods=['POST'])
+def api_security_sensor_trigger():
+    """센서 trigger 켜기/끄기 API"""
+    auth_error = _require_api_login()
+    if auth_error:
+        return auth_error
+
+    if not safehome_system:
+        return jsonify({'success': False, 'message': 'System not available'}), 503
+
+    data = request.get_json(silent=True) or {}
+    try:
+        result, status_code = _apply_sensor_trigger(data.get('device_id'), data.get('action'))
+        if not result['success']:
+            return jsonify(result), status_code
+        result.pop('sensor_status', None)
+
+        status_payload = _current_status_payload()
+        if status_payload:
+            result['status'] = status_payload
+        return jsonify(result), 200
 
     except Exception as e:
         print(f"[Flask] Sensor trigger error: {e}")
         return jsonify({'success': False, 'message': f'Error triggering sensor: {str(e)}'}), 500
 
 
+@app.route('/api/security/sensors/trigger/batch', methods=['POST'])
+def api_security_sensor_trigger_batch():
+    """여러 센서 trigger를 한 번에 처리하는 API (항목별 결과 반환)"""
+    auth_error = _require_api_login()
+    if auth_error:
+        return auth_error
+
+    if not safehome_system:
+        return jsonify({'success': False, 'message': 'System not available'}), 503
+
+    items, error = _batch_items(request.get_json(silent=True) or {}, 'triggers')
+    if error:
+        return error
+
+    results = []
+    for item in items:
+        if not isinstance(item, dict):
+            results.append({'device_id': None, 'success': False, 'message': 'Each trigger must be an object'})
+            continue
+        device_id = item.get('device_id')
+        try:
+            result, _ = _apply_sensor_trigger(device_id, item.get('action', 'trigger'))
+        except Exception as exc:
+            print(f"[Flask] Sensor trigger error for {device_id}: {exc}")
+            result = {'success': False, 'message': f'Error triggering sensor: {str(exc)}'}
+        results.append({'device_id': device_id, **result})
+
+    applied = sum(1 for result in results if result['success'])
+    response_data = {
+        'success': applied == len(results),
+        'applied': applied,
+        'failed': len(results) - applied,
+        'results': results,
+        'alarm_activated': any(result.get('alarm_activated') for result in results),
+    }
+    status_payload = _current_status_payload()
+    if status_payload:
+        response_data['status'] = status_payload
+    return jsonify(response_data), 200
+
+
 @app.route('/api/security/clear-alarm', methods=['POST'])
 def api_security_clear_alarm():
     """알람 종료 API"""
@@ -1197,6 +1380,36 @@ def api_security_assign_sensor():
     return jsonify({'success': True, 'sensors': _serialize_sensors(config)}), 200
 
 
+@app.route('/api/security/assignments/batch', methods=['POST'])
+def api_security_assign_sensors_batch():
+    """
+    여러 센서-구역 배정을 한 트랜잭션으로 적용하는 API.
+    zone_id가 null인 항목은 배정 해제로 처리한다. 전체 센서 목록 대신
+    항목별 결과와 스냅샷 버전을 반환한다.
+    """
+    auth_error = _require_api_login()
+    if auth_error:
+        return auth_error
+
+    config = _configuration_manager()
+    if not config:
+        return jsonify({'success': False, 'message': 'Configuration manager unavailable'}), 503
+
+    items, error = _batch_items(request.get_json(silent=True) or {}, 'assignments')
+    if error:
+        return error
+
+    results = config.apply_sensor_assignments(items)
+    applied = sum(1 for result in results if result['success'])
+    return jsonify({
+        'success': applied == len(results),
+        'applied': applied,
+        'failed': len(results) - applied,
+        'results': results,
+        'snapshot_version': config.get_sensor_snapshot_version(),
+    }), 200
+
+
 @app.route('/api/security/assignments/<device_id>', methods=['DELETE'])
 def api_security_unassign_sensor(device_id: str):
     auth_error = _require_api_login()
@@ -1311,7 +1524,7 @@ def validate_camera_password(camera_id):
         if not safehome_system or not safehome_system.camera_controller:
             return jsonify({'success': False, 'message': 'System not available'}), 503
         
-        # 세션에 실패 횟수 저장
+        # 실패 횟수는 서버 측 세션에 저장 (클라이언트가 쿠키로 초기화할 수 없음)
         key = f'camera_{camera_id}_password_attempts'
         attempts = session.get(key, 0)
         
@@ -1568,6 +1781,66 @@ def zoom_camera(camera_id):
         print(f"[Flask] Zoom camera error: {e}")
         return jsonify({'success': False, 'message': 'Server error'}), 500
 
+@app.route('/api/cameras/<int:camera_id>/recording', methods=['POST'])
+def control_camera_recording(camera_id):
+    """카메라 녹화 시작/중지"""
+    if not session.get('logged_in'):
+        return jsonify({'success': False, 'message': 'Authentication required'}), 401
+
+    try:
+        data = request.get_json(silent=True) or {}
+        action = data.get('action', '')  # 'start' or 'stop'
+
+        if not safehome_system or not safehome_system.camera_controller:
+            return jsonify({'success': False, 'message': 'System not available'}), 503
+
+        controller = safehome_system.camera_controller
+        if not controller.get_camera(camera_id):
+            return jsonify({'success': False, 'message': 'Camera not found'}), 404
+
+        if action == 'start':
+            success = controller.start_recording(camera_id)
+        elif action == 'stop':
+            success = controller.stop_recording(camera_id)
+        else:
+            return jsonify({'success': False, 'message': 'action must be "start" or "stop"'}), 400
+
+        if not success:
+            return jsonify({'success': False, 'message': f'Failed to {action} recording'}), 400
+        return jsonify({'success': True, 'message': f'Camera {camera_id} recording {action}ed'}), 200
+    except Exception as e:
+        print(f"[Flask] Camera recording error: {e}")
+        return jsonify({'success': False, 'message': 'Server error'}), 500
+
+@app.route('/api/cameras/<int:camera_id>/playback', methods=['GET'])
+def get_camera_playback(camera_id):
+    """녹화 영상의 특정 시점 프레임 조회 (t = epoch 초)"""
+    if not session.get('logged_in'):
+        return jsonify({'success': False, 'message': 'Authentication required'}), 401
+
+    try:
+        t = request.args.get('t', type=float)
+        if t is None:
+            return jsonify({'success': False, 'message': 't (epoch seconds) is required'}), 400
+
+        if not safehome_system or not safehome_system.camera_controller:
+            return jsonify({'success': False, 'message': 'System not available'}), 503
+
+        frame = safehome_system.camera_controller.get_recorded_frame(camera_id, t)
+        if not frame:
+            return jsonify({'success': False, 'message': 'No recording at requested time'}), 404
+
+        import base64
+        img_str = base64.b64encode(frame.data).decode()
+        return jsonify({
+            'success': True,
+            'timestamp': frame.timestamp,
+            'image': f'data:image/jpeg;base64,{img_str}'
+        }), 200
+    except Exception as e:
+        print(f"[Flask] Camera playback error: {e}")
+        return jsonify({'success': False, 'message': 'Server error'}), 500
+
 @app.route('/api/cameras/<int:camera_id>/open-view', methods=['POST'])
 def open_camera_view_window(camera_id):
     """카메라 뷰 Tkinter GUI 창 열기"""
@@ -1634,38 +1907,150 @@ def _security_tick_loop():
             print(f"[Web] Security tick error: {exc}")
         time.sleep(1)
 
-def run_web():
+def create_wsgi_server(config: WebServerConfig):
+    """Create a multi-threaded waitress server for ``app`` (production mode)."""
+    try:
+        from waitress import create_server
+    except ImportError as exc:
+        raise RuntimeError(
+            "Production serving mode requires waitress (pip install waitress)"
+        ) from exc
+    return create_server(app, **config.waitress_options())
+
+
+def run_web(config: Optional[WebServerConfig] = None):
+    config = config or WebServerConfig()
+
     # Start security tick thread for web interface
     tick_thread = threading.Thread(target=_security_tick_loop, daemon=True)
     tick_thread.start()
-    
-    app.run(port=5000, debug=False, use_reloader=False)
+    session_store.start_reaper()
+
+    try:
+        if config.is_production:
+            server = create_wsgi_server(config)
+            print(f"[Web] Serving on http://{config.host}:{config.port} "
+                  f"(waitress, {config.threads} threads, backlog {config.backlog})")
+            server.run()
+        else:
+            app.run(host=config.host, port=config.port, debug=False, use_reloader=False)
+    finally:
+        # Release SSE clients still blocked in /api/security/events.
+        stream = getattr(safehome_system, 'security_event_stream', None)
+        if stream is not None:
+            stream.close()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    defaults = WebServerConfig()
+    parser = argparse.ArgumentParser(description="SafeHome control panel and web interface")
+    parser.add_argument("--server", choices=[SERVER_DEVELOPMENT, SERVER_PRODUCTION],
+                        default=defaults.server, help="web server to run the Flask app under")
+    parser.add_argument("--host", default=defaults.host)
+    parser.add_argument("--port", type=int, default=defaults.port)
+    parser.add_argument("--threads", type=int, default=defaults.threads,
+                        help="worker threads (production server)")
+    parser.add_argument("--backlog", type=int, default=defaults.backlog,
+                        help="listen socket backlog (production server)")
+    parser.add_argument("--connection-limit", type=int, default=defaults.connection_limit,
+                        help="maximum simultaneous connections (production server)")
+    parser.add_argument("--channel-timeout", type=int, default=defaults.channel_timeout,
+                        help="seconds before an idle connection is closed (production server)")
+    parser.add_argument("--headless", action="store_true",
+                        help="run System and the web interface without Tkinter (no display needed)")
+    parser.add_argument("--motion-analysis", action="store_true",
+                        help="raise motion events from camera frame differencing")
+    return parser.parse_args(argv)
+
+
+def web_config_from_args(args: argparse.Namespace) -> WebServerConfig:
+    return WebServerConfig(
+        server=args.server,
+        host=args.host,
+        port=args.port,
+        threads=args.threads,
+        backlog=args.backlog,
+        connection_limit=args.connection_limit,
+        channel_timeout=args.channel_timeout,
+    )
+
+
+def boot_headless(motion_analysis: bool = False) -> Tuple[System, dict]:
+    """
+    Turn the system on without any Tkinter/UI imports.
+    :param motion_analysis: enable camera motion analysis
+    :return: (System, startup timings in milliseconds)
+    """
+    global safehome_system
+    boot_started = time.perf_counter()
+    safehome_system = System(motion_analysis=motion_analysis)
+    SystemBootstrapper().attach_post_turn_on_hook(safehome_system, safehome_system.sensors)
+    if not safehome_system.turn_on():
+        raise RuntimeError("SafeHome system failed to turn on")
+    finished = time.perf_counter()
+    timings = {
+        'imports_ms': (boot_started - _MODULE_IMPORT_STARTED) * 1000,
+        'turn_on_ms': (finished - boot_started) * 1000,
+        'total_ms': (finished - _MODULE_IMPORT_STARTED) * 1000,
+        'stages_ms': dict(safehome_system.startup_timings),
+    }
+    return safehome_system, timings
+
+
+def run_headless(web_config: WebServerConfig, motion_analysis: bool = False):
+    system, timings = boot_headless(motion_analysis)
+    print("=" * 50)
+    print("SafeHome Headless Daemon Started")
+    print(f"Startup: {timings['total_ms']:.0f} ms "
+          f"(imports {timings['imports_ms']:.0f} ms, turn_on {timings['turn_on_ms']:.0f} ms)")
+    print(f"Web Interface: http://{web_config.host}:{web_config.port} ({web_config.server})")
+    print("=" * 50)
+    try:
+        run_web(web_config)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if system.system_state.value != "Off":
+            print("\nShutting down SafeHome system...")
+            system.turn_off()
 
 
-def main():
+def main(argv=None):
     global safehome_system
+    args = parse_args(argv)
+    web_config = web_config_from_args(args)
+    if args.headless:
+        run_headless(web_config, args.motion_analysis)
+        return
+
+    # GUI mode only: keep Tkinter out of headless/daemon startup.
+    import tkinter as tk
+    from ui.main_window import SafeHomeApp
+
     root = tk.Tk()
 
-    safehome_system = System()
+    safehome_system = System(motion_analysis=args.motion_analysis)
 
-    ui_sensors = [
+    # UI와 System이 같은 센서 목록 객체를 공유한다 (System.add_sensor 등이 UI에도 보이도록).
+    safehome_system.sensors = [
         WindowDoorSensor("Front Door"),
         MotionDetector("Living Room"),
         Camera("Garden Cam"),
     ]
+    ui_sensors = safehome_system.sensors
 
     ui_app = SafeHomeApp(root, safehome_system, ui_sensors)
 
     safehome_system.set_ui(ui_app)
     SystemBootstrapper().attach_post_turn_on_hook(safehome_system, ui_sensors)
 
-    t = threading.Thread(target=run_web, daemon=True)
+    t = threading.Thread(target=run_web, args=(web_config,), daemon=True)
     t.start()
 
     print("=" * 50)
     print("SafeHome Control Panel Started")
     print("System Status: OFF (Press 'Turn On' to start)")
-    print("Web Interface: http://localhost:5000")
+    print(f"Web Interface: http://{web_config.host}:{web_config.port} ({web_config.server})")
     print("=" * 50)
 
     try:
@@ -1676,6 +2061,5 @@ def main():
             safehome_system.turn_off()
 
 
-
 if __name__ == "__main__":
     main()
@@ -0,0 +1,208 @@
+# safehome/security/event_stream.py
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Deque, Iterable, List, Optional, Sequence
+
+from .events import SensorEvent
+from .interfaces import SecurityEventListener, SecurityStatus
+from .security_system import IntrusionRecord
+
+
+DEFAULT_BUFFER_SIZE = 256
+
+
+def status_to_dict(status: SecurityStatus) -> dict:
+    """Serialize a SecurityStatus the same way GET /api/security/status does."""
+    return {
+        'mode': status.mode.name,
+        'alarm_state': status.alarm_state.name,
+        'armed_zones': sorted(status.armed_zones) if status.armed_zones else [],
+        'entry_delay_deadline': (
+            status.entry_delay_deadline.isoformat() if status.entry_delay_deadline else None
+        ),
+        'monitoring_call_scheduled': status.monitoring_call_scheduled,
+    }
+
+
+def intrusion_to_dict(record: IntrusionRecord) -> dict:
+    """Serialize an IntrusionRecord the same way GET /api/security/intrusions does."""
+    return {
+        'timestamp': record.timestamp.isoformat(),
+        'sensor_id': record.sensor_id,
+        'zone_id': record.zone_id,
+        'sensor_type': record.sensor_type.name if record.sensor_type else None,
+        'mode': record.mode.name,
+        'action': record.action,
+        'status': record.status.name if record.status else None,
+        'details': record.details,
+    }
+
+
+def format_sse(event_id: Optional[int], name: str, data: dict) -> str:
+    """Encode one Server-Sent Events frame."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {name}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """An event in the shared buffer, pre-encoded once for every client."""
+
+    event_id: int
+    name: str
+    data: dict
+    frame: str
+
+
+class SecurityEventStream(SecurityEventListener):
+    """
+    SecurityEventListener that keeps one bounded, shared buffer of recent
+    events for all SSE clients.
+
+    Clients do not get their own queues: each one remembers the last event
+    id it sent and asks for everything newer, blocking on a condition until
+    something is published. Ids increase monotonically for the lifetime of
+    the stream, so a reconnecting client can resume with Last-Event-ID as
+    long as its id is still inside the buffer.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be positive")
+        self._events: Deque[StreamEvent] = deque(maxlen=buffer_size)
+        self._next_id = 1
+        self._condition = threading.Condition()
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # SecurityEventListener
+    # ------------------------------------------------------------------
+
+    def on_status_changed(self, status: SecurityStatus) -> None:
+        self.publish('status', status_to_dict(status))
+
+    def on_intrusion_logged(self, record: IntrusionRecord) -> None:
+        self.publish('intrusion', intrusion_to_dict(record))
+
+    def on_entry_delay_started(self, event: SensorEvent, deadline: datetime) -> None:
+        self.publish('entry_delay', {
+            'sensor_id': event.sensor_id,
+            'zone_id': event.zone_id,
+            'deadline': deadline.isoformat(),
+        })
+
+    def on_alarm_activated(self, event: Optional[SensorEvent]) -> None:
+        self.publish('alarm_activated', {
+            'sensor_id': event.sensor_id if event else None,
+            'zone_id': event.zone_id if event else None,
+            'sensor_type': event.sensor_type.name if event else None,
+        })
+
+    def on_alarm_cleared(self, cleared_by: str) -> None:
+        self.publish('alarm_cleared', {'cleared_by': cleared_by})
+
+    # ------------------------------------------------------------------
+    # Fan-out
+    # ------------------------------------------------------------------
+
+    def publish(self, name: str, data: dict) -> int:
+        """Append an event to the shared buffer and wake all waiting clients."""
+        with self._condition:
+            event_id = self._next_id
+            self._next_id += 1
+            self._events.append(
+                StreamEvent(event_id, name, data, format_sse(event_id, name, data))
+            )
+            self._condition.notify_all()
+        return event_id
+
+    @property
+    def last_event_id(self) -> int:
+        with self._condition:
+            return self._next_id - 1
+
+    def events_after(self, last_event_id: int) -> List[StreamEvent]:
+        """Return buffered events newer than ``last_event_id`` without blocking."""
+        with self._condition:
+            return self._events_after_locked(last_event_id)
+
+    def is_resumable(self, last_event_id: int) -> bool:
+        """True if no event after ``last_event_id`` has been evicted from the buffer."""
+        with self._condition:
+            latest = self._next_id - 1
+            if last_event_id > latest:
+                # Id from a previous server run.
+                return False
+            if last_event_id == latest:
+                return True
+            return bool(self._events) and self._events[0].event_id <= last_event_id + 1
+
+    def wait_for_events(self, last_event_id: int, timeout: Optional[float] = None) -> List[StreamEvent]:
+        """Block until events newer than ``last_event_id`` exist, or timeout/close."""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._closed or self._next_id - 1 > last_event_id,
+                timeout=timeout,
+            )
+            return self._events_after_locked(last_event_id)
+
+    def close(self) -> None:
+        """Release all waiting clients (used on shutdown)."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _events_after_locked(self, last_event_id: int) -> List[StreamEvent]:
+        if not self._events or self._events[-1].event_id <= last_event_id:
+            return []
+        # Ids are contiguous inside the deque, so slice by offset.
+        start = max(0, last_event_id + 1 - self._events[0].event_id)
+        return list(islice(self._events, start, None))
+
+
+class CompositeSecurityListener(SecurityEventListener):
+    """Forward every security event to several listeners (UI, SSE stream, ...)."""
+
+    def __init__(self, listeners: Iterable[SecurityEventListener]) -> None:
+        self._listeners: Sequence[SecurityEventListener] = tuple(listeners)
+
+    @property
+    def listeners(self) -> Sequence[SecurityEventListener]:
+        return self._listeners
+
+    def _dispatch(self, method: str, *args) -> None:
+        for listener in self._listeners:
+            try:
+                getattr(listener, method)(*args)
+            except Exception as exc:
+                print(f"[CompositeSecurityListener] {type(listener).__name__}.{method} failed: {exc}")
+
+    def on_status_changed(self, status: SecurityStatus) -> None:
+        self._dispatch('on_status_changed', status)
+
+    def on_intrusion_logged(self, record: IntrusionRecord) -> None:
+        self._dispatch('on_intrusion_logged', record)
+
+    def on_entry_delay_started(self, event: SensorEvent, deadline: datetime) -> None:
+        self._dispatch('on_entry_delay_started', event, deadline)
+
+    def on_alarm_activated(self, event: Optional[SensorEvent]) -> None:
+        self._dispatch('on_alarm_activated', event)
+
+    def on_alarm_cleared(self, cleared_by: str) -> None:
+        self._dispatch('on_alarm_cleared', cleared_by)
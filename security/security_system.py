@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+import time
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum, auto
-from typing import Callable, Dict, Iterable, List, Optional, Set, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from .events import SensorEvent, SensorStatus, SensorType
 
@@ -99,6 +102,33 @@ if TYPE_CHECKING:  # pragma: no cover
     from .interfaces import CameraGateway, SecurityEventListener, SecurityStatus
 
 
+def _measured(event_name: str, *, traced: bool = True):
+    """
+    Report the wrapped method's wall time to the injected latency recorder
+    and, when ``traced``, run it inside a span of the injected tracer.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            recorder = self._latency_recorder
+            tracer = self._tracer if traced else None
+            if recorder is None and tracer is None:
+                return method(self, *args, **kwargs)
+            scope = tracer.span(f"security.{event_name}") if tracer else nullcontext()
+            started = time.perf_counter()
+            try:
+                with scope:
+                    return method(self, *args, **kwargs)
+            finally:
+                if recorder is not None:
+                    recorder(event_name, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
 class SecuritySystem:
     """
     Domain service for Use Case 2 (Security).
@@ -119,6 +149,8 @@ class SecuritySystem:
         get_monitored_sensors_state: Callable[[], Dict[str, SensorStatus]],
         event_listener: Optional[SecurityEventListener] = None,
         camera_gateway: Optional[CameraGateway] = None,
+        latency_recorder: Optional[Callable[[str, float], None]] = None,
+        tracer=None,
     ) -> None:
         self._mode: SecurityMode = SecurityMode.DISARMED
         self._alarm_state: AlarmState = AlarmState.IDLE
@@ -139,6 +171,9 @@ class SecuritySystem:
         self._get_monitored_sensors_state = get_monitored_sensors_state
         self._listener: Optional["SecurityEventListener"] = event_listener
         self._camera_gateway: Optional["CameraGateway"] = camera_gateway
+        self._latency_recorder = latency_recorder
+        # Anything with a ``span(name, **attributes)`` context manager.
+        self._tracer = tracer
 
         self._intrusion_logs: List[IntrusionRecord] = []
 
@@ -164,6 +199,35 @@ class SecuritySystem:
 
     def unassign_sensor(self, sensor_id: str) -> None:
         """Remove a sensor from any zone tracking."""
+        self._detach_sensor(sensor_id)
+        self._notify_status_change()
+
+    def apply_sensor_changes(
+        self,
+        sensors: Dict[str, Tuple[SensorType, Optional[str]]],
+        removed: Iterable[str] = (),
+    ) -> None:
+        """
+        Apply a batch of sensor registrations and zone moves.
+
+        ``sensors`` maps sensor IDs to ``(type, zone_id)``; a ``None`` zone
+        unassigns the sensor. Sensors in ``removed`` are forgotten entirely.
+        Listeners receive a single status notification for the whole batch.
+        """
+        removed = list(removed)
+        for sensor_id, (sensor_type, zone_id) in sensors.items():
+            self._sensor_types[sensor_id] = sensor_type
+            if self._sensor_zones.get(sensor_id) != zone_id:
+                self._detach_sensor(sensor_id)
+                if zone_id:
+                    self.assign_sensor_to_zone(sensor_id, zone_id)
+        for sensor_id in removed:
+            self._detach_sensor(sensor_id)
+            self._sensor_types.pop(sensor_id, None)
+        if sensors or removed:
+            self._notify_status_change()
+
+    def _detach_sensor(self, sensor_id: str) -> None:
         zone_id = self._sensor_zones.pop(sensor_id, None)
         if zone_id:
             sensors = self._zone_sensors.get(zone_id)
@@ -171,7 +235,6 @@ class SecuritySystem:
                 sensors.discard(sensor_id)
                 if not sensors:
                     self._zone_sensors.pop(zone_id, None)
-        self._notify_status_change()
 
     def remove_zone(self, zone_id: str) -> None:
         """Remove a zone definition."""
@@ -186,6 +249,26 @@ class SecuritySystem:
         self._listener = listener
         self._notify_status_change()
 
+    def set_latency_recorder(self, recorder: Optional[Callable[[str, float], None]]) -> None:
+        """Attach a callback receiving (event name, seconds) for each processed event."""
+        self._latency_recorder = recorder
+
+    def set_tracer(self, tracer) -> None:
+        """Attach a tracer whose spans wrap event processing (``None`` disables)."""
+        self._tracer = tracer
+
+    def refresh_delay_time(self) -> None:
+        """
+        Re-read the alarm delay after a settings change. A monitoring call
+        that is still pending is rescheduled from the original alarm start.
+        """
+        if (
+            self._alarm_state is AlarmState.ALARM_ACTIVE
+            and self._alarm_started_at is not None
+            and not self._monitoring_call_scheduled
+        ):
+            self._monitoring_deadline = self._alarm_started_at + self._get_delay_time()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -198,6 +281,7 @@ class SecuritySystem:
     def alarm_state(self) -> AlarmState:
         return self._alarm_state
 
+    @_measured("arm")
     def arm(self, mode: SecurityMode, zones: Optional[Set[str]] = None) -> None:
         """
         Arm the system in the given mode. Zones defaults to all known zones.
@@ -219,6 +303,7 @@ class SecuritySystem:
         self._log(None, f"ARMED_{mode.name}")
         self._notify_status_change()
 
+    @_measured("disarm")
     def disarm(self, *, cleared_by: Optional[str] = None) -> None:
         """Disarm the system and silence any active alarm."""
         self._mode = SecurityMode.DISARMED
@@ -238,6 +323,7 @@ class SecuritySystem:
         self._log(None, "DISARMED", details=f"by {cleared_by}" if cleared_by else None)
         self._notify_status_change()
 
+    @_measured("clear_alarm")
     def clear_alarm(self, *, cleared_by: Optional[str] = None) -> None:
         """Clear the alarm without disarming the system."""
         if self._alarm_state is AlarmState.IDLE:
@@ -255,6 +341,7 @@ class SecuritySystem:
         self._log(None, "ALARM_CLEARED", details=f"by {cleared_by}" if cleared_by else None)
         self._notify_status_change()
 
+    @_measured("sensor_event")
     def handle_sensor_event(self, event: SensorEvent) -> None:
         """
         Evaluate an incoming sensor event and start the entry delay/alarm cycle
@@ -307,6 +394,7 @@ class SecuritySystem:
             self._listener.on_alarm_activated(event)
         self._notify_status_change()
 
+    @_measured("tick", traced=False)
     def tick(self, now: datetime) -> None:
         """
         Periodic driver (e.g., called every second). 
@@ -360,6 +448,7 @@ class SecuritySystem:
             sys.stdout.write(f"[SecuritySystem] Monitoring service notified with condition information: {condition_info}\n")
             sys.stdout.flush()
 
+    @_measured("panic")
     def trigger_panic(self) -> None:
         """Immediate alarm regardless of armed mode. Monitoring call scheduled after delay."""
         self._alarm_state = AlarmState.ALARM_ACTIVE
@@ -2,10 +2,25 @@
 StorageManager - 데이터베이스 접근 관리
 JDBC 대신 sqlite3를 사용하여 데이터베이스 연결 및 쿼리 실행 관리
 """
+import functools
 import sqlite3
 import threading
+import time
+from contextlib import contextmanager
 from typing import Optional, List, Tuple, Any
 from utils.constants import DB_FILE
+from utils.metrics import STORAGE_ERRORS_TOTAL, STORAGE_QUERY_SECONDS
+
+# UPDATE ... RETURNING은 SQLite 3.35부터 지원된다.
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+def _serialized(method):
+    """공유 연결을 사용하는 메서드를 _connection_lock으로 직렬화"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._connection_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class StorageManager:
@@ -25,8 +40,13 @@ class StorageManager:
     def __init__(self):
         if not hasattr(self, 'initialized'):
             self.connection: Optional[sqlite3.Connection] = None
+            # 연결을 스레드 간에 공유하므로 연결을 쓰는 모든 메서드와 transaction() 블록을
+            # 하나의 락으로 직렬화한다. 다른 스레드의 commit()이 진행 중인 트랜잭션의
+            # 일부를 커밋해 버리지 않도록 하기 위함이다.
+            self._connection_lock = threading.RLock()
             self.initialized = True
 
+    @_serialized
     def connect(self) -> bool:
         """데이터베이스에 연결"""
         try:
@@ -46,6 +66,7 @@ class StorageManager:
             print(f"[StorageManager] Connection error: {e}")
             return False
 
+    @_serialized
     def disconnect(self):
         """데이터베이스 연결 종료"""
         if self.connection:
@@ -124,6 +145,14 @@ class StorageManager:
             FOREIGN KEY (device_id) REFERENCES devices(device_id) ON DELETE CASCADE,
             FOREIGN KEY (zone_id) REFERENCES safety_zones(zone_id) ON DELETE CASCADE
         );
+
+        -- Web sessions table (서버 측 Flask 세션, data는 JSON)
+        CREATE TABLE IF NOT EXISTS web_sessions (
+            session_id TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_web_sessions_expires_at ON web_sessions(expires_at);
         """
 
         try:
@@ -181,6 +210,7 @@ class StorageManager:
         except sqlite3.Error as e:
             print(f"[StorageManager] Schema initialization error: {e}")
 
+    @_serialized
     def execute_query(self, sql: str, params: Tuple = ()) -> Optional[List[sqlite3.Row]]:
         """
         SELECT 쿼리 실행
@@ -195,15 +225,18 @@ class StorageManager:
                     print("[StorageManager] Failed to connect to database for query")
                     return None
             
-            cursor = self.connection.cursor()
-            cursor.execute(sql, params)
-            return cursor.fetchall()
+            with STORAGE_QUERY_SECONDS.time("query"):
+                cursor = self.connection.cursor()
+                cursor.execute(sql, params)
+                return cursor.fetchall()
         except sqlite3.Error as e:
+            STORAGE_ERRORS_TOTAL.inc("query")
             print(f"[StorageManager] Query error: {e}")
             import traceback
             traceback.print_exc()
             return None
 
+    @_serialized
     def execute_update(self, sql: str, params: Tuple = ()) -> int:
         """
         INSERT, UPDATE, DELETE 쿼리 실행
@@ -218,11 +251,13 @@ class StorageManager:
                     print("[StorageManager] Failed to connect to database for update")
                     return -1
             
-            cursor = self.connection.cursor()
-            cursor.execute(sql, params)
-            self.connection.commit()
-            return cursor.rowcount
+            with STORAGE_QUERY_SECONDS.time("update"):
+                cursor = self.connection.cursor()
+                cursor.execute(sql, params)
+                self.connection.commit()
+                return cursor.rowcount
         except sqlite3.Error as e:
+            STORAGE_ERRORS_TOTAL.inc("update")
             print(f"[StorageManager] Update error: {e}")
             import traceback
             traceback.print_exc()
@@ -230,6 +265,7 @@ class StorageManager:
                 self.connection.rollback()
             return -1
 
+    @_serialized
     def execute_many(self, sql: str, params_list: List[Tuple]) -> int:
         """
         여러 개의 INSERT/UPDATE 실행 (배치)
@@ -238,15 +274,40 @@ class StorageManager:
         :return: 영향받은 총 행 수 또는 -1 (에러 시)
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.executemany(sql, params_list)
-            self.connection.commit()
-            return cursor.rowcount
+            with STORAGE_QUERY_SECONDS.time("batch"):
+                cursor = self.connection.cursor()
+                cursor.executemany(sql, params_list)
+                self.connection.commit()
+                return cursor.rowcount
         except sqlite3.Error as e:
+            STORAGE_ERRORS_TOTAL.inc("batch")
             print(f"[StorageManager] Batch update error: {e}")
             self.connection.rollback()
             return -1
 
+    @contextmanager
+    def transaction(self):
+        """
+        여러 쓰기를 하나의 트랜잭션으로 묶는다.
+        블록이 정상 종료되면 커밋, 예외가 발생하면 롤백 후 예외를 다시 던진다.
+        :return: sqlite3.Cursor
+        """
+        with self._connection_lock:
+            if self.connection is None and not self.connect():
+                raise sqlite3.OperationalError("database connection unavailable")
+            cursor = self.connection.cursor()
+            started = time.perf_counter()
+            try:
+                yield cursor
+                self.connection.commit()
+            except Exception:
+                STORAGE_ERRORS_TOTAL.inc("transaction")
+                self.connection.rollback()
+                raise
+            finally:
+                STORAGE_QUERY_SECONDS.observe(time.perf_counter() - started, "transaction")
+
+    @_serialized
     def get_last_insert_id(self) -> int:
         """마지막 INSERT의 ID 반환"""
         try:
@@ -317,6 +378,116 @@ class StorageManager:
         rows_affected = self.execute_update(sql, (timestamp, username, interface_type))
         return rows_affected > 0
 
+    def record_failed_login(self, username: str, interface_type: str = 'web_browser',
+                            max_attempts: int = 5) -> Optional[dict]:
+        """
+        로그인 실패 1회를 원자적으로 기록
+        실패 횟수 증가와 (한도 도달 시) 잠금을 하나의 UPDATE로 처리하고 갱신된 상태를 반환한다.
+        :param username: 사용자 ID
+        :param interface_type: 인터페이스 타입
+        :param max_attempts: 잠금이 걸리는 실패 횟수
+        :return: {'failed_attempts', 'is_locked', 'locked_at'} 또는 None (사용자 없음)
+        :raises sqlite3.Error: DB 오류 (사용자 없음과 구분되도록 호출자에게 전달)
+        """
+        from datetime import datetime
+        # SET 절의 컬럼 참조는 갱신 전 값이므로 failed_attempts + 1이 새 횟수다.
+        sql = """
+            UPDATE users
+            SET failed_attempts = failed_attempts + 1,
+                is_locked = CASE WHEN failed_attempts + 1 >= ? THEN 1 ELSE is_locked END,
+                locked_at = CASE WHEN failed_attempts + 1 >= ? AND NOT is_locked THEN ? ELSE locked_at END
+            WHERE user_id = ? AND interface_type = ?
+        """
+        params = (max_attempts, max_attempts, datetime.now().isoformat(), username, interface_type)
+        select_sql = ("SELECT failed_attempts, is_locked, locked_at FROM users "
+                      "WHERE user_id = ? AND interface_type = ?")
+        try:
+            with self.transaction() as cursor:
+                if _SUPPORTS_RETURNING:
+                    cursor.execute(sql + " RETURNING failed_attempts, is_locked, locked_at", params)
+                    # fetchall로 문장을 끝까지 실행해야 커밋할 수 있다.
+                    rows = cursor.fetchall()
+                else:
+                    # 같은 트랜잭션 안에서 다시 읽으므로 다른 쓰기가 끼어들지 않는다.
+                    cursor.execute(sql, params)
+                    rows = []
+                    if cursor.rowcount > 0:
+                        cursor.execute(select_sql, (username, interface_type))
+                        rows = cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"[StorageManager] Record failed login error: {e}")
+            raise
+        return dict(rows[0]) if rows else None
+
+    def record_successful_login(self, username: str, interface_type: str = 'web_browser',
+                                update_last_login: bool = False) -> bool:
+        """
+        로그인 성공 처리 - 실패 횟수/잠금 초기화와 마지막 로그인 시간 갱신을 한 번에 수행
+        이미 초기 상태이고 로그인 시간도 갱신하지 않는 경우에는 쓰기를 생략한다.
+        :return: 에러 없이 처리되면 True
+        """
+        from datetime import datetime
+        if update_last_login:
+            sql = """
+                UPDATE users
+                SET failed_attempts = 0, is_locked = 0, locked_at = NULL, last_login_time = ?
+                WHERE user_id = ? AND interface_type = ?
+            """
+            params = (datetime.now().isoformat(), username, interface_type)
+        else:
+            sql = """
+                UPDATE users
+                SET failed_attempts = 0, is_locked = 0, locked_at = NULL
+                WHERE user_id = ? AND interface_type = ?
+                  AND (failed_attempts != 0 OR is_locked != 0 OR locked_at IS NOT NULL)
+            """
+            params = (username, interface_type)
+        return self.execute_update(sql, params) >= 0
+
+    def update_password_hash(self, username: str, interface_type: str, column: str,
+                             hashed: str) -> bool:
+        """
+        저장된 비밀번호 값을 새 해시로 교체 (로그인 시 마이그레이션용)
+        :param column: 'password' 또는 'second_password'
+        """
+        if column not in ('password', 'second_password'):
+            raise ValueError(f"Unknown password column: {column}")
+        sql = f"UPDATE users SET {column} = ? WHERE user_id = ? AND interface_type = ?"
+        rows_affected = self.execute_update(sql, (hashed, username, interface_type))
+        return rows_affected > 0
+
+    def load_web_session(self, session_id: str) -> Optional[dict]:
+        """
+        웹 세션 조회
+        :return: {'data': JSON 문자열, 'expires_at': 만료 시각(epoch 초)} 또는 None
+        """
+        rows = self.execute_query(
+            "SELECT data, expires_at FROM web_sessions WHERE session_id = ?", (session_id,)
+        )
+        if not rows:
+            return None
+        return {'data': rows[0]['data'], 'expires_at': rows[0]['expires_at']}
+
+    def save_web_session(self, session_id: str, data: str, expires_at: float) -> bool:
+        """웹 세션 저장 (없으면 INSERT, 있으면 데이터와 만료 시각 교체)"""
+        sql = """
+            INSERT INTO web_sessions (session_id, data, expires_at) VALUES (?, ?, ?)
+            ON CONFLICT(session_id) DO UPDATE SET data = excluded.data, expires_at = excluded.expires_at
+        """
+        return self.execute_update(sql, (session_id, data, expires_at)) > 0
+
+    def touch_web_session(self, session_id: str, expires_at: float) -> bool:
+        """웹 세션 만료 시각만 연장"""
+        sql = "UPDATE web_sessions SET expires_at = ? WHERE session_id = ?"
+        return self.execute_update(sql, (expires_at, session_id)) > 0
+
+    def delete_web_session(self, session_id: str) -> bool:
+        return self.execute_update("DELETE FROM web_sessions WHERE session_id = ?", (session_id,)) > 0
+
+    def delete_expired_web_sessions(self, now: float) -> int:
+        """만료된 웹 세션 일괄 삭제 - 삭제된 행 수 반환 (에러 시 -1)"""
+        return self.execute_update("DELETE FROM web_sessions WHERE expires_at <= ?", (now,))
+
     def update_last_login_time(self, username: str, interface_type: str = 'web_browser') -> bool:
         """마지막 로그인 시간 업데이트"""
         from datetime import datetime
@@ -327,7 +498,10 @@ class StorageManager:
 
     def create_web_user(self, username: str, first_password: str, second_password: str,
                         access_level: int = 1) -> bool:
-        """웹 사용자 생성"""
+        """웹 사용자 생성 (두 비밀번호 모두 해시로 저장)"""
+        from auth.password_hashing import PASSWORD_VERIFIER
+        first_password = PASSWORD_VERIFIER.hash(first_password)
+        second_password = PASSWORD_VERIFIER.hash(second_password)
         sql = """
         INSERT INTO users (user_id, password, second_password, interface_type, access_level)
         VALUES (?, ?, ?, 'web_browser', ?)
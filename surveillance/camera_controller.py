@@ -2,11 +2,21 @@
 CameraController - 카메라 관리 및 제어 클래스
 UML 다이어그램 기반 구현
 """
+import threading
+import time
+from pathlib import Path
 from typing import Dict, List, Optional
 
 from PIL import Image
 
-from surveillance.safehome_camera import SafeHomeCamera
+from surveillance.motion_analyzer import MotionAnalyzer
+from surveillance.pre_alarm_buffer import DEFAULT_SAMPLE_INTERVAL, EventClipWriter
+from surveillance.recording_store import RecordedFrame, RecordingStore
+from surveillance.safehome_camera import SafeHomeCamera, preload_camera_assets
+from utils.tracing import TRACER
+
+# 사전 알람 프레임을 디스크로 기록하는 보안 이벤트 종류
+PRE_ALARM_SOURCES = ("INTRUSION", "PANIC")
 
 
 class CameraController:
@@ -22,8 +32,14 @@ class CameraController:
         self._cameras: Dict[int, SafeHomeCamera] = {}
         self._camera_info: Dict[int, Dict[str, object]] = {}
         self._camera_passwords: Dict[int, str] = {}
+        self._clip_writer: Optional[EventClipWriter] = None
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+        self._sample_interval: float = DEFAULT_SAMPLE_INTERVAL
+        self._recording_store: Optional[RecordingStore] = None
+        self._motion_analyzer: Optional[MotionAnalyzer] = None
+        self._last_sampler_tick: float = 0.0
 
-        
     def add_camera(self, x_coord: int, y_coord: int) -> bool:
         """
         새 카메라 추가 (SafeHomeCamera 생성)
@@ -34,6 +50,8 @@ class CameraController:
         try:
             camera_id = self._next_camera_id
             camera = SafeHomeCamera(camera_id=camera_id, location=[x_coord, y_coord])
+            if self._recording_store:
+                camera.attach_recording_store(self._recording_store)
 
             self._cameras[camera_id] = camera
 
@@ -229,10 +247,11 @@ class CameraController:
                 y = row * thumbnail_size
                 
                 # SafeHomeCamera의 display_view() 사용
-                thumb_view = camera.display_view()
+                thumb_view = camera.display_view(size=thumbnail_size)
                 if thumb_view:
-                    thumb = thumb_view.resize((thumbnail_size, thumbnail_size), Image.LANCZOS)
-                    img.paste(thumb, (x, y))
+                    if thumb_view.size != (thumbnail_size, thumbnail_size):
+                        thumb_view = thumb_view.resize((thumbnail_size, thumbnail_size), Image.LANCZOS)
+                    img.paste(thumb_view, (x, y))
                 else:
                     # 이미지가 없으면 검은색 박스
                     from PIL import ImageDraw, ImageFont
@@ -336,6 +355,251 @@ class CameraController:
         print(f"[CameraController] Password deleted for camera {camera_id}")
         return 0
     
+    @staticmethod
+    def preload_camera_assets() -> int:
+        """
+        카메라 원본 이미지를 미리 디코딩해 공유 캐시에 올린다 (카메라 추가 전에 다른 스레드에서 호출 가능)
+        :return: 로드한 이미지 수
+        """
+        return preload_camera_assets()
+
+    def enable_pre_alarm_capture(
+        self,
+        output_dir: Path,
+        *,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        post_event_frames: int = 5,
+        start_sampler: bool = True,
+    ) -> None:
+        """
+        사전 알람 링 버퍼 샘플링 및 이벤트 클립 기록 활성화
+        :param output_dir: 이벤트 클립을 저장할 디렉토리
+        :param sample_interval: 링 버퍼 샘플링 간격 (초)
+        :param post_event_frames: 알람 이후 추가로 기록할 프레임 수
+        :param start_sampler: 백그라운드 샘플링 스레드 시작 여부
+        """
+        if self._clip_writer:
+            self._clip_writer.shutdown(wait=False)
+        self._sample_interval = sample_interval
+        self._clip_writer = EventClipWriter(
+            output_dir,
+            post_event_frames=post_event_frames,
+            post_event_interval=sample_interval,
+        )
+        if start_sampler:
+            self.start_frame_sampler()
+        print(f"[CameraController] Pre-alarm capture enabled ({output_dir})")
+
+    def disable_pre_alarm_capture(self, wait: bool = False) -> None:
+        """
+        사전 알람 클립 기록기 종료 (녹화 중이 아니면 샘플링 스레드도 종료)
+        :param wait: 대기 중인 클립 기록이 끝날 때까지 기다릴지 여부
+        """
+        if self._recording_store is None and self._motion_analyzer is None:
+            self.stop_frame_sampler()
+        if self._clip_writer:
+            self._clip_writer.shutdown(wait=wait)
+            self._clip_writer = None
+
+    def attach_recording_store(self, store: RecordingStore, start_sampler: bool = True) -> None:
+        """
+        녹화 저장소 연결 (기존 및 이후 추가되는 모든 카메라에 적용)
+        :param store: RecordingStore 객체
+        :param start_sampler: 백그라운드 샘플링 스레드 시작 여부
+        """
+        self._recording_store = store
+        for camera in self._cameras.values():
+            camera.attach_recording_store(store)
+        if start_sampler:
+            self.start_frame_sampler()
+
+    def get_recording_store(self) -> Optional[RecordingStore]:
+        return self._recording_store
+
+    def start_recording(self, camera_id: int) -> bool:
+        """
+        카메라 녹화 시작
+        :param camera_id: 카메라 ID
+        :return: 성공 여부
+        """
+        camera = self._cameras.get(camera_id)
+        if not camera or not camera.is_enabled() or not self._recording_store:
+            return False
+        camera.start_recording()
+        return True
+
+    def stop_recording(self, camera_id: int) -> bool:
+        """
+        카메라 녹화 중지
+        :param camera_id: 카메라 ID
+        :return: 성공 여부
+        """
+        camera = self._cameras.get(camera_id)
+        if not camera:
+            return False
+        camera.stop_recording()
+        return True
+
+    def record_frames(self) -> int:
+        """
+        녹화 중인 모든 카메라의 현재 프레임을 저장소에 기록
+        :return: 기록된 프레임 수
+        """
+        recorded = 0
+        for camera in list(self._cameras.values()):
+            try:
+                if camera.record_frame():
+                    recorded += 1
+            except Exception as exc:
+                print(f"[CameraController] Recording failed: {exc}")
+        return recorded
+
+    def get_recorded_frame(self, camera_id: int, timestamp: float) -> Optional[RecordedFrame]:
+        """
+        지정한 시점의 녹화 프레임 조회 (세그먼트 인덱스로 직접 탐색)
+        :param camera_id: 카메라 ID
+        :param timestamp: 조회 시각 (epoch 초)
+        :return: RecordedFrame 또는 None
+        """
+        if not self._recording_store:
+            return None
+        return self._recording_store.get_frame_at(camera_id, timestamp)
+
+    def enable_motion_analysis(self, analyzer: MotionAnalyzer, start_sampler: bool = True) -> None:
+        """
+        프레임 차분 모션 분석 활성화 (샘플링 스레드에서 카메라당 1회/주기 실행)
+        :param analyzer: MotionAnalyzer 객체
+        :param start_sampler: 백그라운드 샘플링 스레드 시작 여부
+        """
+        self._motion_analyzer = analyzer
+        if start_sampler:
+            self.start_frame_sampler()
+        print("[CameraController] Motion analysis enabled")
+
+    def disable_motion_analysis(self) -> None:
+        """프레임 차분 모션 분석 비활성화"""
+        self._motion_analyzer = None
+
+    def get_motion_analyzer(self) -> Optional[MotionAnalyzer]:
+        return self._motion_analyzer
+
+    def analyze_motion(self, now: Optional[float] = None) -> int:
+        """
+        활성화된 모든 카메라의 현재 프레임으로 모션 분석
+        :return: 모션 이벤트가 발생한 카메라 수
+        """
+        analyzer = self._motion_analyzer
+        if not analyzer:
+            return 0
+        detected = 0
+        for camera in list(self._cameras.values()):
+            try:
+                if camera.analyze_motion(analyzer, now):
+                    detected += 1
+            except Exception as exc:
+                print(f"[CameraController] Motion analysis failed: {exc}")
+        return detected
+
+    def get_last_sampler_tick_seconds(self) -> float:
+        """
+        마지막 샘플링 주기(링 버퍼/녹화/모션 분석)에 걸린 시간
+        :return: 초 단위 소요 시간
+        """
+        return self._last_sampler_tick
+
+    def sample_pre_alarm_frames(self, now: Optional[float] = None) -> int:
+        """
+        활성화된 모든 카메라의 링 버퍼에 프레임 샘플링
+        :return: 저장된 프레임 수
+        """
+        sampled = 0
+        for camera in list(self._cameras.values()):
+            try:
+                if camera.sample_pre_alarm_frame(now):
+                    sampled += 1
+            except Exception as exc:
+                print(f"[CameraController] Pre-alarm sampling failed: {exc}")
+        return sampled
+
+    def start_frame_sampler(self) -> None:
+        """링 버퍼 샘플링/녹화를 수행하는 백그라운드 스레드 시작"""
+        if self._sampler_thread and self._sampler_thread.is_alive():
+            return
+        self._sampler_stop.clear()
+        self._sampler_thread = threading.Thread(
+            target=self._run_frame_sampler,
+            name="camera-frame-sampler",
+            daemon=True,
+        )
+        self._sampler_thread.start()
+
+    def stop_frame_sampler(self) -> None:
+        """백그라운드 샘플링 스레드 종료"""
+        self._sampler_stop.set()
+        if self._sampler_thread and self._sampler_thread is not threading.current_thread():
+            self._sampler_thread.join(timeout=1.0)
+        self._sampler_thread = None
+
+    def shutdown_capture(self, wait: bool = False) -> None:
+        """샘플링 스레드, 클립 기록기, 녹화 저장소를 모두 정리"""
+        self.stop_frame_sampler()
+        self.disable_pre_alarm_capture(wait=wait)
+        if self._recording_store:
+            self._recording_store.close()
+
+    def sample_frames(self, now: Optional[float] = None) -> int:
+        """
+        샘플링 주기 1회 - 카메라당 프레임을 한 번만 가져와
+        링 버퍼, 녹화, 모션 분석에 함께 전달
+        :param now: 단조 시계 기준 현재 시각 (테스트용)
+        :return: 프레임을 가져온 카메라 수
+        """
+        clip_writer = self._clip_writer
+        recording_store = self._recording_store
+        analyzer = self._motion_analyzer
+        captured = 0
+        for camera in list(self._cameras.values()):
+            try:
+                if not camera.is_enabled():
+                    continue
+                wants_ring = bool(clip_writer) and camera.get_pre_alarm_buffer().is_due(now)
+                wants_recording = bool(recording_store) and camera.is_recording()
+                if not (wants_ring or wants_recording or analyzer):
+                    continue
+                image = camera.capture_frame()
+                if image is None:
+                    continue
+                captured += 1
+                if wants_ring:
+                    camera.sample_pre_alarm_frame(now, image=image)
+                if wants_recording:
+                    camera.record_frame(image=image)
+                if analyzer:
+                    camera.analyze_motion(analyzer, now, image=image)
+            except Exception as exc:
+                print(f"[CameraController] Frame sampling failed: {exc}")
+        return captured
+
+    def _run_frame_sampler(self) -> None:
+        while not self._sampler_stop.is_set():
+            started = time.perf_counter()
+            self.sample_frames()
+            self._last_sampler_tick = time.perf_counter() - started
+            # 고정 주기 유지: 처리 시간을 뺀 만큼만 대기 (과부하 시에도 최소 간격 보장)
+            remaining = self._sample_interval - self._last_sampler_tick
+            self._sampler_stop.wait(max(remaining, self._sample_interval * 0.1))
+
+    def _flush_pre_alarm_frames(self, source: str) -> None:
+        """Freeze each enabled camera's ring and hand it to the clip writer."""
+        writer = self._clip_writer
+        if not writer or source not in PRE_ALARM_SOURCES:
+            return
+        for camera_id, camera in list(self._cameras.items()):
+            if not camera.is_enabled():
+                continue
+            frames = camera.freeze_pre_alarm_frames()
+            writer.submit(source, camera_id, frames, camera.display_view)
+
     def trigger_security_event(self, source: str) -> None:
         """Capture images from enabled cameras for a security event."""
         if not getattr(self, '_cameras', None):
@@ -343,20 +607,28 @@ class CameraController:
             return
 
         print(f"[CameraController] Security event '{source}' captured by cameras")
-        for camera_id, camera in self._cameras.items():
-            # SafeHomeCamera의 is_enabled() 메서드를 사용하여 활성화 상태 확인
-            if not camera.is_enabled():
-                continue
+        with TRACER.span("camera_controller.trigger_security_event", source=source,
+                         cameras=len(self._cameras)):
             try:
-                # SafeHomeCamera는 take_picture 메서드가 없을 수 있으므로
-                # display_view를 호출하거나 예외 처리
-                if hasattr(camera, 'take_picture'):
-                    camera.take_picture()
-                else:
-                    # take_picture가 없으면 display_view를 호출하여 이미지 캡처
-                    camera.display_view()
+                with TRACER.span("camera_controller.flush_pre_alarm_frames"):
+                    self._flush_pre_alarm_frames(source)
             except Exception as exc:
-                print(f'[CameraController] Failed to capture camera {camera_id}: {exc}')
+                print(f'[CameraController] Failed to flush pre-alarm frames: {exc}')
+            for camera_id, camera in self._cameras.items():
+                # SafeHomeCamera의 is_enabled() 메서드를 사용하여 활성화 상태 확인
+                if not camera.is_enabled():
+                    continue
+                try:
+                    # SafeHomeCamera는 take_picture 메서드가 없을 수 있으므로
+                    # display_view를 호출하거나 예외 처리
+                    with TRACER.span("camera.capture", camera_id=camera_id):
+                        if hasattr(camera, 'take_picture'):
+                            camera.take_picture()
+                        else:
+                            # take_picture가 없으면 display_view를 호출하여 이미지 캡처
+                            camera.display_view()
+                except Exception as exc:
+                    print(f'[CameraController] Failed to capture camera {camera_id}: {exc}')
 
     def get_camera_count(self) -> int:
         """
@@ -0,0 +1,185 @@
+"""
+PreAlarmBuffer - 카메라별 사전 알람 프레임 링 버퍼
+알람 직전 몇 초간의 압축 프레임을 메모리에 보관하고,
+INTRUSION/PANIC 발생 시 사후 프레임과 함께 디스크로 기록한다.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Deque, List, Optional, Sequence
+
+from PIL import Image
+
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+DEFAULT_MAX_FRAMES = 30
+DEFAULT_SAMPLE_INTERVAL = 1.0
+DEFAULT_JPEG_QUALITY = 70
+
+
+def encode_frame(image: Image.Image, quality: int = DEFAULT_JPEG_QUALITY) -> bytes:
+    """Compress a PIL image into JPEG bytes."""
+    buffer = BytesIO()
+    image.convert("RGB").save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+@dataclass(frozen=True)
+class BufferedFrame:
+    """A single compressed frame held in the ring."""
+
+    timestamp: float
+    data: bytes
+
+
+class PreAlarmBuffer:
+    """Bounded, thread-safe ring of recent JPEG frames for one camera."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_frames: int = DEFAULT_MAX_FRAMES,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+    ) -> None:
+        if max_bytes <= 0 or max_frames <= 0:
+            raise ValueError("max_bytes and max_frames must be positive")
+        self.max_bytes = max_bytes
+        self.max_frames = max_frames
+        self.sample_interval = max(sample_interval, 0.0)
+        self.jpeg_quality = jpeg_quality
+        self._frames: Deque[BufferedFrame] = deque()
+        self._total_bytes = 0
+        self._last_sample_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def is_due(self, now: Optional[float] = None) -> bool:
+        """Return True when enough time has passed since the last sample."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self._last_sample_at is None:
+                return True
+            return now - self._last_sample_at >= self.sample_interval
+
+    def append_image(self, image: Image.Image, now: Optional[float] = None) -> bool:
+        """Encode and store an image if the sampling interval has elapsed."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if (
+                self._last_sample_at is not None
+                and now - self._last_sample_at < self.sample_interval
+            ):
+                return False
+            self._last_sample_at = now
+        frame = BufferedFrame(timestamp=time.time(), data=encode_frame(image, self.jpeg_quality))
+        return self.append(frame)
+
+    def append(self, frame: BufferedFrame) -> bool:
+        """Store an already-encoded frame, evicting the oldest ones over the cap."""
+        size = len(frame.data)
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            self._frames.append(frame)
+            self._total_bytes += size
+            while self._frames and (
+                self._total_bytes > self.max_bytes or len(self._frames) > self.max_frames
+            ):
+                evicted = self._frames.popleft()
+                self._total_bytes -= len(evicted.data)
+        return True
+
+    def freeze(self) -> List[BufferedFrame]:
+        """Detach the current ring contents so they can be flushed."""
+        with self._lock:
+            frames = list(self._frames)
+            self._frames.clear()
+            self._total_bytes = 0
+        return frames
+
+    def clear(self) -> None:
+        self.freeze()
+
+    def frame_count(self) -> int:
+        with self._lock:
+            return len(self._frames)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+
+class EventClipWriter:
+    """Persists frozen pre-alarm frames plus post-event frames on a worker thread."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        *,
+        post_event_frames: int = 5,
+        post_event_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+    ) -> None:
+        self.output_dir = Path(output_dir)
+        self.post_event_frames = max(post_event_frames, 0)
+        self.post_event_interval = max(post_event_interval, 0.0)
+        self.jpeg_quality = jpeg_quality
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-clip")
+
+    def submit(
+        self,
+        source: str,
+        camera_id: int,
+        pre_frames: Sequence[BufferedFrame],
+        capture_post: Optional[Callable[[], Optional[Image.Image]]] = None,
+    ) -> Future:
+        """Queue a clip for writing; returns a Future resolving to the clip directory."""
+        started_at = datetime.now()
+        return self._executor.submit(
+            self._write_clip, source, camera_id, list(pre_frames), capture_post, started_at
+        )
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _write_clip(
+        self,
+        source: str,
+        camera_id: int,
+        pre_frames: List[BufferedFrame],
+        capture_post: Optional[Callable[[], Optional[Image.Image]]],
+        started_at: datetime,
+    ) -> Optional[Path]:
+        clip_dir = (
+            self.output_dir
+            / f"{started_at.strftime('%Y%m%d_%H%M%S_%f')}_{source.lower()}"
+            / f"camera{camera_id}"
+        )
+        try:
+            clip_dir.mkdir(parents=True, exist_ok=True)
+            for index, frame in enumerate(pre_frames):
+                (clip_dir / f"pre_{index:03d}_{frame.timestamp:.3f}.jpg").write_bytes(frame.data)
+
+            if capture_post:
+                for index in range(self.post_event_frames):
+                    if index and self.post_event_interval:
+                        time.sleep(self.post_event_interval)
+                    image = capture_post()
+                    if image is None:
+                        continue
+                    data = encode_frame(image, self.jpeg_quality)
+                    (clip_dir / f"post_{index:03d}_{time.time():.3f}.jpg").write_bytes(data)
+
+            print(f"[EventClipWriter] Camera {camera_id} clip written to {clip_dir}")
+            return clip_dir
+        except Exception as exc:
+            print(f"[EventClipWriter] Failed to write clip for camera {camera_id}: {exc}")
+            return None
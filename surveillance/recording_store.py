@@ -0,0 +1,308 @@
+"""
+RecordingStore - 카메라 녹화 프레임의 세그먼트 기반 디스크 저장소
+프레임은 시간 단위 세그먼트 파일에 순차 기록되고, 세그먼트마다
+(timestamp -> byte offset) 인덱스를 함께 유지하여 임의 시점 탐색을 지원한다.
+"""
+from __future__ import annotations
+
+import struct
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional
+
+
+# timestamp(float64), offset(uint64), length(uint32)
+INDEX_RECORD = struct.Struct("<dQI")
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+
+DEFAULT_SEGMENT_SECONDS = 60.0
+DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_TOTAL_BYTES = 512 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class RecordedFrame:
+    """A frame read back from the store."""
+
+    camera_id: int
+    timestamp: float
+    data: bytes
+
+
+@dataclass
+class Segment:
+    """One time-bounded segment file and its in-memory index."""
+
+    start_ts: float
+    data_path: Path
+    index_path: Path
+    timestamps: List[float] = field(default_factory=list)
+    offsets: List[int] = field(default_factory=list)
+    lengths: List[int] = field(default_factory=list)
+
+    @property
+    def end_ts(self) -> float:
+        return self.timestamps[-1] if self.timestamps else self.start_ts
+
+    @property
+    def size_bytes(self) -> int:
+        if not self.offsets:
+            return 0
+        return self.offsets[-1] + self.lengths[-1] + len(self.offsets) * INDEX_RECORD.size
+
+
+class _CameraTimeline:
+    """Ordered segments for a single camera plus the open writer handles."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.segments: List[Segment] = []
+        self.starts: List[float] = []
+        self.data_handle: Optional[BinaryIO] = None
+        self.index_handle: Optional[BinaryIO] = None
+
+    @property
+    def active(self) -> Optional[Segment]:
+        return self.segments[-1] if self.segments else None
+
+    def close_handles(self) -> None:
+        for handle in (self.data_handle, self.index_handle):
+            if handle:
+                handle.close()
+        self.data_handle = None
+        self.index_handle = None
+
+
+class RecordingStore:
+    """
+    Append-only, time-segmented frame store with age/size retention and
+    random access through per-segment indexes.
+    """
+
+    def __init__(
+        self,
+        root_dir: Path,
+        *,
+        segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+        max_age_seconds: Optional[float] = DEFAULT_MAX_AGE_SECONDS,
+        max_total_bytes: Optional[int] = DEFAULT_MAX_TOTAL_BYTES,
+    ) -> None:
+        if segment_seconds <= 0:
+            raise ValueError("segment_seconds must be positive")
+        self.root_dir = Path(root_dir)
+        self.segment_seconds = segment_seconds
+        self.max_age_seconds = max_age_seconds
+        self.max_total_bytes = max_total_bytes
+        self._timelines: Dict[int, _CameraTimeline] = {}
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append_frame(self, camera_id: int, data: bytes, timestamp: Optional[float] = None) -> bool:
+        """Append one encoded frame to the camera's active segment."""
+        if not data:
+            return False
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            timeline = self._timeline(camera_id)
+            active = timeline.active
+            if active and active.timestamps and timestamp < active.end_ts:
+                # Frames must be monotonic so the index stays sorted.
+                return False
+            rolled = False
+            if active is None or timestamp - active.start_ts >= self.segment_seconds:
+                active = self._open_segment(timeline, timestamp)
+                rolled = True
+            elif timeline.data_handle is None:
+                timeline.data_handle = open(active.data_path, "ab")
+                timeline.index_handle = open(active.index_path, "ab")
+
+            offset = timeline.data_handle.tell()
+            timeline.data_handle.write(data)
+            timeline.data_handle.flush()
+            timeline.index_handle.write(INDEX_RECORD.pack(timestamp, offset, len(data)))
+            timeline.index_handle.flush()
+
+            active.timestamps.append(timestamp)
+            active.offsets.append(offset)
+            active.lengths.append(len(data))
+
+            if rolled:
+                self.enforce_retention(now=timestamp)
+        return True
+
+    def close_camera(self, camera_id: int) -> None:
+        """Release the open file handles for a camera (e.g. when recording stops)."""
+        with self._lock:
+            timeline = self._timelines.get(camera_id)
+            if timeline:
+                timeline.close_handles()
+
+    def close(self) -> None:
+        with self._lock:
+            for timeline in self._timelines.values():
+                timeline.close_handles()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def get_frame_at(self, camera_id: int, t: float) -> Optional[RecordedFrame]:
+        """Return the latest frame recorded at or before ``t`` (seconds since epoch)."""
+        with self._lock:
+            timeline = self._timeline(camera_id)
+            seg_pos = bisect_right(timeline.starts, t) - 1
+            while seg_pos >= 0:
+                segment = timeline.segments[seg_pos]
+                frame_pos = bisect_right(segment.timestamps, t) - 1
+                if frame_pos >= 0:
+                    return self._read_frame(camera_id, timeline, segment, frame_pos)
+                seg_pos -= 1
+        return None
+
+    def get_time_range(self, camera_id: int) -> Optional[tuple]:
+        """Return (first_ts, last_ts) of what is on disk for a camera."""
+        with self._lock:
+            segments = [s for s in self._timeline(camera_id).segments if s.timestamps]
+            if not segments:
+                return None
+            return segments[0].timestamps[0], segments[-1].timestamps[-1]
+
+    def list_segments(self, camera_id: int) -> List[Segment]:
+        with self._lock:
+            return list(self._timeline(camera_id).segments)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            self._load_all_timelines()
+            return sum(
+                segment.size_bytes
+                for timeline in self._timelines.values()
+                for segment in timeline.segments
+            )
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def enforce_retention(self, now: Optional[float] = None) -> int:
+        """Delete closed segments that are too old or exceed the size budget."""
+        now = time.time() if now is None else now
+        removed = 0
+        with self._lock:
+            self._load_all_timelines()
+            if self.max_age_seconds is not None:
+                cutoff = now - self.max_age_seconds
+                for timeline in self._timelines.values():
+                    while len(timeline.segments) > 1 and timeline.segments[0].end_ts < cutoff:
+                        self._drop_oldest(timeline)
+                        removed += 1
+
+            if self.max_total_bytes is not None:
+                total = sum(
+                    s.size_bytes for tl in self._timelines.values() for s in tl.segments
+                )
+                while total > self.max_total_bytes:
+                    candidates = [tl for tl in self._timelines.values() if len(tl.segments) > 1]
+                    if not candidates:
+                        break
+                    oldest = min(candidates, key=lambda tl: tl.segments[0].start_ts)
+                    total -= oldest.segments[0].size_bytes
+                    self._drop_oldest(oldest)
+                    removed += 1
+        if removed:
+            print(f"[RecordingStore] Retention removed {removed} segment(s)")
+        return removed
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _camera_dir(self, camera_id: int) -> Path:
+        return self.root_dir / f"camera{camera_id}"
+
+    def _timeline(self, camera_id: int) -> _CameraTimeline:
+        timeline = self._timelines.get(camera_id)
+        if timeline is None:
+            timeline = self._load_timeline(camera_id)
+            self._timelines[camera_id] = timeline
+        return timeline
+
+    def _load_all_timelines(self) -> None:
+        if not self.root_dir.exists():
+            return
+        for directory in self.root_dir.glob("camera*"):
+            suffix = directory.name[len("camera"):]
+            if suffix.isdigit():
+                self._timeline(int(suffix))
+
+    def _load_timeline(self, camera_id: int) -> _CameraTimeline:
+        directory = self._camera_dir(camera_id)
+        timeline = _CameraTimeline(directory)
+        if not directory.exists():
+            return timeline
+
+        for index_path in sorted(directory.glob(f"*{INDEX_SUFFIX}")):
+            data_path = index_path.with_suffix(SEGMENT_SUFFIX)
+            if not data_path.exists():
+                continue
+            try:
+                start_ts = int(index_path.stem) / 1000.0
+            except ValueError:
+                continue
+            segment = Segment(start_ts=start_ts, data_path=data_path, index_path=index_path)
+            raw = index_path.read_bytes()
+            usable = len(raw) - len(raw) % INDEX_RECORD.size
+            for ts, offset, length in INDEX_RECORD.iter_unpack(raw[:usable]):
+                segment.timestamps.append(ts)
+                segment.offsets.append(offset)
+                segment.lengths.append(length)
+            timeline.segments.append(segment)
+
+        timeline.segments.sort(key=lambda s: s.start_ts)
+        timeline.starts = [s.start_ts for s in timeline.segments]
+        return timeline
+
+    def _open_segment(self, timeline: _CameraTimeline, start_ts: float) -> Segment:
+        timeline.close_handles()
+        timeline.directory.mkdir(parents=True, exist_ok=True)
+        stem = f"{int(start_ts * 1000):016d}"
+        segment = Segment(
+            start_ts=start_ts,
+            data_path=timeline.directory / f"{stem}{SEGMENT_SUFFIX}",
+            index_path=timeline.directory / f"{stem}{INDEX_SUFFIX}",
+        )
+        timeline.data_handle = open(segment.data_path, "ab")
+        timeline.index_handle = open(segment.index_path, "ab")
+        timeline.segments.append(segment)
+        timeline.starts.append(start_ts)
+        return segment
+
+    def _read_frame(
+        self, camera_id: int, timeline: _CameraTimeline, segment: Segment, position: int
+    ) -> Optional[RecordedFrame]:
+        if segment is timeline.active and timeline.data_handle:
+            timeline.data_handle.flush()
+        try:
+            with open(segment.data_path, "rb") as handle:
+                handle.seek(segment.offsets[position])
+                data = handle.read(segment.lengths[position])
+        except OSError as exc:
+            print(f"[RecordingStore] Failed to read frame for camera {camera_id}: {exc}")
+            return None
+        return RecordedFrame(camera_id=camera_id, timestamp=segment.timestamps[position], data=data)
+
+    def _drop_oldest(self, timeline: _CameraTimeline) -> None:
+        segment = timeline.segments.pop(0)
+        timeline.starts.pop(0)
+        for path in (segment.data_path, segment.index_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -8,6 +8,9 @@ import sys
 from pathlib import Path
 
 from devices.camera import Camera as SensorCamera
+from surveillance.motion_analyzer import MotionAnalyzer
+from surveillance.pre_alarm_buffer import BufferedFrame, PreAlarmBuffer, encode_frame
+from surveillance.recording_store import RecordingStore
 from utils.constants import STATE_IDLE, VIRTUAL_DEVICE_DIR
 
 # Add the appropriate virtual_device folder to sys.path for DeviceCamera import.
@@ -16,7 +19,7 @@ virtual_device_path = project_root / VIRTUAL_DEVICE_DIR
 if virtual_device_path.exists() and str(virtual_device_path) not in sys.path:
     sys.path.append(str(virtual_device_path))
 
-from device.device_camera import DeviceCamera as VirtualDeviceCamera
+from device.device_camera import DeviceCamera as VirtualDeviceCamera, preload_camera_assets
 
 
 class SafeHomeCamera(SensorCamera):
@@ -40,21 +43,14 @@ class SafeHomeCamera(SensorCamera):
         self._enabled: bool = True
         self._zoom_level: int = 1
         self._pan_angle: float = 0.0
+        self._pre_alarm_buffer: PreAlarmBuffer = PreAlarmBuffer()
+        self._recording_store: Optional[RecordingStore] = None
+        self._is_recording: bool = False
 
-        # DeviceCamera 인스턴스 생성 및 ID 설정
-        # 이미지 파일은 virtual_device 폴더에 있으므로 작업 디렉토리 변경 필요
-        import os
-        original_cwd = os.getcwd()
-        try:
-            virtual_device_dir = project_root / VIRTUAL_DEVICE_DIR
-            if virtual_device_dir.exists():
-                os.chdir(str(virtual_device_dir))
-
-            self._device_camera: VirtualDeviceCamera = VirtualDeviceCamera()
-            self._device_camera.set_id(camera_id)
-        finally:
-            # 원래 작업 디렉토리로 복원
-            os.chdir(original_cwd)
+        # DeviceCamera는 자신의 디렉토리 기준 경로로 이미지를 로드하므로
+        # 작업 디렉토리를 변경할 필요가 없음 (디코딩된 이미지는 프로세스 전역 캐시 공유)
+        self._device_camera: VirtualDeviceCamera = VirtualDeviceCamera()
+        self._device_camera.set_id(camera_id)
     
     def get_location(self) -> List[int]:
         """
@@ -98,9 +94,10 @@ class SafeHomeCamera(SensorCamera):
         print(f"[SafeHomeCamera] Camera ID set to {camera_id}")
         return True
     
-    def display_view(self) -> Optional[Image.Image]:
+    def display_view(self, size: Optional[int] = None) -> Optional[Image.Image]:
         """
         카메라 뷰 표시 (DeviceCamera를 통해 실제 이미지 가져오기)
+        :param size: 정사각형 출력 크기 (픽셀, 기본값은 DeviceCamera.RETURN_SIZE)
         :return: 카메라 이미지 (PIL Image) 또는 None
         """
         if not self._enabled:
@@ -108,8 +105,10 @@ class SafeHomeCamera(SensorCamera):
             return None
         
         try:
-            # DeviceCamera의 get_view() 메서드 사용
-            return self._device_camera.get_view()
+            # DeviceCamera의 get_view() 메서드 사용 (썸네일은 해당 크기로 직접 렌더링)
+            if size is None:
+                return self._device_camera.get_view()
+            return self._device_camera.get_view(size=size)
         except Exception as e:
             print(f"[SafeHomeCamera] Failed to display view: {e}")
             return None
@@ -188,10 +187,115 @@ class SafeHomeCamera(SensorCamera):
             pass
         return True
 
+    def capture_frame(self) -> Optional[Image.Image]:
+        """
+        샘플링용 현재 프레임 1장 (비활성/실패 시 None)
+        :return: 카메라 이미지 (PIL Image) 또는 None
+        """
+        if not self._enabled:
+            return None
+        try:
+            return self._device_camera.get_view()
+        except Exception as e:
+            print(f"[SafeHomeCamera] Failed to capture frame: {e}")
+            return None
+
+    def sample_pre_alarm_frame(self, now: Optional[float] = None,
+                               image: Optional[Image.Image] = None) -> bool:
+        """
+        사전 알람 링 버퍼에 현재 프레임 저장 (샘플링 간격이 지난 경우에만)
+        :param now: 단조 시계 기준 현재 시각 (테스트용)
+        :param image: 이미 가져온 프레임 (None이면 새로 가져옴)
+        :return: 프레임 저장 여부
+        """
+        if not self._enabled or not self._pre_alarm_buffer.is_due(now):
+            return False
+        if image is None:
+            image = self.capture_frame()
+        if image is None:
+            return False
+        return self._pre_alarm_buffer.append_image(image, now)
+
+    def analyze_motion(self, analyzer: MotionAnalyzer, now: Optional[float] = None,
+                       image: Optional[Image.Image] = None) -> bool:
+        """
+        현재 프레임을 모션 분석기에 전달 (팬/줌 변경 시에는 기준 프레임만 갱신)
+        :param analyzer: MotionAnalyzer 객체
+        :param now: 단조 시계 기준 현재 시각 (테스트용)
+        :param image: 이미 가져온 프레임 (None이면 새로 가져옴)
+        :return: 모션 이벤트 발생 여부
+        """
+        if not self._enabled:
+            return False
+        if image is None:
+            image = self.capture_frame()
+        if image is None:
+            return False
+        event = analyzer.process(
+            self._id,
+            image,
+            view_key=(self._pan_angle, self._zoom_level),
+            now=now,
+            sensor_id=self.device_id,
+        )
+        return event is not None
+
+    def freeze_pre_alarm_frames(self) -> List[BufferedFrame]:
+        """
+        알람 발생 시 링 버퍼 내용을 분리하여 반환
+        :return: 오래된 순서의 압축 프레임 리스트
+        """
+        return self._pre_alarm_buffer.freeze()
+
+    def get_pre_alarm_buffer(self) -> PreAlarmBuffer:
+        """
+        사전 알람 링 버퍼 조회
+        :return: PreAlarmBuffer 객체
+        """
+        return self._pre_alarm_buffer
+
+    def attach_recording_store(self, store: Optional[RecordingStore]) -> None:
+        """
+        녹화 프레임을 기록할 저장소 연결
+        :param store: RecordingStore 객체 또는 None
+        """
+        self._recording_store = store
+
+    def start_recording(self) -> None:
+        """Start recording; frames are persisted while a store is attached."""
+        super().start_recording()
+        self._is_recording = True
+
     def stop_recording(self) -> None:
         """Stop recording and reset the base camera status."""
         self.status = STATE_IDLE.lower()
+        self._is_recording = False
+        if self._recording_store:
+            self._recording_store.close_camera(self._id)
         print(f"[SafeHomeCamera] Camera {self._id} stopped recording")
+
+    def is_recording(self) -> bool:
+        """
+        녹화 중 여부 조회
+        :return: 녹화 중 여부
+        """
+        return self._is_recording
+
+    def record_frame(self, timestamp: Optional[float] = None,
+                     image: Optional[Image.Image] = None) -> bool:
+        """
+        녹화 중이면 현재 프레임을 인코딩하여 저장소에 추가
+        :param timestamp: 프레임 시각 (epoch 초, 기본값은 현재 시각)
+        :param image: 이미 가져온 프레임 (None이면 새로 가져옴)
+        :return: 기록 여부
+        """
+        if not (self._enabled and self._is_recording and self._recording_store):
+            return False
+        if image is None:
+            image = self.capture_frame()
+        if image is None:
+            return False
+        return self._recording_store.append_frame(self._id, encode_frame(image), timestamp)
     
     def get_password(self) -> str:
         """
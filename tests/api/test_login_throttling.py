@@ -0,0 +1,135 @@
+"""Tests for the token-bucket limiter and login throttling on /api/login/*."""
+
+from __future__ import annotations
+
+import pytest
+
+import main as main_app
+from auth.login_throttle import LoginThrottle
+from utils.metrics import LOGIN_THROTTLED_TOTAL
+from utils.rate_limiter import TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucketLimiter:
+    def test_allows_burst_then_reports_retry_after(self):
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(3, 0.5, clock=clock)
+
+        assert [limiter.acquire("ip") for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.acquire("ip") == pytest.approx(2.0)
+
+    def test_refills_over_time(self):
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(1, 1.0, clock=clock)
+        limiter.acquire("ip")
+        assert limiter.acquire("ip") > 0
+
+        clock.now += 1.0
+
+        assert limiter.acquire("ip") == 0.0
+
+    def test_keys_are_independent(self):
+        limiter = TokenBucketLimiter(1, 0.1, clock=FakeClock())
+        assert limiter.acquire("a") == 0.0
+        assert limiter.acquire("b") == 0.0
+        assert limiter.acquire("a") > 0
+
+    def test_idle_keys_are_evicted(self):
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(2, 1.0, shards=1, idle_seconds=10, clock=clock)
+        limiter.acquire("old")
+
+        clock.now += 11
+        limiter.acquire("new")
+
+        assert len(limiter) == 1
+
+    def test_max_keys_bounds_memory(self):
+        limiter = TokenBucketLimiter(1, 1.0, shards=2, max_keys=4, clock=FakeClock())
+        for index in range(50):
+            limiter.acquire(f"user-{index}")
+        assert len(limiter) <= 4
+
+    def test_rejects_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            TokenBucketLimiter(0, 1.0)
+        with pytest.raises(ValueError):
+            TokenBucketLimiter(1, 0)
+
+
+class TestLoginThrottle:
+    def test_username_limit_applies_across_ips(self):
+        clock = FakeClock()
+        throttle = LoginThrottle(
+            ip_limiter=TokenBucketLimiter(100, 1.0, clock=clock),
+            username_limiter=TokenBucketLimiter(2, 0.1, clock=clock),
+        )
+        before = LOGIN_THROTTLED_TOTAL.get("username")
+
+        assert throttle.check("10.0.0.1", "Admin") == 0.0
+        assert throttle.check("10.0.0.2", "admin ") == 0.0
+        assert throttle.check("10.0.0.3", "admin") > 0
+
+        assert LOGIN_THROTTLED_TOTAL.get("username") == before + 1
+
+
+@pytest.fixture
+def strict_throttle(monkeypatch):
+    clock = FakeClock()
+    throttle = LoginThrottle(
+        ip_limiter=TokenBucketLimiter(2, 0.1, clock=clock),
+        username_limiter=TokenBucketLimiter(100, 1.0, clock=clock),
+    )
+    monkeypatch.setattr(main_app, "login_throttle", throttle)
+    return throttle
+
+
+def test_first_login_rejected_before_login_manager(client, strict_throttle, safehome_system_instance, monkeypatch):
+    calls = []
+    login_manager = safehome_system_instance.login_manager
+    monkeypatch.setattr(
+        login_manager,
+        "validate_first_password",
+        lambda *args: calls.append(args) or {"success": False, "message": "Incorrect first password"},
+    )
+
+    statuses = [
+        client.post("/api/login/first", json={"username": "homeowner", "password": "bad"}).status_code
+        for _ in range(3)
+    ]
+
+    assert statuses == [401, 401, 429]
+    assert len(calls) == 2
+
+    response = client.post("/api/login/first", json={"username": "homeowner", "password": "bad"})
+    payload = response.get_json()
+    assert payload["throttled"] is True
+    assert int(response.headers["Retry-After"]) == payload["retry_after"] >= 1
+
+
+def test_second_login_is_throttled(client, strict_throttle, safehome_system_instance, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        safehome_system_instance.login_manager,
+        "validate_second_password",
+        lambda *args: calls.append(args) or {"success": False, "message": "Incorrect second password"},
+    )
+    with client.session_transaction() as session:
+        session["first_validated"] = True
+        session["temp_username"] = "homeowner"
+
+    statuses = [
+        client.post("/api/login/second", json={"second_password": "bad"}).status_code
+        for _ in range(3)
+    ]
+
+    assert statuses[-1] == 429
+    assert len(calls) == 2
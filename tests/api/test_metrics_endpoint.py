@@ -0,0 +1,128 @@
+"""Tests for the in-process metrics registry and the /metrics endpoint."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from security.events import SensorEvent, SensorStatus, SensorType
+from security.security_system import SecurityMode, SecuritySystem
+from storage.storage_manager import StorageManager
+from utils.metrics import (
+    HTTP_RESPONSES_TOTAL,
+    PROMETHEUS_CONTENT_TYPE,
+    STORAGE_QUERY_SECONDS,
+    Counter,
+    Histogram,
+)
+
+
+class TestHistogram:
+    def test_buckets_are_cumulative_in_exposition(self):
+        histogram = Histogram("test_latency_seconds", "Test.", ("route",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, "a")
+        histogram.observe(0.5, "a")
+        histogram.observe(3.0, "a")
+
+        lines = histogram.collect()
+
+        assert 'test_latency_seconds_bucket{route="a",le="0.1"} 1' in lines
+        assert 'test_latency_seconds_bucket{route="a",le="1"} 2' in lines
+        assert 'test_latency_seconds_bucket{route="a",le="+Inf"} 3' in lines
+        assert 'test_latency_seconds_count{route="a"} 3' in lines
+        assert histogram.get_sum("a") == pytest.approx(3.55)
+
+    def test_bucket_bound_is_inclusive(self):
+        histogram = Histogram("test_bound_seconds", "Test.", buckets=(0.1,))
+        histogram.observe(0.1)
+        assert "test_bound_seconds_bucket{le=\"0.1\"} 1" in histogram.collect()
+
+    def test_rejects_unsorted_buckets(self):
+        with pytest.raises(ValueError):
+            Histogram("bad", "Bad.", buckets=(1.0, 0.5))
+
+    def test_label_values_are_escaped(self):
+        counter = Counter("test_total", "Test.", ("path",))
+        counter.inc('a"b\\c')
+        assert counter.collect() == ['test_total{path="a\\"b\\\\c"} 1']
+
+    def test_observe_overhead_is_a_few_microseconds(self):
+        histogram = Histogram("test_overhead_seconds", "Test.", ("method", "endpoint"))
+        iterations = 20000
+        started = time.perf_counter()
+        for _ in range(iterations):
+            histogram.observe(0.001, "GET", "api_security_status")
+        per_call = (time.perf_counter() - started) / iterations
+        print(f"\n[metrics] observe: {per_call * 1e6:.2f} us/call")
+        assert per_call < 10e-6
+
+
+def _security_system(recorder):
+    return SecuritySystem(
+        get_delay_time=lambda: timedelta(seconds=0),
+        call_monitoring_service=lambda reason: None,
+        activate_siren=lambda: None,
+        deactivate_siren=lambda: None,
+        get_monitored_sensors_state=lambda: {},
+        latency_recorder=recorder,
+    )
+
+
+def test_security_system_reports_event_latency():
+    recorded = []
+    security = _security_system(lambda name, seconds: recorded.append((name, seconds)))
+    security.register_sensor("door", SensorType.DOOR)
+    security.assign_sensor_to_zone("door", "1")
+    security.arm(SecurityMode.AWAY)
+    security.handle_sensor_event(
+        SensorEvent("door", "1", SensorType.DOOR, SensorStatus.OPEN, datetime.utcnow())
+    )
+    security.disarm(cleared_by="test")
+
+    names = [name for name, _ in recorded]
+    assert names == ["arm", "sensor_event", "disarm"]
+    assert all(seconds >= 0 for _, seconds in recorded)
+
+
+@pytest.mark.usefixtures("safehome_system_instance")
+class TestMetricsEndpoint:
+    def test_exposes_prometheus_text(self, auth_client):
+        auth_client.get("/api/security/status")
+        before = HTTP_RESPONSES_TOTAL.get("GET", "api_security_status", "200")
+        auth_client.get("/api/security/status")
+
+        response = auth_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == PROMETHEUS_CONTENT_TYPE
+        body = response.get_data(as_text=True)
+        assert "# TYPE safehome_http_request_duration_seconds histogram" in body
+        assert 'safehome_http_request_duration_seconds_count{method="GET",endpoint="api_security_status"}' in body
+        assert "# TYPE safehome_storage_query_duration_seconds histogram" in body
+        assert "# TYPE safehome_security_event_duration_seconds histogram" in body
+        assert HTTP_RESPONSES_TOTAL.get("GET", "api_security_status", "200") == before + 1
+
+    def test_requires_login(self, client):
+        response = client.get("/metrics")
+
+        assert response.status_code == 401
+        assert "safehome_http" not in response.get_data(as_text=True)
+
+    def test_bearer_token_allows_scraping_without_session(self, client, monkeypatch):
+        import main
+
+        monkeypatch.setenv(main.METRICS_TOKEN_ENV, "scrape-secret")
+
+        allowed = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        denied = client.get("/metrics", headers={"Authorization": "Bearer wrong"})
+
+        assert allowed.status_code == 200
+        assert allowed.headers["Content-Type"] == PROMETHEUS_CONTENT_TYPE
+        assert denied.status_code == 401
+
+    def test_storage_queries_are_timed(self):
+        before = STORAGE_QUERY_SECONDS.get_count("query")
+        StorageManager().execute_query("SELECT 1")
+        assert STORAGE_QUERY_SECONDS.get_count("query") == before + 1
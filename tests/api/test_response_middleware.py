@@ -0,0 +1,126 @@
+"""Tests for ETag/If-None-Match handling and negotiated response compression."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+from flask import Flask, Response, jsonify
+
+from utils.response_middleware import ResponseMiddleware
+
+
+@pytest.fixture
+def small_app():
+    app = Flask(__name__)
+    ResponseMiddleware(app, min_size=256)
+
+    @app.route("/big")
+    def big():
+        return jsonify({"items": [{"id": i, "name": f"sensor-{i}"} for i in range(200)]})
+
+    @app.route("/small")
+    def small():
+        return jsonify({"ok": True})
+
+    @app.route("/png")
+    def png():
+        return Response(b"\x89PNG" + b"\x00" * 4096, mimetype="image/png")
+
+    @app.route("/stream")
+    def stream():
+        return Response((chunk for chunk in ["data: 1\n\n"] * 200), mimetype="text/event-stream")
+
+    @app.route("/write", methods=["POST"])
+    def write():
+        return jsonify({"items": list(range(500))})
+
+    return app
+
+
+class TestConditionalGet:
+    def test_get_carries_etag_and_revalidation_cache_control(self, small_app):
+        response = small_app.test_client().get("/small")
+        assert response.status_code == 200
+        assert response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+    def test_matching_if_none_match_returns_empty_304(self, small_app):
+        client = small_app.test_client()
+        etag = client.get("/big").headers["ETag"]
+
+        response = client.get("/big", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+
+    def test_compressed_etag_revalidates(self, small_app):
+        client = small_app.test_client()
+        etag = client.get("/big", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+        assert etag.startswith('W/"')
+
+        response = client.get("/big", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_post_responses_get_no_etag(self, small_app):
+        response = small_app.test_client().post("/write")
+        assert "ETag" not in response.headers
+
+
+class TestCompression:
+    def test_gzip_above_threshold(self, small_app):
+        plain = small_app.test_client().get("/big")
+        response = small_app.test_client().get("/big", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert int(response.headers["Content-Length"]) < int(plain.headers["Content-Length"])
+        assert json.loads(gzip.decompress(response.data)) == plain.get_json()
+
+    def test_no_compression_without_accept_encoding(self, small_app):
+        response = small_app.test_client().get("/big")
+        assert "Content-Encoding" not in response.headers
+
+    def test_small_bodies_and_images_are_not_compressed(self, small_app):
+        client = small_app.test_client()
+        assert "Content-Encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        assert "Content-Encoding" not in client.get("/png", headers={"Accept-Encoding": "gzip"}).headers
+
+    def test_streaming_responses_are_untouched(self, small_app):
+        response = small_app.test_client().get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+        assert "ETag" not in response.headers
+
+    def test_post_responses_are_compressed(self, small_app):
+        response = small_app.test_client().post("/write", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+
+
+@pytest.mark.usefixtures("safehome_system_instance")
+class TestAppIntegration:
+    def test_thumbnails_are_gzip_encoded(self, auth_client):
+        response = auth_client.get("/api/cameras/thumbnails", headers={"Accept-Encoding": "gzip"})
+        if response.status_code != 200:
+            pytest.skip("camera thumbnails not available")
+        assert response.headers["Content-Encoding"] == "gzip"
+        payload = json.loads(gzip.decompress(response.data))
+        assert payload["image"].startswith("data:image/png;base64,")
+
+    def test_unchanged_zone_list_returns_304(self, auth_client):
+        first = auth_client.get("/api/security/zones")
+        assert first.status_code == 200
+
+        second = auth_client.get("/api/security/zones", headers={"If-None-Match": first.headers["ETag"]})
+        assert second.status_code == 304
+
+    def test_sensor_snapshot_revalidates_when_compressed(self, auth_client):
+        headers = {"Accept-Encoding": "gzip"}
+        first = auth_client.get("/api/security/sensors", headers=headers)
+        assert first.status_code == 200
+
+        second = auth_client.get(
+            "/api/security/sensors", headers={**headers, "If-None-Match": first.headers["ETag"]}
+        )
+        assert second.status_code == 304
@@ -0,0 +1,102 @@
+"""Tests for the batch sensor-trigger and batch assignment endpoints."""
+
+from __future__ import annotations
+
+import pytest
+
+from utils.constants import STATE_CLEAR, STATE_CLOSED, STATE_DETECTED, STATE_OPEN
+
+
+def test_batch_endpoints_require_login(client):
+    assert client.post("/api/security/sensors/trigger/batch", json={"triggers": []}).status_code == 401
+    assert client.post("/api/security/assignments/batch", json={"assignments": []}).status_code == 401
+
+
+@pytest.mark.usefixtures("safehome_system_instance")
+class TestBatchTrigger:
+    def test_rejects_empty_or_missing_array(self, auth_client):
+        assert auth_client.post("/api/security/sensors/trigger/batch", json={}).status_code == 400
+        assert auth_client.post(
+            "/api/security/sensors/trigger/batch", json={"triggers": []}
+        ).status_code == 400
+
+    def test_returns_per_item_results(self, auth_client, safehome_system_instance):
+        door = safehome_system_instance.get_sensor("Front Door")
+        motion = safehome_system_instance.get_sensor("Living Room")
+        if door is None or motion is None:
+            pytest.skip("default sensors not available")
+        door.set_closed()
+        motion.clear_motion()
+
+        response = auth_client.post(
+            "/api/security/sensors/trigger/batch",
+            json={"triggers": [
+                {"device_id": "Front Door"},
+                {"device_id": "Living Room", "action": "trigger"},
+                {"device_id": "No Such Sensor"},
+                {"device_id": "Front Door", "action": "explode"},
+            ]},
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["applied"] == 2
+        assert data["failed"] == 2
+        assert data["success"] is False
+        results = data["results"]
+        assert [r["success"] for r in results] == [True, True, False, False]
+        assert results[0]["sensor_status"] == "Open"
+        assert results[1]["sensor_status"] == "Motion Detected"
+        assert "not found" in results[2]["message"]
+        assert door.get_status() == STATE_OPEN
+        assert motion.get_status() == STATE_DETECTED
+
+        door.set_closed()
+        motion.clear_motion()
+        assert door.get_status() == STATE_CLOSED
+        assert motion.get_status() == STATE_CLEAR
+
+
+@pytest.mark.usefixtures("safehome_system_instance")
+class TestBatchAssignments:
+    def test_applies_valid_items_and_reports_invalid_ones(self, auth_client, safehome_system_instance):
+        config = safehome_system_instance.configuration_manager
+        assert config.add_safety_zone("Batch Zone")
+        zone_id = config.get_safety_zone_info()[-1].zone_id
+        try:
+            response = auth_client.post(
+                "/api/security/assignments/batch",
+                json={"assignments": [
+                    {"device_id": "Front Door", "zone_id": zone_id},
+                    {"device_id": "Living Room", "zone_id": str(zone_id)},
+                    {"device_id": "Ghost", "zone_id": zone_id},
+                    {"device_id": "Garden Cam", "zone_id": 987654},
+                ]},
+            )
+
+            assert response.status_code == 200
+            data = response.get_json()
+            assert [r["success"] for r in data["results"]] == [True, True, False, False]
+            assert data["applied"] == 2
+            assert data["snapshot_version"] == config.get_sensor_snapshot_version()
+            assert "sensors" not in data
+
+            assignments = config.list_sensor_assignments()
+            assert assignments["Front Door"] == zone_id
+            assert assignments["Living Room"] == zone_id
+            security = safehome_system_instance.security_system
+            assert security._sensor_zones.get("Front Door") == str(zone_id)  # pylint: disable=protected-access
+
+            response = auth_client.post(
+                "/api/security/assignments/batch",
+                json={"assignments": [
+                    {"device_id": "Front Door", "zone_id": None},
+                    {"device_id": "Living Room", "zone_id": None},
+                ]},
+            )
+            assert response.get_json()["applied"] == 2
+            assert "Front Door" not in config.list_sensor_assignments()
+        finally:
+            config.remove_sensor_assignment("Front Door")
+            config.remove_sensor_assignment("Living Room")
+            config.delete_safety_zone(zone_id)
@@ -0,0 +1,94 @@
+"""Tests for the /api/security/events Server-Sent Events endpoint."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def _read_chunks(response, count):
+    chunks = []
+    iterator = iter(response.response)
+    for _ in range(count):
+        chunk = next(iterator)
+        chunks.append(chunk.decode() if isinstance(chunk, bytes) else chunk)
+    return chunks
+
+
+def test_events_require_login(client):
+    response = client.get("/api/security/events")
+    assert response.status_code == 401
+
+
+@pytest.mark.usefixtures("safehome_system_instance")
+class TestSecurityEventsStream:
+    def test_new_client_gets_status_snapshot(self, auth_client):
+        response = auth_client.get("/api/security/events", buffered=False)
+        try:
+            assert response.status_code == 200
+            assert response.mimetype == "text/event-stream"
+            retry, snapshot = _read_chunks(response, 2)
+        finally:
+            response.close()
+
+        assert retry.startswith("retry: ")
+        assert "event: status" in snapshot
+        assert '"mode":' in snapshot
+
+    def test_resume_replays_events_after_last_event_id(self, auth_client, safehome_system_instance):
+        stream = safehome_system_instance.security_event_stream
+        last_id = stream.publish("status", {"mode": "TEST_BEFORE"})
+        next_id = stream.publish("alarm_cleared", {"cleared_by": "tester"})
+
+        response = auth_client.get(
+            "/api/security/events",
+            headers={"Last-Event-ID": str(last_id)},
+            buffered=False,
+        )
+        try:
+            _, replayed = _read_chunks(response, 2)
+        finally:
+            response.close()
+
+        assert replayed.startswith(f"id: {next_id}\nevent: alarm_cleared")
+        assert "TEST_BEFORE" not in replayed
+
+    def test_closed_stream_is_unavailable(self, auth_client, safehome_system_instance, monkeypatch):
+        from security.event_stream import SecurityEventStream
+
+        closed = SecurityEventStream()
+        closed.close()
+        monkeypatch.setattr(safehome_system_instance, "security_event_stream", closed)
+
+        response = auth_client.get("/api/security/events")
+
+        assert response.status_code == 503
+
+    def test_closing_the_stream_ends_the_response(self, auth_client, safehome_system_instance, monkeypatch):
+        from security.event_stream import SecurityEventStream
+
+        stream = SecurityEventStream()
+        monkeypatch.setattr(safehome_system_instance, "security_event_stream", stream)
+        response = auth_client.get("/api/security/events", buffered=False)
+        try:
+            iterator = iter(response.response)
+            next(iterator), next(iterator)  # retry + snapshot
+            stream.close()
+            with pytest.raises(StopIteration):
+                next(iterator)
+        finally:
+            response.close()
+
+    def test_response_ends_after_max_stream_lifetime(self, auth_client, monkeypatch):
+        import main
+
+        monkeypatch.setattr(main, "SSE_MAX_STREAM_SECONDS", 0.05)
+        response = auth_client.get("/api/security/events", buffered=False)
+        try:
+            chunks = [chunk.decode() if isinstance(chunk, bytes) else chunk for chunk in response.response]
+        finally:
+            response.close()
+
+        assert chunks[0].startswith("retry: ")
+        assert "event: status" in chunks[1]
+        # Iteration finished on its own: the generator returned at the deadline.
+        assert all(chunk == ": keepalive\n\n" for chunk in chunks[2:])
@@ -0,0 +1,94 @@
+"""Tests for the cached, versioned sensor/zone snapshot behind GET /api/security/sensors."""
+
+from __future__ import annotations
+
+import pytest
+
+from storage.storage_manager import StorageManager
+
+
+@pytest.fixture
+def query_counter(monkeypatch):
+    """Count StorageManager.execute_query calls made during a test."""
+    calls = []
+    original = StorageManager.execute_query
+
+    def counting(self, *args, **kwargs):
+        calls.append(args[0] if args else kwargs.get("sql"))
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(StorageManager, "execute_query", counting)
+    return calls
+
+
+@pytest.mark.usefixtures("safehome_system_instance")
+class TestSensorSnapshotEndpoint:
+    def test_response_carries_etag(self, auth_client):
+        response = auth_client.get("/api/security/sensors")
+
+        assert response.status_code == 200
+        assert response.headers.get("ETag")
+        data = response.get_json()
+        assert data["success"] is True
+        assert any(sensor["device_id"] == "Front Door" for sensor in data["sensors"])
+
+    def test_unchanged_poll_returns_304_without_database_access(self, auth_client, query_counter):
+        etag = auth_client.get("/api/security/sensors").headers["ETag"]
+        query_counter.clear()
+
+        response = auth_client.get("/api/security/sensors", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert query_counter == []
+
+    def test_assignment_write_changes_etag(self, auth_client, safehome_system_instance):
+        config = safehome_system_instance.configuration_manager
+        first = auth_client.get("/api/security/sensors")
+        version = config.get_sensor_snapshot_version()
+
+        assert config.add_safety_zone("Snapshot Test Zone")
+        zone_id = config.get_safety_zone_info()[-1].zone_id
+        assert config.get_sensor_snapshot_version() > version
+        assert config.assign_sensor_to_zone("Front Door", zone_id)
+        try:
+            response = auth_client.get(
+                "/api/security/sensors", headers={"If-None-Match": first.headers["ETag"]}
+            )
+            assert response.status_code == 200
+            sensor = next(s for s in response.get_json()["sensors"] if s["device_id"] == "Front Door")
+            assert sensor["zone_id"] == zone_id
+        finally:
+            config.remove_sensor_assignment("Front Door")
+            config.delete_safety_zone(zone_id)
+
+    def test_sensor_status_change_changes_etag(self, auth_client, safehome_system_instance):
+        sensor = safehome_system_instance.get_sensor("Front Door")
+        if sensor is None or not hasattr(sensor, "set_open"):
+            pytest.skip("Front Door sensor not available")
+        sensor.set_closed()
+        etag = auth_client.get("/api/security/sensors").headers["ETag"]
+
+        sensor.set_open()
+        try:
+            response = auth_client.get("/api/security/sensors", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+        finally:
+            sensor.set_closed()
+
+    def test_etag_from_previous_configuration_manager_does_not_match(
+        self, auth_client, safehome_system_instance, monkeypatch
+    ):
+        config = safehome_system_instance.configuration_manager
+        etag = auth_client.get("/api/security/sensors").headers["ETag"]
+
+        # A reset or restart builds a new ConfigurationManager whose version
+        # counter starts over; only its epoch differs.
+        version = config.get_sensor_snapshot_version()
+        monkeypatch.setattr(config, "_snapshot_epoch", "restarted")
+        monkeypatch.setattr(config, "_snapshot_version", version - 1)
+        config.invalidate_sensor_snapshot()
+        response = auth_client.get("/api/security/sensors", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
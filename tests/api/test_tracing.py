@@ -0,0 +1,143 @@
+"""Tests for span tracing of the sensor -> alarm -> camera path and the trace dump endpoints."""
+
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from domain.system import SystemCameraGateway
+from domain.system_controller import SystemController
+from security.events import SensorType
+from security.security_system import SecurityMode, SecuritySystem
+from surveillance.camera_controller import CameraController
+from utils.constants import SENSOR_WIN_DOOR, STATE_CLOSED
+from utils.tracing import TRACER, Tracer, current_trace_id
+
+
+class TestTracer:
+    def test_nested_spans_share_trace_and_link_parents(self):
+        tracer = Tracer()
+        with tracer.span("root", device="d1") as root:
+            assert current_trace_id() == root.trace_id
+            with tracer.span("child") as child:
+                pass
+
+        spans = tracer.get_trace(root.trace_id)
+        assert [s["name"] for s in spans] == ["root", "child"]
+        assert spans[1]["parent_id"] == root.span_id
+        assert spans[0]["attributes"] == {"device": "d1"}
+        assert child.duration_ms <= root.duration_ms
+        assert current_trace_id() is None
+
+    def test_sibling_roots_get_distinct_traces(self):
+        tracer = Tracer()
+        with tracer.span("a") as first:
+            pass
+        with tracer.span("b") as second:
+            pass
+        assert first.trace_id != second.trace_id
+        assert [t["root"] for t in tracer.recent_traces()] == ["b", "a"]
+
+    def test_exceptions_are_recorded(self):
+        tracer = Tracer()
+        with pytest.raises(RuntimeError):
+            with tracer.span("boom") as span:
+                raise RuntimeError("siren offline")
+        assert tracer.get_trace(span.trace_id)[0]["error"] == "RuntimeError: siren offline"
+
+    def test_ring_buffer_evicts_oldest_spans(self):
+        tracer = Tracer(buffer_size=3)
+        ids = []
+        for name in "abcd":
+            with tracer.span(name) as span:
+                ids.append(span.trace_id)
+        assert tracer.get_trace(ids[0]) == []
+        assert len(tracer.recent_traces(limit=10)) == 3
+
+    def test_context_does_not_leak_across_threads(self):
+        tracer = Tracer()
+        seen = []
+        with tracer.span("main"):
+            thread = threading.Thread(target=lambda: seen.append(current_trace_id()))
+            thread.start()
+            thread.join()
+        assert seen == [None]
+
+
+def test_alarm_path_is_one_trace():
+    camera_controller = CameraController()
+    camera_controller.add_camera(10, 10)
+    system = SimpleNamespace(system_controller=None, camera_controller=camera_controller)
+
+    def activate_siren():
+        with TRACER.span("system.activate_siren"):
+            pass
+
+    security = SecuritySystem(
+        get_delay_time=lambda: timedelta(seconds=30),
+        call_monitoring_service=lambda reason: None,
+        activate_siren=activate_siren,
+        deactivate_siren=lambda: None,
+        get_monitored_sensors_state=lambda: {},
+        camera_gateway=SystemCameraGateway(system),
+        tracer=TRACER,
+    )
+    security.register_sensor("Back Door", SensorType.DOOR)
+    security.assign_sensor_to_zone("Back Door", "1")
+    security.arm(SecurityMode.AWAY)
+    controller = SystemController(security, user_manager=object())
+
+    controller.update_sensor_status("Back Door", SENSOR_WIN_DOOR, "Open")
+
+    trace = TRACER.recent_traces(limit=1)[0]
+    names = [span["name"] for span in trace["spans"]]
+    assert trace["root"] == "controller.update_sensor_status"
+    for expected in (
+        "security.sensor_event",
+        "system.activate_siren",
+        "camera_gateway.trigger_all",
+        "camera_controller.trigger_security_event",
+        "camera.capture",
+    ):
+        assert expected in names
+    by_id = {span["span_id"]: span for span in trace["spans"]}
+    capture = next(span for span in trace["spans"] if span["name"] == "camera.capture")
+    assert by_id[capture["parent_id"]]["name"] == "camera_controller.trigger_security_event"
+    camera_controller.shutdown_capture()
+
+
+def test_trace_endpoints_require_login(client):
+    assert client.get("/api/traces").status_code == 401
+    assert client.get("/api/traces/abc").status_code == 401
+
+
+@pytest.mark.usefixtures("safehome_system_instance")
+class TestTraceEndpoints:
+    def test_trigger_response_links_to_its_trace(self, auth_client, safehome_system_instance):
+        sensor = safehome_system_instance.get_sensor("Front Door")
+        if sensor is None:
+            pytest.skip("Front Door sensor not available")
+        sensor.set_closed()
+
+        response = auth_client.post(
+            "/api/security/sensors/trigger", json={"device_id": "Front Door", "action": "trigger"}
+        )
+        sensor.set_closed()
+        assert sensor.get_status() == STATE_CLOSED
+        trace_id = response.get_json()["trace_id"]
+
+        detail = auth_client.get(f"/api/traces/{trace_id}")
+        assert detail.status_code == 200
+        names = [span["name"] for span in detail.get_json()["spans"]]
+        assert names[0] == "api.sensor_trigger"
+        assert "controller.update_sensor_status" in names
+        assert "security.sensor_event" in names
+
+        listing = auth_client.get("/api/traces?limit=5").get_json()
+        assert any(trace["trace_id"] == trace_id for trace in listing["traces"])
+
+    def test_unknown_trace_is_404(self, auth_client):
+        assert auth_client.get("/api/traces/does-not-exist").status_code == 404
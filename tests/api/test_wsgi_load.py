@@ -0,0 +1,129 @@
+"""
+Load test: requests/s of the production WSGI server vs. the development server.
+
+Both servers wrap the same Flask ``app`` (and therefore the same System
+instance). The comparison is printed (run with ``-s`` to see it); the test
+only asserts that every request succeeded, since absolute throughput
+depends on the machine.
+"""
+
+from __future__ import annotations
+
+import http.client
+import threading
+import time
+
+import pytest
+from werkzeug.serving import make_server
+
+import main as main_app
+from config.web_server_config import SERVER_PRODUCTION, WebServerConfig
+
+CLIENTS = 8
+REQUESTS_PER_CLIENT = 40
+PATH = "/api/security/status"
+
+
+@pytest.fixture
+def session_cookie(flask_app):
+    """Seed a logged-in server-side session so requests take the real path."""
+    sid = main_app.session_store.new_session_id()
+    main_app.session_store.save(sid, {"logged_in": True, "username": "homeowner"})
+    try:
+        yield f"{flask_app.config['SESSION_COOKIE_NAME']}={sid}"
+    finally:
+        main_app.session_store.delete(sid)
+
+
+def _run_load(port: int, cookie: str) -> tuple:
+    errors = []
+    statuses = []
+    lock = threading.Lock()
+
+    def client():
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        try:
+            for _ in range(REQUESTS_PER_CLIENT):
+                conn.request("GET", PATH, headers={"Cookie": cookie})
+                response = conn.getresponse()
+                response.read()
+                with lock:
+                    statuses.append(response.status)
+        except Exception as exc:  # pragma: no cover - reported via assertion
+            with lock:
+                errors.append(exc)
+        finally:
+            conn.close()
+
+    threads = [threading.Thread(target=client) for _ in range(CLIENTS)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return len(statuses) / elapsed, statuses, errors
+
+
+@pytest.fixture
+def development_server(flask_app):
+    server = make_server("127.0.0.1", 0, flask_app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_port
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def production_server(flask_app):
+    pytest.importorskip("waitress")
+    config = WebServerConfig(server=SERVER_PRODUCTION, port=0, threads=8)
+    server = main_app.create_wsgi_server(config)
+    stopped = threading.Event()
+
+    def run():
+        try:
+            server.run()
+        except OSError:
+            # select() on the closed listening socket while stopping.
+            if not stopped.is_set():
+                raise
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    try:
+        yield server.effective_port
+    finally:
+        stopped.set()
+        server.task_dispatcher.shutdown()
+        server.close()
+        thread.join(timeout=5)
+
+
+def test_production_server_throughput_vs_development(development_server, production_server,
+                                                    session_cookie):
+    dev_rps, dev_statuses, dev_errors = _run_load(development_server, session_cookie)
+    prod_rps, prod_statuses, prod_errors = _run_load(production_server, session_cookie)
+
+    print(f"\n[load] development: {dev_rps:.0f} req/s, production (waitress): {prod_rps:.0f} req/s")
+
+    total = CLIENTS * REQUESTS_PER_CLIENT
+    assert not dev_errors and not prod_errors
+    assert len(dev_statuses) == len(prod_statuses) == total
+    assert set(dev_statuses) == set(prod_statuses) == {200}
+
+
+def test_web_server_config_validation():
+    with pytest.raises(ValueError):
+        WebServerConfig(server="gunicorn")
+    with pytest.raises(ValueError):
+        WebServerConfig(threads=0)
+
+    args = main_app.parse_args(["--server", "production", "--threads", "4", "--backlog", "64"])
+    config = main_app.web_config_from_args(args)
+    assert config.is_production
+    assert config.waitress_options()["threads"] == 4
+    assert config.waitress_options()["backlog"] == 64
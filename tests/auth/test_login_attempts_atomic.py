@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+import storage.storage_manager as storage_mod
+from auth.login_manager import LoginManager
+from config.system_settings import SystemSettings
+
+USERNAME = "homeowner"
+WEB = "web_browser"
+
+
+@pytest.fixture(autouse=True)
+def isolated_storage(tmp_path, monkeypatch):
+    """Provide a throwaway SQLite database seeded with the default users."""
+    monkeypatch.setattr(storage_mod, "DB_FILE", str(tmp_path / "test_safehome.db"))
+    monkeypatch.setattr(SystemSettings, "_shared_instance", None)
+    storage_mod.StorageManager._instance = None
+    manager = storage_mod.StorageManager()
+    assert manager.connect()
+    yield manager
+    manager.disconnect()
+    storage_mod.StorageManager._instance = None
+
+
+def _statements(manager, action):
+    statements = []
+    manager.connection.set_trace_callback(statements.append)
+    try:
+        result = action()
+    finally:
+        manager.connection.set_trace_callback(None)
+    return result, [s for s in statements if not s.startswith(("BEGIN", "COMMIT"))]
+
+
+def test_failed_attempt_is_one_write_statement(isolated_storage):
+    login_manager = LoginManager()
+
+    result, statements = _statements(
+        isolated_storage, lambda: login_manager.validate_first_password(USERNAME, "wrong", WEB)
+    )
+
+    assert result == {
+        "success": False,
+        "message": "Incorrect first password",
+        "tries": 1,
+        "remaining": 4,
+    }
+    # One lookup plus one UPDATE (with RETURNING where SQLite supports it).
+    writes = [s for s in statements if s.lstrip().upper().startswith("UPDATE")]
+    assert len(writes) == 1
+    assert len(statements) <= 3
+
+
+def test_fifth_failure_locks_in_the_same_update(isolated_storage):
+    login_manager = LoginManager()
+    for _ in range(4):
+        login_manager.validate_second_password(USERNAME, "wrong", WEB)
+
+    result = login_manager.validate_second_password(USERNAME, "wrong", WEB)
+
+    assert result["locked"] is True
+    assert result["tries"] == 5
+    user = isolated_storage.get_user_by_username(USERNAME, WEB)
+    assert user["is_locked"] == 1
+    assert user["locked_at"]
+
+
+def test_successful_first_password_skips_write_when_clean(isolated_storage):
+    login_manager = LoginManager()
+    # The first success migrates the seeded plaintext password to a hash.
+    login_manager.validate_first_password(USERNAME, "first123", WEB)
+    changes_before = isolated_storage.connection.total_changes
+
+    result = login_manager.validate_first_password(USERNAME, "first123", WEB)
+
+    assert result["success"] is True
+    # The reset UPDATE is guarded, so a clean account is not rewritten.
+    assert isolated_storage.connection.total_changes == changes_before
+
+
+def test_successful_second_password_resets_and_stamps_login(isolated_storage):
+    login_manager = LoginManager()
+    login_manager.validate_second_password(USERNAME, "wrong", WEB)
+
+    result = login_manager.validate_second_password(USERNAME, "second456", WEB)
+
+    assert result["success"] is True
+    user = isolated_storage.get_user_by_username(USERNAME, WEB)
+    assert user["failed_attempts"] == 0
+    assert user["last_login_time"]
+
+
+def test_concurrent_failures_are_not_lost(isolated_storage):
+    login_manager = LoginManager()
+    results = []
+    start = threading.Barrier(8)
+
+    def attempt():
+        start.wait()
+        results.append(login_manager.validate_first_password(USERNAME, "wrong", WEB))
+
+    threads = [threading.Thread(target=attempt) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    user = isolated_storage.get_user_by_username(USERNAME, WEB)
+    failures = [r for r in results if r.get("tries") is not None]
+    assert user["is_locked"] == 1
+    # Each counted attempt saw a distinct counter value.
+    assert sorted(r["tries"] for r in failures) == list(range(1, len(failures) + 1))
+    assert user["failed_attempts"] == len(failures)
+
+
+def test_database_error_is_not_reported_as_missing_user(isolated_storage, monkeypatch):
+    login_manager = LoginManager()
+
+    def failing_transaction():
+        raise sqlite3.OperationalError("database is locked")
+
+    # The user lookup succeeds; recording the failed attempt does not.
+    monkeypatch.setattr(isolated_storage, "transaction", failing_transaction)
+    result = login_manager.validate_first_password(USERNAME, "wrong", WEB)
+
+    assert result == {"success": False, "message": "Login failed. Please try again."}
@@ -217,7 +217,7 @@ class TestLoginManagerCoverage:
         # SystemSettings 모킹 - 로컬 import이므로 config.system_settings 모듈을 패치
         with patch('config.system_settings.SystemSettings') as mock_settings_class:
             mock_settings = Mock()
-            mock_settings_class.return_value = mock_settings
+            mock_settings_class.shared.return_value = mock_settings
             mock_settings.get_system_lock_time.return_value = lock_time
 
             result = login_manager._check_and_unlock_if_time_passed(user_data, 'user', 'control_panel')
@@ -237,7 +237,7 @@ class TestLoginManagerCoverage:
         # SystemSettings 모킹 - 로컬 import이므로 config.system_settings 모듈을 패치
         with patch('config.system_settings.SystemSettings') as mock_settings_class:
             mock_settings = Mock()
-            mock_settings_class.return_value = mock_settings
+            mock_settings_class.shared.return_value = mock_settings
             mock_settings.get_system_lock_time.return_value = lock_time
 
             with patch.object(login_manager.storage, 'reset_failed_login_attempts', return_value=True):
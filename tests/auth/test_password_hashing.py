@@ -0,0 +1,117 @@
+"""Tests for salted password hashing, migration of plaintext rows and the verifier pool."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+import auth.login_manager as login_manager_mod
+import auth.password_hashing as hashing
+import storage.storage_manager as storage_mod
+from auth.login_manager import LoginManager
+from auth.password_hashing import PasswordVerifier, PasswordVerifierBusy
+from config.system_settings import SystemSettings
+
+WEB = "web_browser"
+
+
+@pytest.fixture
+def isolated_storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_mod, "DB_FILE", str(tmp_path / "test_safehome.db"))
+    monkeypatch.setattr(SystemSettings, "_shared_instance", None)
+    storage_mod.StorageManager._instance = None
+    manager = storage_mod.StorageManager()
+    assert manager.connect()
+    yield manager
+    manager.disconnect()
+    storage_mod.StorageManager._instance = None
+
+
+def _stored(manager, username, interface, column="password"):
+    row = manager.execute_query(
+        f"SELECT {column} FROM users WHERE user_id = ? AND interface_type = ?",
+        (username, interface),
+    )
+    return row[0][column]
+
+
+class TestHashFormat:
+    def test_round_trip_and_unique_salts(self):
+        first = hashing.hash_password("secret", iterations=1000)
+        second = hashing.hash_password("secret", iterations=1000)
+
+        assert first != second
+        assert first.startswith("pbkdf2_sha256$1000$")
+        assert hashing.verify_password("secret", first)
+        assert not hashing.verify_password("Secret", first)
+
+    def test_legacy_plaintext_verifies_and_needs_rehash(self):
+        assert hashing.verify_password("1234", "1234")
+        assert not hashing.verify_password("12345", "1234")
+        assert not hashing.is_hashed("1234")
+        assert hashing.needs_rehash("1234")
+
+    def test_lower_cost_hash_needs_rehash(self, monkeypatch):
+        stored = hashing.hash_password("secret", iterations=1000)
+        monkeypatch.setattr(hashing, "_iterations", 2000)
+
+        assert hashing.needs_rehash(stored)
+        assert not hashing.needs_rehash(hashing.hash_password("secret"))
+
+
+class TestMigration:
+    def test_web_logins_migrate_both_columns(self, isolated_storage):
+        login_manager = LoginManager()
+
+        assert login_manager.validate_first_password("homeowner", "first123", WEB)["success"]
+        assert login_manager.validate_second_password("homeowner", "second456", WEB)["success"]
+
+        first = _stored(isolated_storage, "homeowner", WEB)
+        second = _stored(isolated_storage, "homeowner", WEB, "second_password")
+        assert hashing.is_hashed(first) and hashing.is_hashed(second)
+        # Logging in again works against the hashed values.
+        assert login_manager.validate_first_password("homeowner", "first123", WEB)["success"]
+        assert not login_manager.validate_first_password("homeowner", "second456", WEB)["success"]
+
+    def test_control_panel_login_migrates(self, isolated_storage):
+        login_manager = LoginManager()
+
+        assert login_manager.login_with_details("admin", "1234", "control_panel")["success"]
+        assert hashing.is_hashed(_stored(isolated_storage, "admin", "control_panel"))
+        assert login_manager.login_with_details("admin", "1234", "control_panel")["success"]
+
+    def test_failed_login_does_not_migrate(self, isolated_storage):
+        LoginManager().validate_first_password("homeowner", "wrong", WEB)
+
+        assert _stored(isolated_storage, "homeowner", WEB) == "first123"
+
+
+class TestPasswordVerifier:
+    def test_raises_busy_when_queue_is_full(self):
+        verifier = PasswordVerifier(max_workers=1, max_pending=0, wait_timeout=0.05)
+        release = threading.Event()
+        try:
+            blocker = verifier._submit(release.wait)
+            with pytest.raises(PasswordVerifierBusy):
+                verifier.hash("secret")
+            release.set()
+            blocker.result(timeout=5)
+            assert verifier.verify("secret", verifier.hash("secret"))
+        finally:
+            release.set()
+            verifier.shutdown()
+
+
+def test_busy_verifier_returns_503(client, safehome_system_instance, monkeypatch):
+    class BusyVerifier:
+        def verify(self, password, stored):
+            raise PasswordVerifierBusy("full")
+
+    monkeypatch.setattr(login_manager_mod, "PASSWORD_VERIFIER", BusyVerifier())
+
+    response = client.post("/api/login/first", json={"username": "homeowner", "password": "first123"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.get_json()["busy"] is True
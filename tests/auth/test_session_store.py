@@ -0,0 +1,157 @@
+"""Tests for the server-side session store and its Flask session interface."""
+
+from __future__ import annotations
+
+import pytest
+
+import main as main_app
+import storage.storage_manager as storage_mod
+from auth.session_store import SessionStore
+from config.system_settings import SystemSettings
+from utils.metrics import SESSION_LOOKUPS_TOTAL
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def isolated_storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_mod, "DB_FILE", str(tmp_path / "test_safehome.db"))
+    monkeypatch.setattr(SystemSettings, "_shared_instance", None)
+    storage_mod.StorageManager._instance = None
+    manager = storage_mod.StorageManager()
+    assert manager.connect()
+    yield manager
+    manager.disconnect()
+    storage_mod.StorageManager._instance = None
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store(isolated_storage, clock):
+    return SessionStore(ttl_seconds=100, max_cached=3, clock=clock)
+
+
+def _statements(manager, action):
+    statements = []
+    manager.connection.set_trace_callback(statements.append)
+    try:
+        result = action()
+    finally:
+        manager.connection.set_trace_callback(None)
+    return result, statements
+
+
+class TestSessionStore:
+    def test_cached_lookup_does_not_touch_database(self, store, isolated_storage):
+        store.save("sid", {"logged_in": True})
+        before = SESSION_LOOKUPS_TOTAL.get("cache")
+
+        data, statements = _statements(isolated_storage, lambda: store.get("sid"))
+
+        assert data == {"logged_in": True}
+        assert statements == []
+        assert SESSION_LOOKUPS_TOTAL.get("cache") == before + 1
+
+    def test_survives_cache_eviction(self, store):
+        store.save("sid", {"username": "homeowner"})
+        store.clear_cache()
+
+        assert store.get("sid") == {"username": "homeowner"}
+        assert len(store) == 1
+
+    def test_lru_is_bounded(self, store):
+        for index in range(5):
+            store.save(f"sid-{index}", {"n": index})
+
+        assert len(store) == 3
+        assert store.get("sid-0") == {"n": 0}
+
+    def test_sliding_expiry(self, store, clock):
+        store.save("sid", {"n": 1})
+        for _ in range(5):
+            clock.now += 60
+            assert store.get("sid") == {"n": 1}
+
+        clock.now += 101
+        assert store.get("sid") is None
+
+    def test_sliding_expiry_is_persisted_for_evicted_sessions(self, store, clock):
+        store.save("sid", {"n": 1})
+        for _ in range(3):
+            clock.now += 60
+            store.get("sid")
+        store.clear_cache()
+        clock.now += 60
+
+        assert store.get("sid") == {"n": 1}
+
+    def test_reap_removes_expired_rows(self, store, clock, isolated_storage):
+        store.save("old", {"n": 1})
+        clock.now += 50
+        store.save("new", {"n": 2})
+        clock.now += 60
+
+        assert store.reap() == 1
+        rows = isolated_storage.execute_query("SELECT session_id FROM web_sessions")
+        assert [row["session_id"] for row in rows] == ["new"]
+
+    def test_returns_copies(self, store):
+        store.save("sid", {"n": 1})
+        store.get("sid")["n"] = 99
+
+        assert store.get("sid") == {"n": 1}
+
+
+class TestSessionInterface:
+    def test_cookie_carries_only_session_id(self, auth_client):
+        cookie = auth_client.get_cookie("session")
+
+        assert cookie is not None
+        assert "logged_in" not in cookie.value
+        assert main_app.session_store.get(cookie.value)["logged_in"] is True
+
+    def test_logout_deletes_server_side_session(self, auth_client):
+        sid = auth_client.get_cookie("session").value
+
+        auth_client.get("/logout")
+
+        assert main_app.session_store.get(sid) is None
+
+    def test_camera_attempts_are_kept_server_side(self, auth_client, safehome_system_instance, monkeypatch):
+        monkeypatch.setattr(
+            safehome_system_instance.camera_controller,
+            "validate_camera_password",
+            lambda camera_id, password: 1,
+        )
+        sid = auth_client.get_cookie("session").value
+
+        for _ in range(2):
+            auth_client.post("/api/cameras/1/validate-password", json={"password": "bad"})
+
+        # Replaying the original cookie does not reset the counter.
+        auth_client.set_cookie("session", sid)
+        response = auth_client.post("/api/cameras/1/validate-password", json={"password": "bad"})
+
+        assert response.status_code == 403
+        assert response.get_json()["locked"] is True
+        assert main_app.session_store.get(sid)["camera_1_password_attempts"] == 3
+
+    def test_login_issues_a_new_session_id(self, client, safehome_system_instance):
+        client.post("/api/login/first", json={"username": "homeowner", "password": "first123"})
+        pre_login_sid = client.get_cookie("session").value
+
+        response = client.post("/api/login/second", json={"second_password": "second456"})
+
+        assert response.status_code == 200
+        assert client.get_cookie("session").value != pre_login_sid
+        assert main_app.session_store.get(pre_login_sid) is None
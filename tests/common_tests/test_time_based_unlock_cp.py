@@ -4,6 +4,7 @@ Control Panel 시간 기반 계정 잠금 해제 테스트
 from domain.system import System
 from auth.login_interface import LoginInterface
 from storage.storage_manager import StorageManager
+from config.system_settings import SystemSettings
 from datetime import datetime, timedelta
 import time
 
@@ -46,6 +47,7 @@ def test_time_based_unlock():
     storage = StorageManager()
     storage.connect()
     storage.execute_update("UPDATE system_settings SET system_lock_time = 5")
+    SystemSettings.shared().load()  # pick up the out-of-band write
     # Don't disconnect - other components need to use the same storage instance
     print("   Lock time set to 5 seconds")
 
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+import storage.storage_manager as storage_mod
+from auth.login_manager import LoginManager
+from config.configuration_manager import ConfigurationManager
+from config.system_settings import SystemSettings
+from security.security_system import AlarmState, SecuritySystem
+
+
+@pytest.fixture(autouse=True)
+def isolated_storage(tmp_path, monkeypatch):
+    """Provide a throwaway SQLite database and a fresh shared settings object."""
+    monkeypatch.setattr(storage_mod, "DB_FILE", str(tmp_path / "test_safehome.db"))
+    monkeypatch.setattr(SystemSettings, "_shared_instance", None)
+    storage_mod.StorageManager._instance = None
+    manager = storage_mod.StorageManager()
+    assert manager.connect()
+    yield manager
+    manager.disconnect()
+    storage_mod.StorageManager._instance = None
+
+
+def test_shared_is_one_instance_used_by_configuration_manager():
+    shared = SystemSettings.shared()
+    assert SystemSettings.shared() is shared
+    assert ConfigurationManager().get_system_setting() is shared
+
+
+def test_shared_reads_do_not_touch_the_database(isolated_storage):
+    SystemSettings.shared()
+    user = {"locked_at": (datetime.now() - timedelta(seconds=5)).isoformat()}
+
+    with patch.object(isolated_storage, "execute_query", side_effect=AssertionError("db read")):
+        result = LoginManager()._check_and_unlock_if_time_passed(user, "user", "control_panel")
+        assert SystemSettings.shared().get_alarm_delay_time() == 60
+
+    assert result["still_locked"] is True
+
+
+def test_save_bumps_version_and_notifies_listeners():
+    shared = SystemSettings.shared()
+    seen = []
+    shared.add_change_listener(lambda settings: seen.append(settings.get_system_lock_time()))
+    version = shared.get_version()
+
+    shared.set_system_lock_time(45)
+    assert shared.save()
+
+    assert shared.get_version() == version + 1
+    assert seen == [45]
+
+
+def test_save_from_another_instance_updates_shared():
+    shared = SystemSettings.shared()
+    seen = []
+    shared.add_change_listener(lambda settings: seen.append(settings.get_alarm_delay_time()))
+
+    other = SystemSettings()
+    other.set_alarm_delay_time(15)
+    assert other.save()
+
+    assert shared.get_alarm_delay_time() == 15
+    assert seen == [15]
+
+
+def _statements(manager, action):
+    statements = []
+    manager.connection.set_trace_callback(statements.append)
+    try:
+        result = action()
+    finally:
+        manager.connection.set_trace_callback(None)
+    return result, [s for s in statements if not s.startswith(("BEGIN", "COMMIT"))]
+
+
+def test_save_is_one_upsert_and_skipped_when_clean(isolated_storage):
+    shared = SystemSettings.shared()
+    version = shared.get_version()
+
+    result, statements = _statements(isolated_storage, shared.save)
+    assert result is True
+    assert statements == []
+    assert shared.get_version() == version
+
+    shared.set_alarm_delay_time(30)
+    assert shared.is_dirty()
+    result, statements = _statements(isolated_storage, shared.save)
+
+    assert result is True
+    assert len(statements) == 1
+    assert "ON CONFLICT" in statements[0]
+    assert not shared.is_dirty()
+    rows = isolated_storage.execute_query("SELECT alarm_delay_time FROM system_settings")
+    assert [row["alarm_delay_time"] for row in rows] == [30]
+
+
+def test_update_system_settings_copies_into_shared():
+    config = ConfigurationManager()
+    replacement = SystemSettings()
+    replacement.set_homeowner_phone("010-1234-5678")
+
+    assert config.update_system_settings(replacement)
+
+    assert config.get_system_setting() is SystemSettings.shared()
+    assert SystemSettings.shared().get_homeowner_phone() == "010-1234-5678"
+
+
+def test_failing_listener_does_not_block_others():
+    shared = SystemSettings.shared()
+    seen = []
+
+    def broken(_settings):
+        raise RuntimeError("boom")
+
+    shared.add_change_listener(broken)
+    shared.add_change_listener(lambda settings: seen.append(True))
+    shared.set_system_lock_time(20)
+    assert shared.save()
+
+    assert seen == [True]
+
+
+def test_security_system_reschedules_pending_monitoring_call():
+    delay = {"seconds": 60}
+    security = SecuritySystem(
+        get_delay_time=lambda: timedelta(seconds=delay["seconds"]),
+        call_monitoring_service=lambda reason: None,
+        activate_siren=lambda: None,
+        deactivate_siren=lambda: None,
+        get_monitored_sensors_state=lambda: {},
+    )
+    security.trigger_panic()
+    started = security._alarm_started_at
+    assert security.alarm_state is AlarmState.ALARM_ACTIVE
+
+    delay["seconds"] = 5
+    security.refresh_delay_time()
+
+    assert security._monitoring_deadline == started + timedelta(seconds=5)
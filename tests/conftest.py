@@ -1,3 +1,8 @@
+import os
+
+# Keep password hashing cheap in tests; production uses the module default.
+os.environ.setdefault("SAFEHOME_PASSWORD_ITERATIONS", "1000")
+
 import pytest
 
 import main as main_app
@@ -120,3 +120,26 @@ def test_attach_post_turn_on_hook_sets_callback():
     bootstrapper.attach_post_turn_on_hook(system, sensors)
 
     assert callable(system.on_turn_on_complete)
+
+
+def test_ui_list_stays_shared_with_system_after_boot():
+    from devices.motion_detector import MotionDetector
+    from devices.windoor_sensor import WindowDoorSensor
+    from domain.system import System
+
+    loaded = MotionDetector("Hall")
+
+    class FakeBootstrap(SystemBootstrapper):
+        def load_sensors(self, _system):
+            return [loaded]
+
+    system = System()
+    ui_sensors = system.sensors
+
+    FakeBootstrap().initialize_devices_after_turn_on(system, ui_sensors)
+    door = WindowDoorSensor("Front Door")
+    system.add_sensor(door)
+
+    assert system.sensors is ui_sensors
+    assert ui_sensors == [loaded, door]
+    assert system.get_sensor("Hall") is loaded
@@ -7,9 +7,11 @@ class StubSystem:
     def __init__(self, response):
         self.response = response
         self.calls = 0
+        self.warm_flags = []
 
-    def reset(self):
+    def reset(self, warm=False):
         self.calls += 1
+        self.warm_flags.append(warm)
         if isinstance(self.response, Exception):
             raise self.response
         return self.response
@@ -58,3 +60,18 @@ def test_reset_exception_becomes_error():
     assert not outcome.success
     assert outcome.alert_level == "error"
     assert "DB down" in outcome.alert_message
+
+
+def test_reset_defaults_to_warm_and_reports_mode():
+    system = StubSystem({"success": True, "message": "ok", "phase": 3, "mode": "cold"})
+    outcome = ControlPanelResetPresenter(system).perform_reset()
+
+    assert system.warm_flags == [True]
+    assert outcome.mode == "cold"  # warm failed and System fell back
+
+
+def test_reset_can_request_cold():
+    system = StubSystem({"success": True, "phase": 3, "mode": "cold"})
+    ControlPanelResetPresenter(system).perform_reset(warm=False)
+
+    assert system.warm_flags == [False]
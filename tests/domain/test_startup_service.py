@@ -0,0 +1,109 @@
+"""Tests for the dependency-ordered startup stage runner and System.turn_on timings."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import threading
+
+import pytest
+
+import domain.system as system_mod
+import storage.storage_manager as storage_mod
+from config.system_settings import SystemSettings
+from domain.services.startup_service import StagedStartup, StartupStage
+from domain.system import System, SystemState
+
+
+def test_independent_stages_overlap():
+    both_running = threading.Barrier(2, timeout=5)
+
+    # Each stage waits for the other; this only finishes if they run concurrently.
+    timings = StagedStartup([
+        StartupStage("assets", both_running.wait),
+        StartupStage("schema", both_running.wait),
+    ]).run()
+
+    assert set(timings) == {"assets", "schema"}
+
+
+def test_stage_starts_after_its_dependencies():
+    order = []
+    lock = threading.Lock()
+
+    def record(name):
+        def action():
+            with lock:
+                order.append(name)
+        return action
+
+    StagedStartup([
+        StartupStage("security", record("security"), after=("configuration",)),
+        StartupStage("configuration", record("configuration"), after=("storage",)),
+        StartupStage("storage", record("storage")),
+    ]).run()
+
+    assert order == ["storage", "configuration", "security"]
+
+
+def test_failure_stops_dependent_stages_and_is_reraised():
+    ran = []
+
+    def fail():
+        raise RuntimeError("no database")
+
+    with pytest.raises(RuntimeError, match="no database"):
+        StagedStartup([
+            StartupStage("storage", fail),
+            StartupStage("configuration", lambda: ran.append("configuration"), after=("storage",)),
+        ]).run()
+
+    assert ran == []
+
+
+def test_progress_is_reported_on_the_calling_thread():
+    threads = []
+
+    StagedStartup([StartupStage("a", lambda: None), StartupStage("b", lambda: None, after=("a",))]).run(
+        lambda name, seconds: threads.append(threading.current_thread())
+    )
+
+    assert threads == [threading.current_thread()] * 2
+
+
+@pytest.mark.parametrize("stages", [
+    [StartupStage("a", lambda: None, after=("missing",))],
+    [StartupStage("a", lambda: None, after=("b",)), StartupStage("b", lambda: None, after=("a",))],
+    [StartupStage("a", lambda: None), StartupStage("a", lambda: None)],
+])
+def test_invalid_stage_graphs_are_rejected(stages):
+    with pytest.raises(ValueError):
+        StagedStartup(stages)
+
+
+@pytest.fixture
+def isolated_system(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_mod, "DB_FILE", str(tmp_path / "test_safehome.db"))
+    monkeypatch.setattr(system_mod, "EVENT_CLIP_DIR", str(tmp_path / "events"))
+    monkeypatch.setattr(system_mod, "RECORDING_SEGMENT_DIR", str(tmp_path / "segments"))
+    monkeypatch.setattr(SystemSettings, "_shared_instance", None)
+    storage_mod.StorageManager._instance = None
+    system = System()
+    yield system
+    with contextlib.redirect_stdout(io.StringIO()):
+        if system.system_state != SystemState.OFF:
+            system.turn_off()
+    storage_mod.StorageManager._instance = None
+
+
+def test_turn_on_records_stage_timings_and_progress(isolated_system):
+    progress = []
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert isolated_system.turn_on(progress=lambda stage, fraction: progress.append((stage, fraction)))
+
+    stages = {stage.name for stage in isolated_system._startup_stages()}
+    assert set(isolated_system.startup_timings) == stages | {"total"}
+    assert {stage for stage, _ in progress} == stages
+    assert progress[-1][1] == 1.0
+    assert isolated_system.system_state == SystemState.READY
@@ -94,3 +94,41 @@ def test_trigger_camera_invokes_take_picture_on_all_cameras(controller):
 
     assert cam_a.picture_count == 1
     assert cam_b.picture_count == 1
+
+
+def test_handle_sensor_event_posts_ui_log_to_tk_thread(controller):
+    from datetime import datetime
+
+    from security.events import SensorEvent
+
+    from ui.ui_queue import UiCallQueue
+
+    tk_calls = []
+    logs = []
+    ui_queue = UiCallQueue(SimpleNamespace(after=lambda delay, callback: tk_calls.append(callback)))
+    controller.set_ui(SimpleNamespace(ui_queue=ui_queue, add_log=logs.append))
+    event = SensorEvent(sensor_id="camera-1", zone_id=None, sensor_type=SensorType.MOTION,
+                        status=SensorStatus.MOTION_DETECTED, timestamp=datetime.now())
+
+    controller.handle_sensor_event(event)
+
+    assert controller.security_system.handled_events == [event]
+    assert logs == []
+    assert tk_calls == []  # the sampler thread never calls into Tk itself
+    assert ui_queue.drain() == 1
+    assert logs == ["Sensor camera-1 -> MOTION_DETECTED"]
+
+
+def test_handle_sensor_event_logs_directly_without_ui_queue(controller):
+    from datetime import datetime
+
+    from security.events import SensorEvent
+
+    logs = []
+    controller.set_ui(SimpleNamespace(add_log=logs.append))
+    event = SensorEvent(sensor_id="camera-1", zone_id=None, sensor_type=SensorType.MOTION,
+                        status=SensorStatus.MOTION_DETECTED, timestamp=datetime.now())
+
+    controller.handle_sensor_event(event)
+
+    assert logs == ["Sensor camera-1 -> MOTION_DETECTED"]
@@ -70,6 +70,21 @@ class TestSystemTurnOn:
         """System 인스턴스 생성"""
         return System()
     
+    @pytest.mark.parametrize("enabled", [False, True])
+    def test_motion_analysis_is_opt_in(self, enabled, tmp_path, monkeypatch):
+        """모션 분석은 motion_analysis=True일 때만 활성화"""
+        import storage.storage_manager as storage_mod
+        from config.system_settings import SystemSettings
+        monkeypatch.setattr(storage_mod, 'DB_FILE', str(tmp_path / 'test_safehome.db'))
+        monkeypatch.setattr(SystemSettings, '_shared_instance', None)
+        monkeypatch.setattr(storage_mod.StorageManager, '_instance', None)
+        system = System(motion_analysis=enabled)
+        assert system.turn_on()
+        try:
+            assert (system.camera_controller.get_motion_analyzer() is not None) is enabled
+        finally:
+            system.turn_off()
+
     def test_turn_on_when_already_on(self, system):
         """시스템이 이미 켜져 있을 때"""
         system.system_state = SystemState.READY
@@ -130,6 +130,79 @@ def test_turn_off_executes_shutdown_sequence():
     assert system.storage_manager.disconnected
 
 
+def test_turn_off_skips_saving_unchanged_settings():
+    system = build_system()
+    system.configuration_manager.get_system_setting = lambda: SimpleNamespace(is_dirty=lambda: False)
+
+    assert system.turn_off()
+
+    assert not system.configuration_manager.update_called
+
+
 def test_turn_off_returns_false_if_already_off():
     system = System()
     assert system.turn_off() is False
+
+
+def test_turn_off_closes_security_event_stream():
+    system = build_system()
+    stream = system.security_event_stream
+
+    assert system.turn_off()
+
+    assert stream.closed
+
+
+def test_turn_off_for_reset_keeps_security_event_stream_open():
+    system = build_system()
+    stream = system.security_event_stream
+
+    assert system.turn_off(keep_event_stream=True)
+
+    assert not stream.closed
+
+
+def test_turn_on_after_turn_off_opens_a_new_security_event_stream(tmp_path, monkeypatch):
+    import contextlib
+    import io
+
+    import domain.system as system_mod
+    import storage.storage_manager as storage_mod
+    from config.system_settings import SystemSettings
+
+    monkeypatch.setattr(storage_mod, "DB_FILE", str(tmp_path / "power.db"))
+    monkeypatch.setattr(storage_mod.StorageManager, "_instance", None)
+    monkeypatch.setattr(SystemSettings, "_shared_instance", None)
+    monkeypatch.setattr(system_mod, "EVENT_CLIP_DIR", str(tmp_path / "events"))
+    monkeypatch.setattr(system_mod, "RECORDING_SEGMENT_DIR", str(tmp_path / "segments"))
+
+    system = System()
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert system.turn_on()
+        first_stream = system.security_event_stream
+        assert system.turn_off()
+        assert system.turn_on()
+        second_stream = system.security_event_stream
+        system.turn_off()
+
+    assert first_stream.closed
+    assert second_stream is not first_stream
+
+
+def test_reset_while_off_still_reports_mode_and_duration():
+    result = System().reset(warm=True)
+
+    assert result["success"] is False and result["phase"] == 0
+    assert result["mode"] == "warm"
+    assert result["duration_ms"] >= 0
+
+
+def test_failed_cold_reset_reports_mode_and_duration(monkeypatch):
+    system = build_system()
+    monkeypatch.setattr(system, "turn_off", lambda keep_event_stream=False: False)
+
+    result = system.reset()
+
+    assert result["success"] is False and result["phase"] == 1
+    assert result["mode"] == "cold"
+    assert result["duration_ms"] >= 0
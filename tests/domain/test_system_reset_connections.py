@@ -0,0 +1,132 @@
+"""Repeated System.reset must not accumulate SQLite connections."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import sqlite3
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import domain.system as system_mod
+import storage.storage_manager as storage_mod
+from config.system_settings import SystemSettings
+from domain.system import System, SystemState
+from security.security_system import SecurityMode
+
+# The leak check runs the full 1,000 resets; time.sleep is patched out so it takes a few seconds.
+RESETS = 1000
+
+
+@pytest.fixture
+def isolated_storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_mod, "DB_FILE", str(tmp_path / "test_safehome.db"))
+    monkeypatch.setattr(SystemSettings, "_shared_instance", None)
+    storage_mod.StorageManager._instance = None
+    yield
+    if storage_mod.StorageManager._instance is not None:
+        storage_mod.StorageManager._instance.disconnect()
+    storage_mod.StorageManager._instance = None
+
+
+@pytest.fixture
+def no_reset_pause(monkeypatch):
+    """Skip the pause between reset phases without touching the shared time module."""
+    monkeypatch.setattr(system_mod, "time", SimpleNamespace(
+        sleep=lambda _seconds: None, perf_counter=time.perf_counter,
+    ))
+
+
+@pytest.fixture
+def opened_connections(monkeypatch):
+    """Record every sqlite3 connection opened; the list keeps them from being collected."""
+    opened = []
+    real_connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        connection = real_connect(*args, **kwargs)
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(sqlite3, "connect", tracking_connect)
+    return opened
+
+
+def _open_count(connections) -> int:
+    count = 0
+    for connection in connections:
+        try:
+            connection.total_changes
+        except sqlite3.ProgrammingError:
+            continue  # closed
+        count += 1
+    return count
+
+
+def test_open_connections_stay_constant_across_resets(isolated_storage, opened_connections, no_reset_pause):
+    system = System()
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert system.turn_on()
+        baseline = _open_count(opened_connections)
+
+        threads_before = threading.active_count()
+        for _ in range(RESETS):
+            assert system.reset()["success"]
+        after = _open_count(opened_connections)
+        threads_after = threading.active_count()
+
+        # SystemController authentication still works over the shared connection.
+        assert system.system_controller.login("admin", "1234")
+        system.turn_off()
+
+    assert baseline == 1
+    assert after == baseline
+    # Resets must not pile up device/sampler threads either.
+    assert threads_after <= threads_before
+
+
+def test_warm_reset_keeps_connection_and_devices(isolated_storage, opened_connections, tmp_path, monkeypatch):
+    monkeypatch.setattr(system_mod, "EVENT_CLIP_DIR", str(tmp_path / "events"))
+    monkeypatch.setattr(system_mod, "RECORDING_SEGMENT_DIR", str(tmp_path / "segments"))
+    system = System()
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert system.turn_on()
+        system.camera_controller.add_camera(100, 100)
+        camera = system.camera_controller.get_camera(1)
+        connection = system.storage_manager.connection
+        security_system = system.security_system
+        assert system.login("admin", "1234")
+        security_system.arm(SecurityMode.AWAY)
+
+        result = system.reset(warm=True)
+
+        assert result["success"] and result["mode"] == "warm"
+        assert result["duration_ms"] >= 0
+        assert system.storage_manager.connection is connection
+        assert system.camera_controller.get_camera(1) is camera
+        assert _open_count(opened_connections) == 1
+        # State machines start over: a fresh SecuritySystem, nobody logged in.
+        assert system.security_system is not security_system
+        assert system.system_controller.security_system is system.security_system
+        assert system.security_system.mode is SecurityMode.DISARMED
+        assert not system.login_manager.is_user_authenticated()
+        assert system.system_state == SystemState.READY
+
+        assert system.login("admin", "1234")
+        system.turn_off()
+
+
+def test_warm_reset_falls_back_to_cold_reset_on_error(isolated_storage, no_reset_pause, monkeypatch):
+    system = System()
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert system.turn_on()
+        # Only the running ConfigurationManager fails; the cold path builds a new one.
+        monkeypatch.setattr(system.configuration_manager, "initialize_configuration", lambda: 1 / 0)
+
+        result = system.reset(warm=True)
+        system.turn_off()
+
+    assert result["success"] and result["mode"] == "cold"
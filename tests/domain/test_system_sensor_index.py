@@ -0,0 +1,130 @@
+"""System device_id -> sensor index."""
+
+from types import SimpleNamespace
+
+from devices.motion_detector import MotionDetector
+from devices.windoor_sensor import WindowDoorSensor
+from domain.system import System
+
+
+class StubDeviceManager:
+    def __init__(self):
+        self.added = []
+        self.removed = []
+
+    def add_device(self, device_id, device_type):
+        self.added.append((device_id, device_type))
+        return True
+
+    def remove_device(self, device_id):
+        self.removed.append(device_id)
+        return True
+
+
+def _system_with(sensors):
+    system = System()
+    system.sensors = sensors
+    return system
+
+
+def test_assigning_sensors_builds_index():
+    door, motion = WindowDoorSensor("Front Door"), MotionDetector("Living Room")
+    system = _system_with([door, motion])
+
+    assert system.get_sensor("Front Door") is door
+    assert system.get_sensor("Living Room") is motion
+    assert system.get_sensor("Attic") is None
+
+
+def test_direct_list_mutation_is_picked_up():
+    system = _system_with([])
+    door = WindowDoorSensor("Back Door")
+    system.sensors.append(door)
+
+    assert system.get_sensor("Back Door") is door
+
+    system.sensors.remove(door)
+    assert system.get_sensor("Back Door") is None
+
+
+def test_duplicate_ids_resolve_to_first_sensor():
+    first, second = WindowDoorSensor("Door"), WindowDoorSensor("Door")
+    system = _system_with([first, second])
+    assert system.get_sensor("Door") is first
+
+
+def test_add_and_remove_sensor_update_index_and_device_catalog():
+    system = _system_with([])
+    device_manager = StubDeviceManager()
+    system.configuration_manager = SimpleNamespace(device_manager=device_manager)
+
+    sensor = MotionDetector("Hallway")
+    assert system.add_sensor(sensor) is True
+    assert system.add_sensor(MotionDetector("Hallway")) is False
+    assert system.get_sensor("Hallway") is sensor
+    assert device_manager.added == [("Hallway", sensor.get_type())]
+
+    assert system.remove_sensor("Hallway") is True
+    assert system.remove_sensor("Hallway") is False
+    assert system.get_sensor("Hallway") is None
+    assert system.sensors == []
+    assert device_manager.removed == ["Hallway"]
+
+
+def test_lookup_scales_to_thousands_of_sensors():
+    sensors = [WindowDoorSensor(f"door-{index}") for index in range(5000)]
+    system = _system_with(sensors)
+
+    assert system.get_sensor("door-4999") is sensors[-1]
+    assert len(system._sensor_index) == 5000
+
+
+def test_in_place_replacement_invalidates_index():
+    old, new = WindowDoorSensor("Front Door"), WindowDoorSensor("Back Door")
+    system = _system_with([old])
+    assert system.get_sensor("Front Door") is old
+
+    system.sensors[0] = new
+
+    assert system.get_sensor("Front Door") is None
+    assert system.get_sensor("Back Door") is new
+
+
+def test_add_sensor_updates_index_without_rebuilding(monkeypatch):
+    system = _system_with([])
+    system.configuration_manager = None
+    rebuilds = []
+    original = system._rebuild_sensor_index
+    monkeypatch.setattr(system, "_rebuild_sensor_index", lambda: rebuilds.append(1) or original())
+
+    sensors = [WindowDoorSensor(f"door-{index}") for index in range(1000)]
+    for sensor in sensors:
+        assert system.add_sensor(sensor) is True
+    assert system.remove_sensor("door-500") is True
+
+    assert rebuilds == []
+    assert len(system._sensor_index) == 999
+    assert system.get_sensor("door-999") is sensors[-1]
+    assert system.get_sensor("door-500") is None
+
+
+def test_removing_first_duplicate_falls_back_to_next():
+    first, second = WindowDoorSensor("Door"), WindowDoorSensor("Door")
+    system = _system_with([first, second])
+
+    system.sensors.remove(first)
+
+    assert system.get_sensor("Door") is second
+
+
+def test_assigning_sensors_keeps_the_shared_list_object():
+    system = System()
+    shared = system.sensors
+    door = WindowDoorSensor("Front Door")
+
+    system.sensors = [door]
+    system.sensors.append(MotionDetector("Hall"))
+
+    assert system.sensors is shared
+    assert [sensor.get_id() for sensor in shared] == ["Front Door", "Hall"]
+    assert system.get_sensor("Hall") is shared[1]
@@ -3,40 +3,30 @@ domain/user_manager.py Coverage 향상 테스트
 8개의 missing lines를 커버하기 위한 추가 테스트
 """
 import pytest
-import sqlite3
-from unittest.mock import Mock, patch
+import storage.storage_manager as storage_mod
 from domain.user_manager import UserManager
-from utils.constants import DB_FILE
 
 
 class TestUserManagerCoverage:
     """UserManager 커버리지 향상 테스트"""
     
     @pytest.fixture
-    def user_manager(self):
-        """UserManager 인스턴스 생성 (메모리 DB 사용)"""
-        # 메모리 DB로 테스트
-        with patch('domain.user_manager.DB_FILE', ':memory:'):
-            manager = UserManager()
-            # 스키마 초기화
-            manager.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    user_id TEXT,
-                    password TEXT
-                )
-            """)
-            manager.conn.commit()
-            yield manager
-            manager.close()
+    def user_manager(self, tmp_path, monkeypatch):
+        """UserManager 인스턴스 생성 (임시 DB의 StorageManager 사용)"""
+        monkeypatch.setattr(storage_mod, 'DB_FILE', str(tmp_path / 'test_safehome.db'))
+        storage_mod.StorageManager._instance = None
+        manager = UserManager()
+        yield manager
+        manager.storage.disconnect()
+        storage_mod.StorageManager._instance = None
     
     def test_authenticate_success(self, user_manager):
         """인증 성공"""
         # 사용자 추가
-        user_manager.cursor.execute(
+        user_manager.storage.execute_update(
             "INSERT INTO users (user_id, password) VALUES (?, ?)",
             ('test_user', 'password123')
         )
-        user_manager.conn.commit()
         
         result = user_manager.authenticate('test_user', 'password123')
         
@@ -45,11 +35,10 @@ class TestUserManagerCoverage:
     def test_authenticate_failure_wrong_password(self, user_manager):
         """인증 실패 - 잘못된 비밀번호"""
         # 사용자 추가
-        user_manager.cursor.execute(
+        user_manager.storage.execute_update(
             "INSERT INTO users (user_id, password) VALUES (?, ?)",
             ('test_user', 'password123')
         )
-        user_manager.conn.commit()
         
         result = user_manager.authenticate('test_user', 'wrong_password')
         
@@ -61,19 +50,8 @@ class TestUserManagerCoverage:
         
         assert result is False
     
-    # test_authenticate_with_database_error 삭제됨 - UserManager는 storage 속성이 없음
-    # UserManager는 직접 conn/cursor 사용하며 database error 처리는 이미 구현에 포함됨
-    
     def test_close(self, user_manager):
-        """연결 종료 테스트"""
+        """close()는 공유 StorageManager 연결을 닫지 않음"""
         user_manager.close()
         
-        # 연결이 종료되었는지 확인 (close 호출 시 예외가 없어야 함)
-        try:
-            user_manager.cursor.execute("SELECT 1")
-            # 연결이 유지되고 있다면
-            pass
-        except sqlite3.ProgrammingError:
-            # 연결이 종료되었다면
-            pass
-
+        assert user_manager.storage.execute_query("SELECT 1") is not None
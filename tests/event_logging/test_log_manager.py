@@ -200,3 +200,24 @@ def test_save_log_handles_sqlite_errors():
     assert not manager.save_log(log)
     # connect should be attempted once between retries
     assert storage.connect_calls == 1
+
+
+def test_save_logs_writes_batch_in_one_transaction(tmp_path, monkeypatch):
+    import storage.storage_manager as storage_mod
+
+    monkeypatch.setattr(storage_mod, "DB_FILE", str(tmp_path / "logs.db"))
+    monkeypatch.setattr(storage_mod.StorageManager, "_instance", None)
+    storage = storage_mod.StorageManager()
+    assert storage.connect()
+    try:
+        manager = LogManager(storage=storage)
+        logs = [Log(event_type="TEST", description=f"event {i}", date_time=datetime(2025, 1, 1))
+                for i in range(5)]
+
+        assert manager.save_logs(logs) == 5
+        ids = [log.get_event_id() for log in logs]
+        assert ids == list(range(ids[0], ids[0] + 5))
+        assert manager.get_log_count() == 5
+        assert manager.save_logs([]) == 0
+    finally:
+        storage.disconnect()
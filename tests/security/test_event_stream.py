@@ -0,0 +1,98 @@
+"""Tests for the shared SSE fan-out buffer and the composite listener."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta
+
+from security.event_stream import CompositeSecurityListener, SecurityEventStream
+from security.events import SensorEvent, SensorStatus, SensorType
+from security.security_system import SecurityMode, SecuritySystem
+
+
+def _event(sensor_id: str = "front-door") -> SensorEvent:
+    return SensorEvent(
+        sensor_id=sensor_id,
+        zone_id=None,
+        sensor_type=SensorType.DOOR,
+        status=SensorStatus.OPEN,
+        timestamp=datetime.utcnow(),
+    )
+
+
+def test_events_are_shared_and_resumable_by_id():
+    stream = SecurityEventStream()
+    first = stream.publish("status", {"mode": "AWAY"})
+    second = stream.publish("alarm_cleared", {"cleared_by": "admin"})
+
+    assert [e.event_id for e in stream.events_after(0)] == [first, second]
+    assert [e.name for e in stream.events_after(first)] == ["alarm_cleared"]
+    # Every client reads the same pre-encoded frame.
+    assert stream.events_after(0)[1] is stream.events_after(first)[0]
+    assert stream.events_after(0)[0].frame.startswith(f"id: {first}\nevent: status\ndata: ")
+
+
+def test_resume_is_refused_once_events_were_evicted():
+    stream = SecurityEventStream(buffer_size=2)
+    for index in range(4):
+        stream.publish("status", {"n": index})
+
+    assert stream.is_resumable(4) is True
+    assert stream.is_resumable(2) is True
+    assert stream.is_resumable(1) is False
+    assert stream.is_resumable(99) is False
+
+
+def test_wait_for_events_wakes_all_clients():
+    stream = SecurityEventStream()
+    received = []
+
+    def client():
+        received.append(stream.wait_for_events(0, timeout=5))
+
+    threads = [threading.Thread(target=client) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    stream.publish("status", {"mode": "STAY"})
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(received) == 3
+    assert all(batch and batch[0].name == "status" for batch in received)
+
+
+def test_wait_for_events_times_out_and_close_releases():
+    stream = SecurityEventStream()
+    assert stream.wait_for_events(0, timeout=0.01) == []
+    stream.close()
+    assert stream.closed is True
+    assert stream.wait_for_events(0) == []
+
+
+def test_security_system_feeds_stream_through_composite_listener():
+    stream = SecurityEventStream()
+
+    class FailingListener:
+        def __getattr__(self, name):
+            def fail(*args):
+                raise RuntimeError(name)
+            return fail
+
+    system = SecuritySystem(
+        get_delay_time=lambda: timedelta(seconds=0),
+        call_monitoring_service=lambda: None,
+        activate_siren=lambda: None,
+        deactivate_siren=lambda: None,
+        get_monitored_sensors_state=lambda: {},
+    )
+    system.set_event_listener(CompositeSecurityListener([FailingListener(), stream]))
+
+    system.arm(SecurityMode.AWAY)
+    system.handle_sensor_event(_event())
+
+    names = [event.name for event in stream.events_after(0)]
+    assert "status" in names
+    assert "intrusion" in names
+    assert "alarm_activated" in names
+    alarm = next(e for e in stream.events_after(0) if e.name == "alarm_activated")
+    assert alarm.data["sensor_id"] == "front-door"
@@ -260,3 +260,42 @@ class TestStorageManagerSingleton:
         
         assert manager1 is manager2
 
+
+
+class TestStorageManagerConnectionLock:
+    """공유 연결 직렬화 테스트"""
+
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        import storage.storage_manager as storage_mod
+        monkeypatch.setattr(storage_mod, 'DB_FILE', str(tmp_path / 'test_safehome.db'))
+        StorageManager._instance = None
+        manager = StorageManager()
+        assert manager.connect()
+        yield manager
+        manager.disconnect()
+        StorageManager._instance = None
+
+    def test_concurrent_update_does_not_commit_open_transaction(self, manager):
+        """다른 스레드의 execute_update가 진행 중인 트랜잭션을 커밋하지 않음"""
+        import threading
+
+        manager.execute_update("CREATE TABLE items (name TEXT)")
+        writer_done = threading.Event()
+
+        def writer():
+            manager.execute_update("INSERT INTO items (name) VALUES (?)", ('outside',))
+            writer_done.set()
+
+        thread = threading.Thread(target=writer)
+        with pytest.raises(RuntimeError):
+            with manager.transaction() as cursor:
+                cursor.execute("INSERT INTO items (name) VALUES (?)", ('inside',))
+                thread.start()
+                # 트랜잭션이 끝날 때까지 writer는 연결을 쓸 수 없다.
+                assert not writer_done.wait(0.2)
+                raise RuntimeError("rollback")
+        thread.join(timeout=5)
+
+        rows = manager.execute_query("SELECT name FROM items")
+        assert [row['name'] for row in rows] == ['outside']
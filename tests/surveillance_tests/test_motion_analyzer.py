@@ -0,0 +1,136 @@
+"""
+pytest tests for frame-differencing motion analysis
+"""
+import pytest
+from PIL import Image, ImageDraw
+
+import surveillance.motion_analyzer as motion_analyzer
+from security.events import SensorStatus, SensorType
+from surveillance.camera_controller import CameraController
+from surveillance.motion_analyzer import MotionAnalyzer, changed_fraction, to_analysis_frame
+
+
+@pytest.fixture(autouse=True, params=["numpy", "pil"])
+def backend(request, monkeypatch):
+    """Run every test against both the NumPy path and the PIL fallback."""
+    if request.param == "numpy":
+        monkeypatch.setattr(motion_analyzer, "np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(motion_analyzer, "np", None)
+    return request.param
+
+
+def _scene(box=None) -> Image.Image:
+    image = Image.new("RGB", (500, 500), "black")
+    if box:
+        ImageDraw.Draw(image).rectangle(box, fill="white")
+    return image
+
+
+class TestChangedFraction:
+    def test_frame_type_follows_backend(self, backend):
+        frame = to_analysis_frame(_scene())
+        expected = Image.Image if backend == "pil" else motion_analyzer.np.ndarray
+        assert isinstance(frame, expected)
+
+    def test_identical_frames_have_no_change(self):
+        frame = to_analysis_frame(_scene())
+        assert changed_fraction(frame, frame) == 0.0
+
+    def test_fraction_tracks_changed_area(self):
+        before = to_analysis_frame(_scene())
+        after = to_analysis_frame(_scene((0, 0, 249, 499)))
+        assert 0.45 <= changed_fraction(before, after) <= 0.55
+
+
+class TestMotionAnalyzer:
+    def test_first_frame_only_sets_baseline(self):
+        analyzer = MotionAnalyzer()
+        assert analyzer.process(1, _scene((0, 0, 400, 400)), now=0.0) is None
+
+    def test_emits_motion_event_above_threshold(self):
+        events = []
+        analyzer = MotionAnalyzer(on_motion=events.append)
+        analyzer.process(1, _scene(), now=0.0)
+
+        event = analyzer.process(1, _scene((100, 100, 300, 300)), now=1.0, sensor_id="Camera_1")
+
+        assert event is not None
+        assert event.sensor_type is SensorType.MOTION
+        assert event.status is SensorStatus.MOTION_DETECTED
+        assert event.sensor_id == "Camera_1"
+        assert events == [event]
+
+    def test_per_camera_threshold(self):
+        analyzer = MotionAnalyzer()
+        analyzer.set_threshold(2, 0.5)
+        for camera_id in (1, 2):
+            analyzer.process(camera_id, _scene(), now=0.0)
+
+        small_change = _scene((100, 100, 300, 300))
+        assert analyzer.process(1, small_change, now=1.0) is not None
+        assert analyzer.process(2, small_change, now=1.0) is None
+        assert analyzer.get_last_score(2) > 0
+
+    def test_cooldown_suppresses_repeated_events(self):
+        analyzer = MotionAnalyzer(cooldown_seconds=10)
+        analyzer.process(1, _scene(), now=0.0)
+        assert analyzer.process(1, _scene((0, 0, 250, 250)), now=1.0) is not None
+        assert analyzer.process(1, _scene(), now=2.0) is None
+        assert analyzer.process(1, _scene((0, 0, 250, 250)), now=12.0) is not None
+
+    def test_view_change_resets_baseline(self):
+        analyzer = MotionAnalyzer()
+        analyzer.process(1, _scene(), view_key=(0.0, 1), now=0.0)
+        assert analyzer.process(1, _scene((0, 0, 400, 400)), view_key=(5.0, 1), now=1.0) is None
+
+
+class TestCameraControllerMotion:
+    def test_static_feed_reports_no_motion(self):
+        events = []
+        controller = CameraController()
+        controller.add_camera(10, 10)
+        controller.enable_motion_analysis(MotionAnalyzer(on_motion=events.append), start_sampler=False)
+
+        assert controller.analyze_motion(now=0.0) == 0
+        assert controller.analyze_motion(now=1.0) == 0
+        assert events == []
+
+    def test_pan_does_not_count_as_motion(self):
+        controller = CameraController()
+        controller.add_camera(10, 10)
+        controller.enable_motion_analysis(MotionAnalyzer(), start_sampler=False)
+
+        controller.analyze_motion(now=0.0)
+        controller.get_camera(1).pan_right()
+        assert controller.analyze_motion(now=1.0) == 0
+
+    def test_disabled_camera_is_skipped(self):
+        controller = CameraController()
+        controller.add_camera(10, 10)
+        controller.disable_camera(1)
+        controller.enable_motion_analysis(MotionAnalyzer(), start_sampler=False)
+        assert controller.analyze_motion(now=0.0) == 0
+        assert controller.get_motion_analyzer().get_last_score(1) == 0.0
+
+    def test_sampler_tick_renders_each_frame_once(self, tmp_path):
+        from surveillance.recording_store import RecordingStore
+
+        controller = CameraController()
+        controller.add_camera(10, 10)
+        controller.enable_pre_alarm_capture(tmp_path / "clips", start_sampler=False)
+        controller.attach_recording_store(RecordingStore(tmp_path / "rec"), start_sampler=False)
+        controller.enable_motion_analysis(MotionAnalyzer(), start_sampler=False)
+        controller.start_recording(1)
+        camera = controller.get_camera(1)
+        renders = []
+        real_get_view = camera._device_camera.get_view
+        camera._device_camera.get_view = lambda *a, **k: renders.append(1) or real_get_view(*a, **k)
+        try:
+            assert controller.sample_frames(now=0.0) == 1
+        finally:
+            controller.shutdown_capture(wait=True)
+
+        assert len(renders) == 1
+        assert camera.get_pre_alarm_buffer().frame_count() == 1
+        assert controller.get_motion_analyzer().get_last_score(1) == 0.0
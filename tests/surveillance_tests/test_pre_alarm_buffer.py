@@ -0,0 +1,103 @@
+"""
+pytest tests for the pre-alarm frame ring buffer and event clip writer
+"""
+from PIL import Image
+
+from surveillance.camera_controller import CameraController
+from surveillance.pre_alarm_buffer import BufferedFrame, EventClipWriter, PreAlarmBuffer
+from surveillance.safehome_camera import SafeHomeCamera
+
+
+def _frame(size: int, timestamp: float = 0.0) -> BufferedFrame:
+    return BufferedFrame(timestamp=timestamp, data=b"x" * size)
+
+
+class TestPreAlarmBuffer:
+    def test_evicts_oldest_frames_over_frame_cap(self):
+        buffer = PreAlarmBuffer(max_frames=3, max_bytes=1024)
+        for index in range(5):
+            buffer.append(_frame(10, timestamp=index))
+
+        frames = buffer.freeze()
+        assert [frame.timestamp for frame in frames] == [2, 3, 4]
+
+    def test_byte_cap_is_a_hard_limit(self):
+        buffer = PreAlarmBuffer(max_frames=100, max_bytes=100)
+        for index in range(10):
+            buffer.append(_frame(30, timestamp=index))
+
+        assert buffer.total_bytes() <= 100
+        assert buffer.frame_count() == 3
+        assert buffer.append(_frame(101)) is False
+
+    def test_sampling_interval_is_respected(self):
+        buffer = PreAlarmBuffer(sample_interval=1.0)
+        image = Image.new("RGB", (20, 20), "white")
+
+        assert buffer.append_image(image, now=10.0) is True
+        assert buffer.append_image(image, now=10.5) is False
+        assert buffer.append_image(image, now=11.0) is True
+        assert buffer.frame_count() == 2
+
+    def test_freeze_detaches_frames(self):
+        buffer = PreAlarmBuffer()
+        buffer.append(_frame(10))
+
+        assert len(buffer.freeze()) == 1
+        assert buffer.frame_count() == 0
+        assert buffer.total_bytes() == 0
+
+
+class TestEventClipWriter:
+    def test_writes_pre_and_post_frames(self, tmp_path):
+        writer = EventClipWriter(tmp_path, post_event_frames=2, post_event_interval=0)
+        try:
+            pre = [_frame(8, timestamp=1.0), _frame(8, timestamp=2.0)]
+            future = writer.submit(
+                "INTRUSION", 1, pre, lambda: Image.new("RGB", (10, 10), "red")
+            )
+            clip_dir = future.result(timeout=5)
+        finally:
+            writer.shutdown(wait=True)
+
+        names = sorted(path.name for path in clip_dir.iterdir())
+        assert len([n for n in names if n.startswith("pre_")]) == 2
+        assert len([n for n in names if n.startswith("post_")]) == 2
+
+
+class TestCameraControllerPreAlarm:
+    def test_intrusion_flushes_ring_off_thread(self, tmp_path):
+        controller = CameraController()
+        controller.add_camera(10, 10)
+        controller.enable_pre_alarm_capture(
+            tmp_path, sample_interval=0, post_event_frames=1, start_sampler=False
+        )
+        try:
+            assert controller.sample_pre_alarm_frames(now=1.0) == 1
+            camera = controller.get_camera(1)
+            assert camera.get_pre_alarm_buffer().frame_count() == 1
+
+            controller.trigger_security_event("INTRUSION")
+            assert camera.get_pre_alarm_buffer().frame_count() == 0
+        finally:
+            controller.disable_pre_alarm_capture(wait=True)
+
+        clips = list(tmp_path.glob("*_intrusion/camera1/*.jpg"))
+        assert any(path.name.startswith("pre_") for path in clips)
+        assert any(path.name.startswith("post_") for path in clips)
+
+    def test_non_alarm_sources_do_not_flush(self, tmp_path):
+        controller = CameraController()
+        controller.add_camera(10, 10)
+        controller.enable_pre_alarm_capture(tmp_path, start_sampler=False)
+        try:
+            controller.sample_pre_alarm_frames(now=1.0)
+            controller.trigger_security_event("TEST")
+            assert controller.get_camera(1).get_pre_alarm_buffer().frame_count() == 1
+        finally:
+            controller.disable_pre_alarm_capture()
+
+    def test_disabled_camera_is_not_sampled(self):
+        camera = SafeHomeCamera(camera_id=1)
+        camera.disable()
+        assert camera.sample_pre_alarm_frame(now=1.0) is False
@@ -0,0 +1,112 @@
+"""
+pytest tests for the segmented on-disk RecordingStore
+"""
+from surveillance.camera_controller import CameraController
+from surveillance.recording_store import RecordingStore
+
+
+def _payload(index: int) -> bytes:
+    return f"frame-{index}".encode() * 10
+
+
+class TestRecordingStore:
+    def test_segments_roll_over_by_time(self, tmp_path):
+        store = RecordingStore(tmp_path, segment_seconds=10, max_age_seconds=None, max_total_bytes=None)
+        for second in range(25):
+            store.append_frame(1, _payload(second), timestamp=1000.0 + second)
+        store.close()
+
+        segments = store.list_segments(1)
+        assert len(segments) == 3
+        assert [len(s.timestamps) for s in segments] == [10, 10, 5]
+
+    def test_get_frame_at_seeks_latest_frame_before_t(self, tmp_path):
+        store = RecordingStore(tmp_path, segment_seconds=10, max_age_seconds=None, max_total_bytes=None)
+        for second in range(0, 30, 2):
+            store.append_frame(1, _payload(second), timestamp=1000.0 + second)
+
+        frame = store.get_frame_at(1, 1013.5)
+        assert frame.timestamp == 1012.0
+        assert frame.data == _payload(12)
+
+        assert store.get_frame_at(1, 999.0) is None
+        assert store.get_frame_at(2, 1010.0) is None
+        store.close()
+
+    def test_index_survives_reopen(self, tmp_path):
+        store = RecordingStore(tmp_path, segment_seconds=5, max_age_seconds=None, max_total_bytes=None)
+        for second in range(12):
+            store.append_frame(3, _payload(second), timestamp=2000.0 + second)
+        store.close()
+
+        reopened = RecordingStore(tmp_path, segment_seconds=5, max_age_seconds=None, max_total_bytes=None)
+        assert reopened.get_frame_at(3, 2007.2).data == _payload(7)
+        assert reopened.get_time_range(3) == (2000.0, 2011.0)
+
+        reopened.append_frame(3, _payload(12), timestamp=2012.0)
+        assert reopened.get_frame_at(3, 2012.0).data == _payload(12)
+        reopened.close()
+
+    def test_rejects_out_of_order_frames(self, tmp_path):
+        store = RecordingStore(tmp_path)
+        assert store.append_frame(1, b"a", timestamp=10.0) is True
+        assert store.append_frame(1, b"b", timestamp=9.0) is False
+        store.close()
+
+    def test_retention_by_age_keeps_active_segment(self, tmp_path):
+        store = RecordingStore(tmp_path, segment_seconds=10, max_age_seconds=15, max_total_bytes=None)
+        for second in range(40):
+            store.append_frame(1, _payload(second), timestamp=1000.0 + second)
+
+        # Retention runs on rollover at t=1030 (cutoff 1015): only 1000-1009 is expired.
+        segments = store.list_segments(1)
+        assert segments[0].start_ts == 1010.0
+        assert store.get_frame_at(1, 1005.0) is None
+
+        store.enforce_retention(now=1045.0)
+        assert [s.start_ts for s in store.list_segments(1)] == [1030.0]
+        assert not (tmp_path / "camera1" / f"{1000000:016d}.seg").exists()
+        store.close()
+
+    def test_retention_by_size_drops_oldest_across_cameras(self, tmp_path):
+        store = RecordingStore(tmp_path, segment_seconds=5, max_age_seconds=None, max_total_bytes=None)
+        for second in range(20):
+            store.append_frame(1, b"x" * 100, timestamp=1000.0 + second)
+            store.append_frame(2, b"y" * 100, timestamp=1000.0 + second)
+
+        store.max_total_bytes = 1500
+        store.enforce_retention(now=1020.0)
+
+        assert store.total_bytes() <= 1500
+        assert len(store.list_segments(1)) >= 1
+        assert len(store.list_segments(2)) >= 1
+        store.close()
+
+
+class TestCameraControllerRecording:
+    def test_recording_persists_frames_and_supports_playback(self, tmp_path):
+        controller = CameraController()
+        controller.add_camera(10, 10)
+        controller.attach_recording_store(RecordingStore(tmp_path), start_sampler=False)
+        try:
+            assert controller.record_frames() == 0
+
+            assert controller.start_recording(1) is True
+            assert controller.record_frames() == 1
+
+            camera = controller.get_camera(1)
+            assert camera.is_recording() is True
+            frame = controller.get_recorded_frame(1, 1e12)
+            assert frame is not None
+            assert frame.data[:2] == b"\xff\xd8"  # JPEG SOI marker
+
+            assert controller.stop_recording(1) is True
+            assert controller.record_frames() == 0
+        finally:
+            controller.shutdown_capture()
+
+    def test_start_recording_requires_store(self):
+        controller = CameraController()
+        controller.add_camera(10, 10)
+        assert controller.start_recording(1) is False
+        assert controller.start_recording(99) is False
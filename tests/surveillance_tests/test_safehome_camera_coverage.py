@@ -4,6 +4,7 @@ Coverage tests for SafeHomeCamera - 기존 테스트에서 커버하지 못한 
 import pytest
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from PIL import Image
@@ -261,6 +262,20 @@ class TestSafeHomeCameraCoverage:
         camera.enable()
         assert camera.is_enabled() is True
 
+    @pytest.mark.coverage
+    def test_concurrent_construction_keeps_working_directory(self):
+        """여러 스레드에서 카메라를 동시에 생성해도 작업 디렉토리가 바뀌지 않아야 함"""
+        original_cwd = os.getcwd()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            cameras = list(pool.map(lambda i: SafeHomeCamera(camera_id=(i % 3) + 1), range(100)))
+        try:
+            assert os.getcwd() == original_cwd
+            sources = {id(cam._device_camera.imgSource) for cam in cameras}
+            assert len(sources) == 3
+        finally:
+            for cam in cameras:
+                cam._device_camera.stop()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-m", "coverage"])
@@ -0,0 +1,74 @@
+"""
+Headless entry point: System + bootstrap + web tier without Tkinter.
+
+Runs in a subprocess so the check sees a clean sys.modules (the test
+session itself may already have imported the UI).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import main as main_app
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+HEADLESS_PROBE = """
+import json, os, pathlib, sys
+import main
+import domain.system as system_mod
+import storage.storage_manager as storage_mod
+
+# Keep the database and recordings out of the working tree.
+work_dir = pathlib.Path(os.environ['SAFEHOME_PROBE_DIR'])
+storage_mod.DB_FILE = str(work_dir / 'safehome.db')
+system_mod.EVENT_CLIP_DIR = work_dir / 'recordings' / 'events'
+system_mod.RECORDING_SEGMENT_DIR = work_dir / 'recordings' / 'segments'
+
+system, timings = main.boot_headless()
+try:
+    gui = sorted(
+        name for name in sys.modules
+        if name.split('.')[0] in ('tkinter', '_tkinter', 'ui') or name == 'PIL.ImageTk'
+    )
+    print('RESULT ' + json.dumps({
+        'gui_modules': gui,
+        'state': system.system_state.value,
+        'cameras': system.camera_controller.get_camera_count(),
+        'timings': timings,
+    }))
+finally:
+    system.turn_off()
+"""
+
+
+def test_headless_boot_does_not_import_tkinter(tmp_path):
+    completed = subprocess.run(
+        [sys.executable, "-c", HEADLESS_PROBE],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "SAFEHOME_PROBE_DIR": str(tmp_path)},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr
+    line = next(l for l in completed.stdout.splitlines() if l.startswith("RESULT "))
+    result = json.loads(line[len("RESULT "):])
+
+    assert result["gui_modules"] == []
+    assert result["state"] != "Off"
+    assert result["cameras"] == 3
+    assert (tmp_path / "safehome.db").exists()
+    print(f"\n[headless] startup timings (ms): {result['timings']}")
+    assert result["timings"]["total_ms"] >= result["timings"]["turn_on_ms"] > 0
+
+
+def test_headless_flag_is_parsed():
+    assert main_app.parse_args(["--headless"]).headless is True
+    assert main_app.parse_args([]).headless is False
+    assert main_app.parse_args([]).motion_analysis is False
+    assert main_app.parse_args(["--motion-analysis"]).motion_analysis is True
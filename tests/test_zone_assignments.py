@@ -7,6 +7,7 @@ import pytest
 import storage.storage_manager as storage_mod
 from config.configuration_manager import ConfigurationManager
 from security.security_system import SecuritySystem
+from utils.constants import SENSOR_WIN_DOOR
 
 
 @pytest.fixture(autouse=True)
@@ -62,3 +63,138 @@ def test_security_system_tracks_explicit_zone_assignments():
 
     cm.remove_sensor_assignment("Front Door")
     assert "Front Door" not in sec._sensor_zones  # pylint: disable=protected-access
+
+
+def test_sensor_snapshot_is_cached_until_a_write():
+    cm = ConfigurationManager()
+    assert cm.initialize_configuration()
+
+    first = cm.get_sensor_snapshot()
+    assert cm.get_sensor_snapshot() is first
+
+    cm.add_safety_zone("Garage")
+    second = cm.get_sensor_snapshot()
+    assert second is not first
+    assert second.version > first.version
+    assert any(zone["zone_name"] == "Garage" for zone in second.zones)
+
+    zone_id = cm.safety_zones[-1].zone_id
+    assert cm.assign_sensor_to_zone("Front Door", zone_id)
+    third = cm.get_sensor_snapshot()
+    front_door = next(s for s in third.sensors if s["device_id"] == "Front Door")
+    assert front_door["zone_id"] == zone_id
+    assert front_door["zone_name"] == "Garage"
+    assert next(z for z in third.zones if z["zone_id"] == zone_id)["sensor_count"] == 1
+
+
+def test_device_manager_writes_invalidate_snapshot():
+    cm = ConfigurationManager()
+    assert cm.initialize_configuration()
+    version = cm.get_sensor_snapshot().version
+
+    assert cm.device_manager.add_device("Back Door", SENSOR_WIN_DOOR)
+    assert cm.get_sensor_snapshot_version() > version
+    assert any(s["device_id"] == "Back Door" for s in cm.get_sensor_snapshot().sensors)
+
+    version = cm.get_sensor_snapshot_version()
+    assert cm.device_manager.remove_device("Back Door")
+    assert cm.get_sensor_snapshot_version() > version
+    assert not any(s["device_id"] == "Back Door" for s in cm.get_sensor_snapshot().sensors)
+
+
+def test_batch_assignments_use_one_transaction_and_one_reconfigure(monkeypatch):
+    cm = ConfigurationManager()
+    assert cm.initialize_configuration()
+    cm.add_safety_zone("Hall")
+    zone_id = cm.safety_zones[-1].zone_id
+    cm.configure_security_system(make_security_system())
+
+    reconfigures = []
+    invalidations = []
+    original_reconfigure = cm.reconfigure_security_system
+    monkeypatch.setattr(cm, "reconfigure_security_system",
+                        lambda: (reconfigures.append(1), original_reconfigure()))
+    cm.device_manager.add_change_listener(lambda: invalidations.append(1))
+
+    results = cm.apply_sensor_assignments([
+        {"device_id": "Front Door", "zone_id": zone_id},
+        {"device_id": "Living Room", "zone_id": zone_id},
+        {"device_id": "Garden Cam", "zone_id": "x"},
+    ])
+
+    assert [r["success"] for r in results] == [True, True, False]
+    assert reconfigures == [1]
+    assert invalidations == [1]
+    assert cm.list_sensor_assignments() == {"Front Door": zone_id, "Living Room": zone_id}
+
+
+def test_batch_assignments_roll_back_on_database_error():
+    cm = ConfigurationManager()
+    assert cm.initialize_configuration()
+    cm.add_safety_zone("Hall")
+    zone_id = cm.safety_zones[-1].zone_id
+    # Bypass the per-item validation so the foreign key fails mid-transaction.
+    changed = cm.device_manager.apply_zone_assignments({"Front Door": zone_id, "Ghost": zone_id})
+
+    assert changed == -1
+    assert cm.list_sensor_assignments() == {}
+
+
+class StatusCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def on_status_changed(self, status) -> None:
+        self.count += 1
+
+    def on_intrusion_logged(self, record) -> None:
+        return None
+
+
+def test_reconfigure_applies_only_changed_sensors_with_one_notification(monkeypatch):
+    cm = ConfigurationManager()
+    assert cm.initialize_configuration()
+    cm.add_safety_zone("Hall")
+    zone_id = cm.safety_zones[-1].zone_id
+    sec = make_security_system()
+    cm.configure_security_system(sec)
+    listener = StatusCounter()
+    sec.set_event_listener(listener)
+    listener.count = 0
+
+    batches = []
+    original_apply = sec.apply_sensor_changes
+    monkeypatch.setattr(sec, "apply_sensor_changes",
+                        lambda changed, removed: (batches.append((dict(changed), list(removed))),
+                                                  original_apply(changed, removed)))
+
+    assert cm.assign_sensor_to_zone("Front Door", zone_id)
+    assert [set(changed) for changed, _ in batches] == [{"Front Door"}]
+    assert listener.count == 1
+    assert sec._sensor_zones == {"Front Door": str(zone_id)}  # pylint: disable=protected-access
+
+    # Nothing changed in storage, so nothing is applied or announced.
+    cm.reconfigure_security_system()
+    assert len(batches) == 1
+    assert listener.count == 1
+
+
+def test_reconfigure_moves_and_removes_sensors():
+    cm = ConfigurationManager()
+    assert cm.initialize_configuration()
+    cm.add_safety_zone("Hall")
+    hall = cm.safety_zones[-1].zone_id
+    cm.add_safety_zone("Garage")
+    garage = cm.safety_zones[-1].zone_id
+    assert cm.device_manager.add_device("Back Door", SENSOR_WIN_DOOR)
+    assert cm.assign_sensor_to_zone("Back Door", hall)
+    sec = make_security_system()
+    cm.configure_security_system(sec)
+
+    assert cm.assign_sensor_to_zone("Back Door", garage)
+    assert sec._zone_sensors == {str(garage): {"Back Door"}}  # pylint: disable=protected-access
+
+    assert cm.device_manager.remove_device("Back Door")
+    cm.reconfigure_security_system()
+    assert "Back Door" not in sec._sensor_types  # pylint: disable=protected-access
+    assert sec._zone_sensors == {}  # pylint: disable=protected-access
@@ -0,0 +1,86 @@
+import threading
+
+from ui.ui_queue import UiCallQueue
+
+
+class FakeRoot:
+    """Records after() calls instead of running a Tk event loop."""
+
+    def __init__(self):
+        self.scheduled = []
+        self.thread_ids = []
+
+    def after(self, delay, callback):
+        self.thread_ids.append(threading.get_ident())
+        self.scheduled.append((delay, callback))
+
+
+def test_post_does_not_touch_tk_and_drain_runs_in_order():
+    root = FakeRoot()
+    calls_queue = UiCallQueue(root)
+    calls = []
+
+    worker = threading.Thread(target=lambda: [calls_queue.post(calls.append, i) for i in range(3)])
+    worker.start()
+    worker.join()
+
+    assert root.scheduled == []
+    assert calls_queue.drain() == 3
+    assert calls == [0, 1, 2]
+
+
+def test_tick_drains_and_reschedules_until_stopped():
+    root = FakeRoot()
+    calls_queue = UiCallQueue(root, interval_ms=10)
+    calls = []
+    calls_queue.start()
+    calls_queue.post(calls.append, "x")
+
+    _, tick = root.scheduled.pop()
+    tick()
+    assert calls == ["x"]
+    assert len(root.scheduled) == 1
+
+    calls_queue.stop()
+    _, tick = root.scheduled.pop()
+    tick()
+    assert root.scheduled == []
+
+
+def test_callback_error_does_not_stop_drain():
+    calls_queue = UiCallQueue(FakeRoot())
+    calls = []
+    calls_queue.post(lambda: 1 / 0)
+    calls_queue.post(calls.append, "after")
+
+    assert calls_queue.drain() == 2
+    assert calls == ["after"]
+
+
+def test_run_in_background_posts_result_from_worker_thread():
+    root = FakeRoot()
+    calls_queue = UiCallQueue(root)
+    seen = []
+    caller = threading.get_ident()
+
+    thread = calls_queue.run_in_background(threading.get_ident, seen.append)
+    thread.join(timeout=2)
+
+    assert seen == []  # nothing runs until the Tk thread drains
+    calls_queue.drain()
+    assert len(seen) == 1 and seen[0] != caller
+    assert root.scheduled == []
+
+
+def test_run_in_background_routes_errors_to_on_error():
+    calls_queue = UiCallQueue(FakeRoot())
+    done, errors = [], []
+
+    def work():
+        raise RuntimeError("boom")
+
+    calls_queue.run_in_background(work, done.append, on_error=errors.append).join(timeout=2)
+    calls_queue.drain()
+
+    assert done == []
+    assert [str(e) for e in errors] == ["boom"]
@@ -11,3 +11,75 @@ def test_missing_camera_uses_placeholder_image():
         assert camera.imgSource.getpixel((0, 0)) == (0, 0, 0)
     finally:
         camera.stop()
+
+
+def test_cameras_share_decoded_source_image():
+    first, second = DeviceCamera(), DeviceCamera()
+    try:
+        first.set_id(1)
+        second.set_id(1)
+        assert first.imgSource is second.imgSource
+        # Source is fully decoded, so cropping never touches the file again.
+        assert first.imgSource.mode == "RGB"
+        assert first.get_view().size == (first.RETURN_SIZE, first.RETURN_SIZE)
+    finally:
+        first.stop()
+        second.stop()
+
+
+def test_camera_assets_resolve_without_changing_cwd(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    camera = DeviceCamera()
+    try:
+        camera.set_id(1)
+        # camera1.jpg is found relative to the package, not the cwd.
+        assert camera.imgSource.getpixel((0, 0)) != (0, 0, 0)
+    finally:
+        camera.stop()
+
+
+def test_get_view_renders_requested_size_directly():
+    camera = DeviceCamera()
+    try:
+        camera.set_id(1)
+        assert camera.get_view().size == (camera.RETURN_SIZE, camera.RETURN_SIZE)
+        assert camera.get_view(size=120).size == (120, 120)
+    finally:
+        camera.stop()
+
+
+def test_pyramid_levels_are_shared_and_bounded():
+    from virtual_device_v4.device.device_camera import MAX_LEVEL_PIXELS
+
+    first, second = DeviceCamera(), DeviceCamera()
+    try:
+        first.set_id(2)
+        second.set_id(2)
+        for zoom in range(1, 10):
+            first.zoom = zoom
+            first.get_view()
+        assert first._pyramid is second._pyramid
+        levels = first._pyramid._levels
+        assert len(levels) > 1
+        assert all(image.width * image.height <= MAX_LEVEL_PIXELS for image in levels.values())
+    finally:
+        first.stop()
+        second.stop()
+
+
+def test_pyramid_view_matches_direct_render():
+    from PIL import Image, ImageChops, ImageStat
+
+    camera = DeviceCamera()
+    try:
+        camera.set_id(1)
+        camera.zoom = 5
+        zoomed = camera.SOURCE_SIZE * (10 - camera.zoom) // 10
+        box = (camera.centerWidth - zoomed, camera.centerHeight - zoomed,
+               camera.centerWidth + zoomed, camera.centerHeight + zoomed)
+        expected = camera.imgSource.crop(box).resize((500, 500), Image.LANCZOS)
+        actual = camera._pyramid.render(box, 500)
+        diff = ImageStat.Stat(ImageChops.difference(expected, actual)).mean
+        assert max(diff) < 8
+    finally:
+        camera.stop()
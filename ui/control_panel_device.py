@@ -180,10 +180,18 @@ class SafeHomeControlPanelDevice(DeviceControlPanelAbstract):
         self.last_digit = digit
 
     def _attempt_login(self):
-        outcome = self.login_view.submit_login_from_device(
+        if getattr(self, "_login_pending", False):
+            return
+        self._login_pending = True
+        self.set_display_short_message2("Verifying...")
+        self.login_view.submit_login_from_device(
             self.user_buffer.lower(),
             self.password_buffer,
+            on_done=self._on_login_outcome,
         )
+
+    def _on_login_outcome(self, outcome):
+        self._login_pending = False
         if outcome.success:
             self.set_display_short_message1("Access granted")
             self.set_display_short_message2("Welcome to SafeHome")
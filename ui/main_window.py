@@ -20,12 +20,15 @@ from domain.services import (
     ControlPanelLoginPresenter,
     ControlPanelResetPresenter,
     ControlPanelChangePasswordPresenter,
+    ChangePasswordOutcome,
+    LoginOutcome,
     ControlPanelSettingsPresenter,
     PowerControlPresenter,
     ZonesViewModel,
     ModesViewModel,
 )
 from ui.control_panel_device import SafeHomeControlPanelDevice
+from ui.ui_queue import UiCallQueue
 
 # 페이지 이름 상수
 PAGES = ("PowerOff", "Login", "MainMenu", "Zones", "Modes", "Monitoring")
@@ -38,9 +41,11 @@ class TkSecurityListener(SecurityEventListener):
         self.app = app
 
     def _run_on_ui(self, callback, *args, **kwargs):
-        if not getattr(self.app, "root", None):
+        # 카메라 샘플링 스레드 등에서도 호출되므로 Tk 스레드가 비우는 큐로 넘긴다.
+        ui_queue = getattr(self.app, "ui_queue", None)
+        if ui_queue is None:
             return
-        self.app.root.after(0, lambda: callback(*args, **kwargs))
+        ui_queue.post(lambda: callback(*args, **kwargs))
 
     def on_status_changed(self, status):
         text = f"{status.mode.name} ({status.alarm_state.name})"
@@ -99,6 +104,9 @@ class SafeHomeApp:
         self.frames = {}
         self.images = {}  # ->-> -> ->->
         self.intrusion_logs: list[str] = []
+        # 작업 스레드 -> Tk 스레드 콜백 큐 (Tk 스레드에서 주기적으로 비운다)
+        self.ui_queue = UiCallQueue(self.root)
+        self.ui_queue.start()
 
         # -> ->-> ->
         for page_name in PAGES:
@@ -261,34 +269,31 @@ class PowerOffView(ttk.Frame):
         self.progress_frame.pack(pady=10)
         self.progress_bar['value'] = 0
 
-        # 비동기로 시스템 초기화 시작
-        self.app.root.after(100, self._initialize_step, 0)
-
-    def _initialize_step(self, step):
-        """단계별 초기화 진행"""
-        steps = [
-            ("Connecting to database...", 15),
-            ("Loading configuration...", 30),
-            ("Initializing security system...", 45),
-            ("Setting up login manager...", 60),
-            ("Initializing log manager...", 75),
-            ("Setting up system controller...", 85),
-            ("Initializing camera controller...", 95),
-            ("Finalizing...", 100),
-        ]
-
-        if step < len(steps):
-            msg, progress = steps[step]
-            self.progress_label.config(text=msg)
-            self.progress_bar['value'] = progress
-            self.app.root.after(200, self._initialize_step, step + 1)
-        else:
-            # 실제 시스템 초기화 수행
-            self._complete_initialization()
+        # 진행 표시를 먼저 그린 뒤 시스템 초기화 시작
+        self.app.root.after(100, self._complete_initialization)
+
+    # System.turn_on 단계 이름 -> 진행 메시지
+    STARTUP_STAGE_LABELS = {
+        "storage": "Connecting to database...",
+        "camera_assets": "Loading camera images...",
+        "camera_controller": "Initializing camera controller...",
+        "configuration": "Loading configuration...",
+        "login_manager": "Setting up login manager...",
+        "log_manager": "Initializing log manager...",
+        "security": "Initializing security system...",
+        "system_controller": "Setting up system controller...",
+        "default_user": "Checking administrator account...",
+    }
+
+    def _on_startup_stage(self, stage, fraction):
+        """turn_on 단계 완료 시 진행 표시 갱신 (실제 진행률 기준)"""
+        self.progress_label.config(text=self.STARTUP_STAGE_LABELS.get(stage, "Finalizing..."))
+        self.progress_bar['value'] = int(fraction * 100)
+        self.app.root.update_idletasks()
 
     def _complete_initialization(self):
         """시스템 초기화 완료"""
-        success = self.system.turn_on()
+        success = self.system.turn_on(progress=self._on_startup_stage)
 
         if success:
             # 성공: 초록색으로 변경
@@ -376,13 +381,36 @@ class LoginView(ttk.Frame):
 
         self._run_login(uid, pw)
 
-    def submit_login_from_device(self, user_id: str, password: str):
-        return self._run_login(user_id, password)
+    def submit_login_from_device(self, user_id: str, password: str, on_done=None):
+        """
+        키패드 로그인 처리. 결과는 UI 스레드에서 on_done(outcome)으로 전달한다.
+        """
+        self._run_login(user_id, password, on_done)
 
-    def _run_login(self, uid: str, pw: str):
-        outcome = self.presenter.attempt_login(uid, pw)
-        self._handle_login_outcome(outcome)
-        return outcome
+    def _run_login(self, uid: str, pw: str, on_done=None):
+        """
+        비밀번호 해시 검증이 Tk 이벤트 루프를 막지 않도록 작업 스레드에서 로그인하고,
+        결과 처리는 UI 큐를 통해 Tk 스레드에서 수행한다.
+        """
+        def finish(outcome):
+            self._handle_login_outcome(outcome)
+            if on_done:
+                on_done(outcome)
+
+        def fail(error):
+            finish(LoginOutcome(
+                success=False,
+                alert_level="error",
+                alert_title="Login Error",
+                alert_message=f"Login failed: {error}",
+            ))
+
+        self.app.ui_queue.run_in_background(
+            lambda: self.presenter.attempt_login(uid, pw),
+            finish,
+            on_error=fail,
+            name="control-panel-login",
+        )
 
     def _handle_login_outcome(self, outcome):
         self._update_status(outcome.status_text, outcome.status_color)
@@ -1050,17 +1078,31 @@ class MonitoringView(ttk.Frame):
         self.confirm_password_entry = ttk.Entry(panel, width=30, show="•")
         self.confirm_password_entry.pack(pady=(0, 20))
 
-        ttk.Button(panel, text="Change Password", style="Primary.TButton",
-                   command=self.change_password).pack()
+        self.change_password_btn = ttk.Button(panel, text="Change Password", style="Primary.TButton",
+                                              command=self.change_password)
+        self.change_password_btn.pack()
 
     def change_password(self):
-        """비밀번호 변경"""
-        outcome = self.change_password_presenter.change_password(
-            self.old_password_entry.get(),
-            self.new_password_entry.get(),
-            self.confirm_password_entry.get(),
+        """비밀번호 변경 (해시 계산은 작업 스레드에서, 결과 표시는 Tk 스레드에서)"""
+        current = self.old_password_entry.get()
+        new = self.new_password_entry.get()
+        confirm = self.confirm_password_entry.get()
+        self.change_password_btn.config(state="disabled")
+
+        def fail(error):
+            self._on_password_changed(ChangePasswordOutcome(
+                success=False, message=f"Failed to change password: {error}", alert_level="error",
+            ))
+
+        self.app.ui_queue.run_in_background(
+            lambda: self.change_password_presenter.change_password(current, new, confirm),
+            self._on_password_changed,
+            on_error=fail,
+            name="control-panel-change-password",
         )
 
+    def _on_password_changed(self, outcome):
+        self.change_password_btn.config(state="normal")
         if outcome.alert_level == "info":
             messagebox.showinfo("Success", outcome.message)
         else:
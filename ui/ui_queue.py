@@ -0,0 +1,83 @@
+"""
+UiCallQueue - 작업 스레드에서 Tk 스레드로 콜백 전달
+Tk는 자신을 만든 스레드에서만 호출해야 하므로 다른 스레드는 콜백을 큐에 넣기만 하고,
+Tk 스레드가 주기적인 after()로 큐를 비우며 실행한다.
+"""
+import queue
+import threading
+from typing import Callable, Optional
+
+DEFAULT_DRAIN_INTERVAL_MS = 50
+
+
+class UiCallQueue:
+    """아무 스레드에서나 post()하고 Tk 스레드에서 실행되는 콜백 큐"""
+
+    def __init__(self, root, interval_ms: int = DEFAULT_DRAIN_INTERVAL_MS):
+        self.root = root
+        self.interval_ms = interval_ms
+        self._calls: "queue.Queue[tuple]" = queue.Queue()
+        self._running = False
+
+    def post(self, callback: Callable, *args) -> None:
+        """콜백 예약 (스레드 안전, Tk를 호출하지 않음)"""
+        self._calls.put((callback, args))
+
+    def start(self) -> None:
+        """주기적인 drain 시작 - Tk 스레드에서 호출해야 한다."""
+        if self._running:
+            return
+        self._running = True
+        self.root.after(self.interval_ms, self._tick)
+
+    def stop(self) -> None:
+        self._running = False
+
+    def drain(self) -> int:
+        """
+        대기 중인 콜백을 모두 실행 (Tk 스레드에서 호출)
+        :return: 실행한 콜백 수
+        """
+        executed = 0
+        while True:
+            try:
+                callback, args = self._calls.get_nowait()
+            except queue.Empty:
+                return executed
+            executed += 1
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"[UiCallQueue] Callback error: {e}")
+
+    def run_in_background(
+        self,
+        work: Callable,
+        on_done: Callable,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        name: str = "ui-worker",
+    ) -> threading.Thread:
+        """
+        work()를 작업 스레드에서 실행하고 결과를 Tk 스레드에서 on_done(result)로 전달
+        :param on_error: work()가 예외를 던지면 Tk 스레드에서 on_error(exc) 호출 (없으면 출력만)
+        :return: 시작된 스레드
+        """
+        def run():
+            try:
+                result = work()
+            except Exception as e:
+                print(f"[UiCallQueue] Background task '{name}' failed: {e}")
+                if on_error:
+                    self.post(on_error, e)
+                return
+            self.post(on_done, result)
+
+        thread = threading.Thread(target=run, name=name, daemon=True)
+        thread.start()
+        return thread
+
+    def _tick(self) -> None:
+        if not self._running:
+            return
+        self.drain()
+        self.root.after(self.interval_ms, self._tick)
@@ -29,3 +29,8 @@ if (PROJECT_ROOT / "virtual_device_v4").exists():
 else:
     VIRTUAL_DEVICE_DIR = "virtual_device_v3"
 VIRTUAL_DEVICE_PATH = PROJECT_ROOT / VIRTUAL_DEVICE_DIR
+
+# Surveillance storage
+RECORDINGS_DIR = PROJECT_ROOT / "recordings"
+EVENT_CLIP_DIR = RECORDINGS_DIR / "events"
+RECORDING_SEGMENT_DIR = RECORDINGS_DIR / "segments"
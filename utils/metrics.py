@@ -0,0 +1,281 @@
+"""
+Metrics - 요청/쿼리/보안 이벤트 처리 시간 계측
+외부 라이브러리 없이 카운터와 히스토그램을 프로세스 메모리에 누적하고,
+/metrics 엔드포인트에서 Prometheus 텍스트 형식(0.0.4)으로 내보낸다.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds. Covers sub-millisecond SQLite calls up to slow image handlers.
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def get(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram. ``observe`` does one bisect and three additions
+    under a lock; buckets are only made cumulative when rendered.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        if list(buckets) != sorted(buckets) or not buckets:
+            raise ValueError("buckets must be a non-empty increasing sequence")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._series[labelvalues] = series
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, *labelvalues: str) -> "_Timer":
+        """Context manager that observes the elapsed wall time."""
+        return _Timer(self, labelvalues)
+
+    def get_count(self, *labelvalues: str) -> int:
+        series = self._series.get(labelvalues)
+        return series[2] if series else 0
+
+    def get_sum(self, *labelvalues: str) -> float:
+        series = self._series.get(labelvalues)
+        return series[1] if series else 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, (list(s[0]), s[1], s[2])) for labels, s in self._series.items())
+        lines = []
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_labels", "_started")
+
+    def __init__(self, histogram: Histogram, labels: Tuple[str, ...]) -> None:
+        self._histogram = histogram
+        self._labels = labels
+        self._started = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._histogram.observe(time.perf_counter() - self._started, *self._labels)
+
+
+class MetricsRegistry:
+    """Holds metrics in registration order and renders the exposition text."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str):
+        return self._metrics.get(name)
+
+    def reset(self) -> None:
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+# ----------------------------------------------------------------------
+# Process-wide metrics
+# ----------------------------------------------------------------------
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "safehome_http_request_duration_seconds",
+    "Flask handler latency by route.",
+    ("method", "endpoint"),
+)
+HTTP_RESPONSES_TOTAL = REGISTRY.counter(
+    "safehome_http_responses_total",
+    "HTTP responses by route and status code.",
+    ("method", "endpoint", "status"),
+)
+STORAGE_QUERY_SECONDS = REGISTRY.histogram(
+    "safehome_storage_query_duration_seconds",
+    "StorageManager SQLite call latency by operation.",
+    ("operation",),
+)
+STORAGE_ERRORS_TOTAL = REGISTRY.counter(
+    "safehome_storage_errors_total",
+    "StorageManager SQLite calls that raised sqlite3.Error.",
+    ("operation",),
+)
+SECURITY_EVENT_SECONDS = REGISTRY.histogram(
+    "safehome_security_event_duration_seconds",
+    "SecuritySystem event-processing latency by event type.",
+    ("event",),
+)
+LOGIN_THROTTLED_TOTAL = REGISTRY.counter(
+    "safehome_login_throttled_total",
+    "Web login attempts rejected by the rate limiter, by limit scope.",
+    ("scope",),
+)
+SESSION_LOOKUPS_TOTAL = REGISTRY.counter(
+    "safehome_session_lookups_total",
+    "Web session lookups by result (cache hit, database hit, miss).",
+    ("result",),
+)
+
+
+def record_security_event(event: str, seconds: float) -> None:
+    """Latency recorder injected into SecuritySystem."""
+    SECURITY_EVENT_SECONDS.observe(seconds, event)
+
+
+def install_flask_metrics(app, path: str = "/metrics", authorize=None) -> None:
+    """
+    Time every request and expose ``REGISTRY`` at ``path``.
+
+    Register this before other ``after_request`` hooks: Flask runs them in
+    reverse order, so the measurement then includes their work as well.
+    ``authorize`` is called for each scrape; if it returns a response, that
+    response is sent instead of the metrics (e.g. a 401).
+    """
+    from flask import Response, g, request
+
+    @app.before_request
+    def _metrics_start_timer():
+        g._metrics_started = time.perf_counter()
+
+    @app.after_request
+    def _metrics_record(response):
+        started = g.pop("_metrics_started", None)
+        if started is not None:
+            endpoint = request.endpoint or "unmatched"
+            method = request.method
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, method, endpoint)
+            HTTP_RESPONSES_TOTAL.inc(method, endpoint, str(response.status_code))
+        return response
+
+    def metrics_endpoint():
+        if authorize is not None:
+            denied = authorize()
+            if denied is not None:
+                return denied
+        return Response(REGISTRY.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+    app.add_url_rule(path, "metrics", metrics_endpoint, methods=["GET"])
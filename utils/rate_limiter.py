@@ -0,0 +1,106 @@
+"""
+RateLimiter - 키별 토큰 버킷 속도 제한
+키(IP, 사용자 이름 등)마다 토큰 버킷을 메모리에 두고, 락을 여러 샤드로 나눠
+동시 요청이 하나의 락에서 경합하지 않게 한다. 오래 쓰이지 않은 키는 제거한다.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_SHARDS = 16
+DEFAULT_IDLE_SECONDS = 600.0
+DEFAULT_MAX_KEYS = 100_000
+
+
+class _Shard:
+    __slots__ = ("lock", "buckets", "last_sweep")
+
+    def __init__(self, now: float) -> None:
+        self.lock = threading.Lock()
+        # key -> [tokens, last refill time]
+        self.buckets: Dict[str, List[float]] = {}
+        self.last_sweep = now
+
+
+class TokenBucketLimiter:
+    """
+    ``capacity`` tokens per key, refilled continuously at ``refill_per_second``.
+
+    ``acquire`` takes one token and returns 0.0, or returns the seconds until
+    a token will be available without taking one. Keys idle for longer than
+    ``idle_seconds`` are dropped; by then their bucket would be full again, so
+    dropping them does not change any decision. ``max_keys`` bounds memory
+    when a flood uses many distinct keys.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        *,
+        shards: int = DEFAULT_SHARDS,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if capacity < 1 or refill_per_second <= 0:
+            raise ValueError("capacity must be >= 1 and refill_per_second positive")
+        if shards <= 0 or max_keys <= 0:
+            raise ValueError("shards and max_keys must be positive")
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.idle_seconds = max(float(idle_seconds), self.capacity / self.refill_per_second)
+        self._clock = clock
+        self._max_keys_per_shard = max(1, max_keys // shards)
+        now = clock()
+        self._shards = [_Shard(now) for _ in range(shards)]
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def acquire(self, key: str) -> float:
+        now = self._clock()
+        shard = self._shard(key)
+        with shard.lock:
+            if now - shard.last_sweep >= self.idle_seconds:
+                self._sweep(shard, now)
+
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                if len(shard.buckets) >= self._max_keys_per_shard:
+                    # Oldest inserted key goes first; it has had the longest to refill.
+                    shard.buckets.pop(next(iter(shard.buckets)))
+                bucket = [self.capacity, now]
+                shard.buckets[key] = bucket
+            else:
+                elapsed = now - bucket[1]
+                bucket[0] = min(self.capacity, bucket[0] + elapsed * self.refill_per_second)
+                bucket[1] = now
+
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return 0.0
+            return (1.0 - bucket[0]) / self.refill_per_second
+
+    def _sweep(self, shard: _Shard, now: float) -> None:
+        cutoff = now - self.idle_seconds
+        idle = [key for key, bucket in shard.buckets.items() if bucket[1] <= cutoff]
+        for key in idle:
+            del shard.buckets[key]
+        shard.last_sweep = now
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Forget one key, or every key when ``key`` is None."""
+        if key is not None:
+            shard = self._shard(key)
+            with shard.lock:
+                shard.buckets.pop(key, None)
+            return
+        for shard in self._shards:
+            with shard.lock:
+                shard.buckets.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard.buckets) for shard in self._shards)
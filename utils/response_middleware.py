@@ -0,0 +1,146 @@
+"""
+ResponseMiddleware - Flask 응답 압축 및 조건부 GET 처리
+JSON/HTML 응답에 본문 기반 ETag를 붙이고 If-None-Match가 일치하면 304를 돌려주며,
+일정 크기 이상의 압축 가능한 응답은 Accept-Encoding에 따라 brotli 또는 gzip으로 압축한다.
+brotli 모듈이 없으면 gzip만 사용한다.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+from typing import Optional
+
+from flask import Flask, Response, request
+
+try:  # brotli is optional; gzip from the standard library is the fallback.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+
+DEFAULT_MIN_COMPRESS_SIZE = 1024
+DEFAULT_GZIP_LEVEL = 6
+# Brotli's higher qualities are far too slow for per-request compression.
+DEFAULT_BROTLI_QUALITY = 5
+
+COMPRESSIBLE_MIMETYPES = frozenset({
+    "application/json",
+    "application/javascript",
+    "image/svg+xml",
+})
+
+# Headers a 304 must repeat so caches keep the stored representation valid.
+_NOT_MODIFIED_HEADERS = ("ETag", "Cache-Control", "Vary", "Expires", "Content-Location")
+
+
+def _is_compressible(mimetype: Optional[str]) -> bool:
+    if not mimetype:
+        return False
+    return mimetype.startswith("text/") or mimetype in COMPRESSIBLE_MIMETYPES
+
+
+def body_etag(body: bytes) -> str:
+    """Strong validator derived from the identity-encoded body."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class ResponseMiddleware:
+    """
+    ``after_request`` hook adding ETag/If-None-Match handling and negotiated
+    compression to buffered responses.
+
+    Streaming responses (SSE, ``send_file``/static passthrough) are left
+    untouched. Routes that set their own ETag keep it; the conditional check
+    always runs before compression, so a matching revalidation never pays
+    for encoding the body.
+    """
+
+    def __init__(
+        self,
+        app: Optional[Flask] = None,
+        *,
+        min_size: int = DEFAULT_MIN_COMPRESS_SIZE,
+        gzip_level: int = DEFAULT_GZIP_LEVEL,
+        brotli_quality: int = DEFAULT_BROTLI_QUALITY,
+    ) -> None:
+        if min_size < 0:
+            raise ValueError("min_size must not be negative")
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        app.after_request(self.process_response)
+        app.extensions["response_middleware"] = self
+
+    # ------------------------------------------------------------------
+
+    def process_response(self, response: Response) -> Response:
+        if response.direct_passthrough or response.is_streamed:
+            return response
+
+        if request.method in ("GET", "HEAD") and response.status_code == 200:
+            not_modified = self._conditional(response)
+            if not_modified is not None:
+                return not_modified
+
+        self._compress(response)
+        return response
+
+    def _conditional(self, response: Response) -> Optional[Response]:
+        etag, _ = response.get_etag()
+        if etag is None:
+            etag = body_etag(response.get_data())
+            response.set_etag(etag)
+        if "Cache-Control" not in response.headers:
+            # API payloads are per-user; let browsers keep them but revalidate.
+            response.headers["Cache-Control"] = "private, no-cache"
+        if _is_compressible(response.mimetype):
+            response.vary.add("Accept-Encoding")
+
+        # If-None-Match uses the weak comparison (RFC 9110 13.1.2).
+        if not request.if_none_match.contains_weak(etag):
+            return None
+        not_modified = Response(status=304)
+        for header in _NOT_MODIFIED_HEADERS:
+            if header in response.headers:
+                not_modified.headers[header] = response.headers[header]
+        return not_modified
+
+    def _choose_encoding(self) -> Optional[str]:
+        accepted = request.accept_encodings
+        if brotli is not None and accepted["br"] > 0:
+            return "br"
+        if accepted["gzip"] > 0:
+            return "gzip"
+        return None
+
+    def _compress(self, response: Response) -> None:
+        if not 200 <= response.status_code < 300 or response.status_code == 204:
+            return
+        if "Content-Encoding" in response.headers or not _is_compressible(response.mimetype):
+            return
+        body = response.get_data()
+        if len(body) < self.min_size:
+            return
+
+        response.vary.add("Accept-Encoding")
+        encoding = self._choose_encoding()
+        if encoding is None:
+            return
+
+        if encoding == "br":
+            compressed = brotli.compress(body, quality=self.brotli_quality)
+        else:
+            compressed = gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+        if len(compressed) >= len(body):
+            return
+
+        response.set_data(compressed)
+        response.headers["Content-Encoding"] = encoding
+        etag, weak = response.get_etag()
+        if etag is not None and not weak:
+            # Same content, different bytes: only weakly equivalent.
+            response.set_etag(etag, weak=True)
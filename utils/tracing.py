@@ -0,0 +1,163 @@
+"""
+Tracing - 센서 이벤트 처리 경로의 경량 스팬 추적
+센서 입력에서 시작된 trace id를 contextvars로 하위 호출(보안 판정, 사이렌, 카메라 캡처,
+로그 저장)까지 전달하고, 완료된 스팬을 메모리 링 버퍼에 보관하여
+한 이벤트의 처리 경로(critical path)를 재구성할 수 있게 한다.
+"""
+from __future__ import annotations
+
+import contextvars
+import itertools
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional
+
+DEFAULT_SPAN_BUFFER_SIZE = 4096
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "safehome_current_span", default=None
+)
+
+
+class Span:
+    """One timed step. ``duration_ms`` is None until the span finishes."""
+
+    __slots__ = (
+        "trace_id", "span_id", "parent_id", "name", "attributes",
+        "start_time", "duration_ms", "error", "thread", "_started",
+    )
+
+    def __init__(self, trace_id: str, span_id: int, parent_id: Optional[int], name: str,
+                 attributes: Dict[str, Any]) -> None:
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.start_time = time.time()
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self.thread = threading.current_thread().name
+        self._started = time.perf_counter()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict:
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start_time': self.start_time,
+            'duration_ms': self.duration_ms,
+            'attributes': dict(self.attributes),
+            'error': self.error,
+            'thread': self.thread,
+        }
+
+
+class _SpanScope:
+    __slots__ = ("_tracer", "_name", "_attributes", "_span", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+        self._span: Optional[Span] = None
+        self._token = None
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent else secrets.token_hex(8)
+        self._span = Span(
+            trace_id,
+            self._tracer._next_span_id(),
+            parent.span_id if parent else None,
+            self._name,
+            self._attributes,
+        )
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        span = self._span
+        span.duration_ms = (time.perf_counter() - span._started) * 1000.0
+        if exc_type is not None:
+            span.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self._tracer._record(span)
+
+
+class Tracer:
+    """
+    Records finished spans in a bounded ring buffer.
+
+    ``span()`` starts a new trace when no span is active in the current
+    context, otherwise it becomes a child of the active span. The context
+    does not follow work handed to other threads (e.g. the clip writer);
+    those steps appear as their own traces.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_SPAN_BUFFER_SIZE) -> None:
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be positive")
+        self._spans: Deque[Span] = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def span(self, name: str, **attributes: Any) -> _SpanScope:
+        return _SpanScope(self, name, attributes)
+
+    def _next_span_id(self) -> int:
+        return next(self._ids)
+
+    def _record(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def get_trace(self, trace_id: str) -> List[dict]:
+        """Spans of one trace still in the buffer, in start order."""
+        with self._lock:
+            spans = [span for span in self._spans if span.trace_id == trace_id]
+        return [span.to_dict() for span in sorted(spans, key=lambda s: (s.start_time, s.span_id))]
+
+    def recent_traces(self, limit: int = 20) -> List[dict]:
+        """Newest traces first; each entry holds its spans and root duration."""
+        with self._lock:
+            spans = list(self._spans)
+
+        grouped: "OrderedDict[str, List[Span]]" = OrderedDict()
+        for span in reversed(spans):
+            if span.trace_id not in grouped:
+                if len(grouped) >= limit:
+                    continue
+                grouped[span.trace_id] = []
+            grouped[span.trace_id].append(span)
+
+        traces = []
+        for trace_id, trace_spans in grouped.items():
+            trace_spans.sort(key=lambda s: (s.start_time, s.span_id))
+            root = next((s for s in trace_spans if s.parent_id is None), trace_spans[0])
+            traces.append({
+                'trace_id': trace_id,
+                'root': root.name,
+                'start_time': root.start_time,
+                'duration_ms': root.duration_ms,
+                'spans': [span.to_dict() for span in trace_spans],
+            })
+        return traces
+
+
+def current_trace_id() -> Optional[str]:
+    span = _current_span.get()
+    return span.trace_id if span else None
+
+
+TRACER = Tracer()
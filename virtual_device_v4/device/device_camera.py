@@ -1,11 +1,121 @@
+import math
 import threading
 import time
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
-import tkinter as tk
 from .interface_camera import InterfaceCamera
 
 
+# Largest pre-scaled level kept per asset (pixels). Zoom factors that would
+# need a bigger level fall back to the largest one plus a residual resize.
+MAX_LEVEL_PIXELS = 4_000_000
+
+
+class SourcePyramid:
+    """Decoded source image plus lazily built power-of-two scaled levels.
+
+    Level ``k`` is the source scaled by ``2 ** k`` (LANCZOS, built once).
+    Rendering a pan/zoom box picks the largest level that is not larger
+    than the requested scale, crops there and finishes with a BILINEAR
+    upscale of under 2x, instead of LANCZOS-scaling from the source on
+    every frame. All images are read-only and shared between cameras.
+    """
+
+    def __init__(self, base):
+        base.readonly = 1
+        self.base = base
+        self._levels = {0: base}
+        self._lock = threading.Lock()
+        self._max_level = 0
+        while base.width * base.height * 4 ** (self._max_level + 1) <= MAX_LEVEL_PIXELS:
+            self._max_level += 1
+        self._min_level = -max(0, min(base.width, base.height).bit_length() - 4)
+
+    def level(self, k):
+        """Return the source scaled by ``2 ** k`` (clamped to the allowed range)."""
+        k = max(self._min_level, min(self._max_level, k))
+        image = self._levels.get(k)
+        if image is None:
+            with self._lock:
+                image = self._levels.get(k)
+                if image is None:
+                    factor = 2.0 ** k
+                    size = (max(1, round(self.base.width * factor)),
+                            max(1, round(self.base.height * factor)))
+                    image = self.base.resize(size, Image.LANCZOS)
+                    image.readonly = 1
+                    self._levels[k] = image
+        return k, image
+
+    def render(self, box, size):
+        """Render source-space ``box`` (may extend past the edges) at ``size`` x ``size``."""
+        left, top, right, bottom = box
+        width = max(right - left, 1)
+        k, image = self.level(math.floor(math.log2(size / width)))
+        factor = 2.0 ** k
+        cropped = image.crop(tuple(round(v * factor) for v in box))
+        if cropped.size == (size, size):
+            return cropped
+        return cropped.resize((size, size), Image.BILINEAR)
+
+
+# Process-wide cache of source pyramids keyed by asset path (placeholders
+# are keyed by their would-be path as well). Cameras showing the same asset
+# share one decoded image and its levels.
+_SOURCE_CACHE = {}
+_SOURCE_CACHE_LOCK = threading.Lock()
+
+
+def load_source_pyramid(file_path, placeholder_label, size):
+    """Return the shared SourcePyramid for ``file_path`` (or a placeholder)."""
+    key = str(file_path)
+    with _SOURCE_CACHE_LOCK:
+        pyramid = _SOURCE_CACHE.get(key)
+        if pyramid is not None:
+            return pyramid
+
+        image = None
+        if file_path.exists():
+            try:
+                with Image.open(file_path) as raw:
+                    image = raw.convert("RGB")
+            except Exception as exc:
+                print(f"[DeviceCamera] Failed to open {file_path.name}: {exc}")
+
+        if image is None:
+            # Coverage tests ask for camera IDs without still images.
+            # Produce a placeholder so downstream logic can continue.
+            image = Image.new("RGB", (size, size), "black")
+            draw = ImageDraw.Draw(image)
+            draw.text((10, size // 2 - 10), placeholder_label, fill="white")
+            print(f"[DeviceCamera] Missing {file_path.name}, using placeholder image.")
+
+        pyramid = SourcePyramid(image)
+        _SOURCE_CACHE[key] = pyramid
+        return pyramid
+
+
+def preload_camera_assets():
+    """Decode every ``camera*.jpg`` asset into the shared cache.
+
+    Cameras created afterwards find their source image already decoded.
+    Returns the number of assets loaded.
+    """
+    assets_root = Path(__file__).resolve().parent.parent
+    loaded = 0
+    for file_path in sorted(assets_root.glob("camera*.jpg")):
+        label = f"CAM {file_path.stem[len('camera'):]}"
+        load_source_pyramid(file_path, label, DeviceCamera.SOURCE_SIZE)
+        loaded += 1
+    return loaded
+
+
+def clear_source_cache():
+    """Drop all cached source images (e.g. after assets change on disk)."""
+    with _SOURCE_CACHE_LOCK:
+        _SOURCE_CACHE.clear()
+
+
 class DeviceCamera(threading.Thread, InterfaceCamera):
     
     RETURN_SIZE = 500
@@ -21,6 +131,7 @@ class DeviceCamera(threading.Thread, InterfaceCamera):
         self.pan = 0
         self.zoom = 2
         self.imgSource = None
+        self._pyramid = None
         self.centerWidth = 0
         self.centerHeight = 0
         self._running = True
@@ -35,22 +146,8 @@ class DeviceCamera(threading.Thread, InterfaceCamera):
         with self._lock:
             self.cameraId = id_
             file_path = self.assets_root / f"camera{id_}.jpg"
-            self.imgSource = None
-
-            if file_path.exists():
-                try:
-                    self.imgSource = Image.open(file_path)
-                except Exception as exc:
-                    print(f"[DeviceCamera] Failed to open {file_path.name}: {exc}")
-
-            if self.imgSource is None:
-                # Coverage tests ask for camera IDs without still images.
-                # Produce a placeholder so downstream logic can continue.
-                self.imgSource = Image.new("RGB", (self.SOURCE_SIZE, self.SOURCE_SIZE), "black")
-                draw = ImageDraw.Draw(self.imgSource)
-                draw.text((10, self.SOURCE_SIZE // 2 - 10), f"CAM {id_}", fill="white")
-                print(f"[DeviceCamera] Missing {file_path.name}, using placeholder image.")
-
+            self._pyramid = load_source_pyramid(file_path, f"CAM {id_}", self.SOURCE_SIZE)
+            self.imgSource = self._pyramid.base
             self.centerWidth = self.imgSource.width // 2
             self.centerHeight = self.imgSource.height // 2
     
@@ -58,8 +155,13 @@ class DeviceCamera(threading.Thread, InterfaceCamera):
         """Get the camera ID."""
         return self.cameraId
     
-    def get_view(self):
-        """Get the current camera view as a PIL Image (synchronized)."""
+    def get_view(self, size=None):
+        """Get the current camera view as a PIL Image (synchronized).
+
+        ``size`` is the square output edge in pixels (default RETURN_SIZE);
+        smaller sizes such as thumbnails are rendered directly.
+        """
+        size = size or self.RETURN_SIZE
         with self._lock:
 
             view = "Time = "
@@ -74,10 +176,8 @@ class DeviceCamera(threading.Thread, InterfaceCamera):
             else:
                 view += f"left {-self.pan}"
             
-            # Create the view image (500x500)
-            imgView = Image.new('RGB', (self.RETURN_SIZE, self.RETURN_SIZE), 'black')
-            
-            if self.imgSource is not None:
+            imgView = None
+            if self._pyramid is not None:
  
                 zoomed = self.SOURCE_SIZE * (10 - self.zoom) // 10
                 panned = self.pan * self.SOURCE_SIZE // 5
@@ -87,14 +187,15 @@ class DeviceCamera(threading.Thread, InterfaceCamera):
                 right = self.centerWidth + panned + zoomed
                 bottom = self.centerHeight + zoomed
                 
-                # Crop and resize to fill the view
+                # Crop from the closest pre-scaled level to fill the view
                 try:
-                    cropped = self.imgSource.crop((left, top, right, bottom))
-                    resized = cropped.resize((self.RETURN_SIZE, self.RETURN_SIZE), Image.LANCZOS)
-                    imgView.paste(resized, (0, 0))
+                    imgView = self._pyramid.render((left, top, right, bottom), size)
                 except Exception:
-                    # If crop fails, keep black background
-                    pass
+                    # If crop fails, fall back to a black background
+                    imgView = None
+
+            if imgView is None:
+                imgView = Image.new('RGB', (size, size), 'black')
             
             draw = ImageDraw.Draw(imgView)
             